@@ -2,6 +2,7 @@
 
 import argparse
 
+from src.AsyncBeautifulSoupEngine import AsyncBeautifulSoupEngine
 from src.BeautifulSoupEngine import BeautifulSoupEngine
 from src.ElasticSearchEngine import ElasticSearchEngine
 from src.JobScraper import JobScraper
@@ -41,23 +42,40 @@ class ArgumentParser:
             help="Use the development logger (console only).",
         )
 
+
+        parser.add_argument(
+            "-r", "--resume",
+            action = "store_true",
+            help="Resume the previous run if it was interrupted (requires the engine 'checkpoint').",
+        )
+
         args = parser.parse_args()
         return args
 
 
-def get_config(config: dict) -> tuple[dict, dict, dict]:
+def get_config(config: dict) -> tuple[dict, dict, dict, dict]:
     """
     Get the configuration from the config file.
     """
     es_config = config['ElasticsearchEngine']
     bs_config = config['BeautifulSoupEngine']
     logger_config = config['Logger']
-    return es_config, bs_config, logger_config
+    scraper_config = config.get('JobScraper', {})
+    return es_config, bs_config, logger_config, scraper_config
+
+
+def get_scrap_engine(bs_config: dict, preferences: dict) -> BeautifulSoupEngine:
+    """
+    Instantiate the scraping engine selected by the 'execution_mode' config value.
+    """
+    if bs_config.get('execution_mode', 'serial') == 'async':
+        return AsyncBeautifulSoupEngine(bs_config, preferences)
+    return BeautifulSoupEngine(bs_config, preferences)
 
 
 def main(args, config: dict) -> None:
     # Get config dicts
-    es_config, bs_config, logger_config = get_config(config)
+    es_config, bs_config, logger_config, scraper_config = get_config(config)
     # Main Logger
     if args.dev:
         logger = LoggerManager.configure_logger(name = 'dev', logger_config = logger_config)
@@ -102,11 +120,13 @@ def main(args, config: dict) -> None:
             elastic_engine.create_index(index = "jobs", settings = index_settings)
 
             # Execute scraper
+            preferences = load_configuration('config/preferences.yaml', type='yaml')
             scraper = JobScraper(backend = elastic_engine,
-                                 scrap_engine = BeautifulSoupEngine(bs_config, logger),
-                                 logger = logger)
+                                 scrap_engine = get_scrap_engine(bs_config, preferences),
+                                 logger = logger,
+                                 config = scraper_config)
             
-            scraper.execute_scraper(load_configuration('config/preferences.yaml', type='yaml'))
+            scraper.execute_scraper(preferences, resume = args.resume)
 
     except Exception as e:
         print(f"Error connecting to Elasticsearch: {e}")
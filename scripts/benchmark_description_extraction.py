@@ -0,0 +1,88 @@
+# scripts/benchmark_description_extraction.py
+
+"""
+Compare the CPU cost per job page of the description extraction paths.
+
+Pages are read from a directory of recorded pages (e.g. the --recordings directory of
+scripts/linkedin_stub_server.py run with --upstream), or generated by the stand-in server.
+
+Usage:
+uv run ./scripts/benchmark_description_extraction.py --recordings ./data/recordings
+uv run ./scripts/benchmark_description_extraction.py --pages 200 --padding-kb 150
+"""
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.linkedin_stub_server import LinkedInStubServer
+from src.BeautifulSoupEngine import BeautifulSoupEngine
+from src.utils.DescriptionExtractor import DescriptionExtractor
+
+
+def load_pages(recordings: str = None, pages: int = 100, padding_kb: int = 150) -> list:
+    """Return the job pages to benchmark."""
+    if recordings:
+        return [html for html in (path.read_text(encoding = 'utf-8') for path in sorted(Path(recordings).glob('*.html')))
+                if 'description__text--rich' in html]
+
+    server = LinkedInStubServer(padding_kb = padding_kb)
+    try:
+        return [server.render_job_page(4000000000 + i) for i in range(pages)]
+    finally:
+        server.server_close()
+
+
+def cpu_time_per_page(extract, pages: list, repeat: int) -> float:
+    """Return the best CPU time (seconds) per page over 'repeat' runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        for html in pages:
+            extract(html)
+        best = min(best, time.process_time() - start)
+    return best / len(pages)
+
+
+def benchmark(pages: list, repeat: int) -> None:
+    engines = {
+        'bs4 html.parser': BeautifulSoupEngine({'parser': 'html.parser', 'partial_parsing': False}, {}),
+        'bs4 lxml': BeautifulSoupEngine({'parser': 'lxml', 'partial_parsing': False}, {}),
+        'bs4 lxml partial': BeautifulSoupEngine({'parser': 'lxml', 'partial_parsing': True}, {}),
+    }
+    paths = {name: (lambda html, engine = engine: engine.cook_soup(engine.make_soup(html, 'job_descriptions'), 'job_descriptions'))
+             for name, engine in engines.items()}
+    paths['fast path'] = DescriptionExtractor.extract
+
+    reference = [paths['bs4 html.parser'](html) for html in pages]
+    fast = [DescriptionExtractor.extract(html) for html in pages]
+    handled = sum(text is not None for text in fast)
+    mismatches = sum(text is not None and text != expected for text, expected in zip(fast, reference))
+
+    size_kb = sum(len(html) for html in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {size_kb:.0f} KiB on average")
+    print(f"Fast path handled {handled}/{len(pages)} pages ({len(pages) - handled} fall back to BeautifulSoup), {mismatches} mismatches")
+
+    baseline = None
+    for name, extract in paths.items():
+        per_page = cpu_time_per_page(extract, pages, repeat)
+        baseline = baseline or per_page
+        print(f"{name:<18} {per_page * 1000:8.3f} ms/page  x{baseline / per_page:6.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = "Benchmark the job description extraction paths")
+    parser.add_argument('--recordings', help = "directory of recorded job pages (*.html)")
+    parser.add_argument('--pages', type = int, default = 100, help = "number of synthetic pages")
+    parser.add_argument('--padding-kb', type = int, default = 150, help = "size of the synthetic pages markup")
+    parser.add_argument('--repeat', type = int, default = 3, help = "runs per path, the best one is kept")
+    args = parser.parse_args()
+
+    pages = load_pages(args.recordings, args.pages, args.padding_kb)
+    if not pages:
+        sys.exit("No job page to benchmark")
+    benchmark(pages, args.repeat)
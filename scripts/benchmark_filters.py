@@ -0,0 +1,158 @@
+# scripts/benchmark_filters.py
+
+"""
+Compare the row-by-row job filters with the vectorized JobScraper.apply_filters.
+
+With --keywords, every keyword list is padded with made-up keywords, to measure
+the cost of long preference lists.
+
+Both run on the same synthetic jobs (titles, companies, dates and descriptions drawn
+from small vocabularies, with missing values) and must flag the same rows.
+
+Usage:
+uv run ./scripts/benchmark_filters.py
+uv run ./scripts/benchmark_filters.py --rows 100000 --repeat 3
+uv run ./scripts/benchmark_filters.py --rows 20000 --keywords 2000
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import logging
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.JobScraper import JobScraper
+
+
+FILTERS = ["title", "company", "max_age", "description"]
+
+PREFERENCES = {
+    'title_include': ['python', 'data', 'backend', 'django', 'machine learning', 'devops'],
+    'title_exclude': ['senior', 'lead', 'manager', 'intern', 'principal'],
+    'company_exclude': ['Bad Company Inc', 'Spam Corp', 'Recruiting Agency'],
+    'max_age': 7,
+    'description_words_include': ['python', 'django', 'flask', 'fastapi', 'pandas', 'airflow']
+}
+
+TITLE_WORDS = ['Python', 'Data', 'Backend', 'Frontend', 'Senior', 'Lead', 'Java', 'Django', 'Machine Learning',
+               'DevOps', 'Engineer', 'Developer', 'Manager', 'Intern', 'Analyst', 'Scientist', '(m/w/d)', 'H/F']
+COMPANIES = ['ACME', 'Globex', 'Initech', 'Bad Company Inc', 'Umbrella', 'Spam Corp', 'Hooli', 'Recruiting Agency']
+DESCRIPTION_WORDS = ['We', 'build', 'data', 'pipelines', 'with', 'Python', 'Java', 'Go', 'Django', 'Spring', 'team',
+                     'remote', 'Airflow', 'Kubernetes', 'pandas', 'SQL', 'cloud', 'agile', 'Flask', 'React']
+
+
+def make_jobs(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Return synthetic screened jobs, with the columns and dtypes of the scraping pipeline."""
+    rng = random.Random(seed)
+    now = datetime.now()
+
+    def description():
+        roll = rng.random()
+        if roll < 0.03:
+            return None
+        if roll < 0.05:
+            return rng.choice(['', '   ', 'nan', 'None'])
+        return ' '.join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(20, 120)))
+
+    jobs = pd.DataFrame({
+        'title': [' '.join(rng.sample(TITLE_WORDS, rng.randint(1, 4))) for _ in range(rows)],
+        'company': [rng.choice(COMPANIES) for _ in range(rows)],
+        'date': [now - timedelta(days = rng.uniform(0, 14)) if rng.random() > 0.02 else None for _ in range(rows)],
+        'job_url': [f"https://www.linkedin.com/jobs/view/{4000000000 + i}/" for i in range(rows)],
+        'description': [description() for _ in range(rows)],
+    })
+    jobs['date'] = pd.to_datetime(jobs['date'])
+    jobs['filtered'] = 0
+    return jobs
+
+
+def with_keywords(preferences: dict, count: int, seed: int = 0) -> dict:
+    """Return the preferences with 'count' made-up keywords added to every keyword list."""
+    if not count:
+        return preferences
+    rng = random.Random(seed)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz'
+    made_up = lambda: [''.join(rng.choice(alphabet) for _ in range(rng.randint(6, 14))) for _ in range(count)]
+    preferences = dict(preferences)
+    for key in ['title_include', 'title_exclude', 'company_exclude', 'description_words_include']:
+        preferences[key] = preferences[key] + made_up()
+    return preferences
+
+
+def legacy_apply_filters(df: pd.DataFrame, preferences: dict, filters: list) -> pd.DataFrame:
+    """Row-by-row implementation of the title, company, max_age and description filters, for reference."""
+    if "title" in filters:
+        title_include = preferences.get('title_include', [])
+        title_exclude = preferences.get('title_exclude', [])
+        for idx, row in df.iterrows():
+            title = str(row['title']).lower()
+            title_has_include = any(word.lower() in title for word in title_include)
+            title_has_exclude = any(word.lower() in title for word in title_exclude)
+            if not title_has_include or title_has_exclude:
+                df.at[idx, 'filtered'] = 1
+
+    if "company" in filters:
+        company_exclude = preferences.get('company_exclude', [])
+        for idx, row in df.iterrows():
+            if str(row['company']) in company_exclude:
+                df.at[idx, 'filtered'] = 1
+
+    if "max_age" in filters:
+        cutoff_date = datetime.now() - timedelta(days = preferences.get('max_age', 7))
+        for idx, row in df.iterrows():
+            if pd.notna(row['date']) and row['date'] < cutoff_date:
+                df.at[idx, 'filtered'] = 1
+
+    if "description" in filters:
+        description_words_include = preferences.get('description_words_include', [])
+        for idx, row in df.iterrows():
+            description_value = row.get('description')
+            if description_value is not None:
+                description = str(description_value)
+                if description.strip() and description.lower() not in ['nan', 'none', '']:
+                    if not any(word.lower() in description.lower() for word in description_words_include):
+                        df.at[idx, 'filtered'] = 1
+    return df
+
+
+def best_time(function, jobs: pd.DataFrame, repeat: int) -> tuple:
+    """Return the best wall time over 'repeat' runs on fresh copies, and the last result."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        df = jobs.copy()
+        start = time.perf_counter()
+        result = function(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark(rows: int, repeat: int, keywords: int = 0) -> None:
+    jobs = make_jobs(rows)
+    preferences = with_keywords(PREFERENCES, keywords)
+    logger = logging.getLogger('benchmark_filters')
+    scraper = JobScraper(backend = None, scrap_engine = None, logger = logger)
+
+    legacy_time, expected = best_time(lambda df: legacy_apply_filters(df, preferences, FILTERS), jobs, repeat)
+    vectorized_time, result = best_time(lambda df: scraper.apply_filters(df, preferences, FILTERS), jobs, repeat)
+
+    mismatches = int((expected['filtered'] != result['filtered']).sum())
+    print(f"{rows} rows, {len(preferences['title_include'])} keywords per list, "
+          f"{int(result['filtered'].sum())} filtered, {mismatches} mismatches")
+    print(f"row by row  {legacy_time * 1000:10.1f} ms")
+    print(f"vectorized  {vectorized_time * 1000:10.1f} ms  x{legacy_time / vectorized_time:.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = "Benchmark the job filters")
+    parser.add_argument('--rows', type = int, default = 100000, help = "number of synthetic jobs")
+    parser.add_argument('--repeat', type = int, default = 3, help = "runs per implementation, the best one is kept")
+    parser.add_argument('--keywords', type = int, default = 0, help = "made-up keywords added to every keyword list")
+    args = parser.parse_args()
+
+    benchmark(args.rows, args.repeat, args.keywords)
@@ -0,0 +1,358 @@
+# scripts/linkedin_stub_server.py
+
+"""
+Local stand-in for the LinkedIn guest job API, for offline load and retry testing.
+
+Serves '/jobs-guest/jobs/api/seeMoreJobPostings/search' result pages and '/jobs/view/<id>/'
+description pages, either from recorded HTML files or as synthetic HTML shaped like the real
+pages, gzipped when the client accepts it. Latency, 5xx errors, 429 bursts and connection
+resets can be injected, with a seed for reproducible runs. Request outcomes are counted and
+exposed as JSON on '/__stats'.
+
+With --upstream, pages missing from --recordings are fetched from the real site and saved,
+so that later runs can replay them without network.
+
+Usage:
+python scripts/linkedin_stub_server.py --port 8765 --latency 0.2 --throttle-rate 0.02 --seed 1
+then set "base_url": "http://127.0.0.1:8765" in the BeautifulSoupEngine config.
+"""
+
+import argparse
+from collections import Counter
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import json
+import os
+from pathlib import Path
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import zlib
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ResponseCache import ResponseCache
+
+
+SEARCH_PATH = '/jobs-guest/jobs/api/seeMoreJobPostings/search'
+JOB_VIEW_PREFIX = '/jobs/view/'
+
+TITLES = ['Data Engineer', 'Data Scientist', 'Python Developer', 'Backend Engineer', 'Machine Learning Engineer',
+          'DevOps Engineer', 'Data Analyst', 'Software Engineer', 'Analytics Engineer', 'Platform Engineer']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises', 'Soylent']
+
+
+class LinkedInStubServer(ThreadingHTTPServer):
+    """Threaded HTTP server impersonating the LinkedIn guest job pages, with fault injection."""
+
+    daemon_threads = True
+
+    def __init__(self,
+                 address: Tuple[str, int] = ('127.0.0.1', 0),
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 throttle_rate: float = 0.0,
+                 throttle_burst: int = 5,
+                 retry_after: Optional[float] = 1,
+                 reset_rate: float = 0.0,
+                 results_per_query: int = 100,
+                 padding_kb: int = 0,
+                 recordings: Optional[str] = None,
+                 upstream: Optional[str] = None,
+                 compress: bool = True,
+                 seed: Optional[int] = None,
+                 verbose: bool = False):
+        """Bind the server.
+
+        Args:
+            address (Tuple[str, int]): Host and port to listen on. Port 0 picks a free port.
+            latency (float): Mean delay in seconds before each response.
+            latency_jitter (float): Delay is drawn uniformly in [latency - jitter, latency + jitter].
+            error_rate (float): Probability of answering 500.
+            throttle_rate (float): Probability of starting a burst of 429 responses.
+            throttle_burst (int): Number of consecutive requests answered 429 in a burst.
+            retry_after (float, optional): Retry-After header sent with 429 responses, None to omit it.
+            reset_rate (float): Probability of resetting the connection without answering.
+            results_per_query (int): Number of synthetic job cards of a search query, across all pages.
+            padding_kb (int): Kilobytes of filler markup added to synthetic pages, to mimic real page sizes.
+            recordings (str, optional): Directory of recorded pages, served instead of synthetic HTML.
+            upstream (str, optional): Base URL fetched (and recorded) when a page is not in recordings.
+            compress (bool): Gzip pages for clients sending 'Accept-Encoding: gzip', like the real site.
+            seed (int, optional): Seed of the fault injection, for reproducible runs.
+            verbose (bool): Log every request on stderr.
+        """
+        super().__init__(address, LinkedInStubHandler)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.throttle_burst = throttle_burst
+        self.retry_after = retry_after
+        self.reset_rate = reset_rate
+        self.results_per_query = results_per_query
+        self.padding = self.make_padding(padding_kb)
+        self.recordings = Path(recordings) if recordings else None
+        if self.recordings is not None:
+            self.recordings.mkdir(parents = True, exist_ok = True)
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.compress = compress
+        self.verbose = verbose
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.throttled_left = 0
+        self.stats = Counter()
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as the engine 'base_url'."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'LinkedInStubServer':
+        """Serve in a background thread."""
+        self.thread = threading.Thread(target = self.serve_forever, daemon = True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def make_padding(padding_kb: int) -> str:
+        """Build inert markup of about padding_kb kilobytes."""
+        if padding_kb <= 0:
+            return ''
+        line = '<div class="filler" data-tracking="stub"><span>lorem ipsum dolor sit amet</span></div>\n'
+        return line * (padding_kb * 1024 // len(line) + 1)
+
+    def draw_outcome(self) -> Tuple[str, float]:
+        """Draw the fault (if any) and the latency of the next response.
+
+        Returns:
+            Tuple[str, float]: ('ok', 'error', 'throttled' or 'reset', delay in seconds).
+        """
+        with self.lock:
+            delay = max(0.0, self.latency + self.random.uniform(-self.latency_jitter, self.latency_jitter))
+            if self.throttled_left > 0:
+                self.throttled_left -= 1
+                outcome = 'throttled'
+            elif self.random.random() < self.throttle_rate:
+                self.throttled_left = self.throttle_burst - 1
+                outcome = 'throttled'
+            elif self.random.random() < self.reset_rate:
+                outcome = 'reset'
+            elif self.random.random() < self.error_rate:
+                outcome = 'error'
+            else:
+                outcome = 'ok'
+            self.stats[outcome] += 1
+        return outcome, delay
+
+    def recording_path(self, path: str) -> Optional[Path]:
+        """Return the file holding the recording of a request path, or None without recordings."""
+        if self.recordings is None:
+            return None
+        key = ResponseCache.normalize_url('http://recording' + path)
+        return self.recordings / (hashlib.sha256(key.encode()).hexdigest() + '.html')
+
+    def render(self, path: str) -> Optional[str]:
+        """Return the page served for a request path: recorded, recorded from upstream, or synthetic.
+
+        Args:
+            path (str): Request path with query string.
+
+        Returns:
+            Optional[str]: HTML body, None if the page does not exist.
+        """
+        recording = self.recording_path(path)
+        if recording is not None and recording.exists():
+            with self.lock:
+                self.stats['replayed'] += 1
+            return recording.read_text(encoding = 'utf-8')
+
+        if recording is not None and self.upstream is not None:
+            response = requests.get(self.upstream + path, timeout = 30)
+            if response.status_code == 200:
+                recording.write_text(response.text, encoding = 'utf-8')
+                with self.lock:
+                    self.stats['recorded'] += 1
+                return response.text
+
+        parts = urlsplit(path)
+        if parts.path == SEARCH_PATH:
+            return self.render_search_page(parse_qs(parts.query))
+        if parts.path.startswith(JOB_VIEW_PREFIX):
+            job_posting_id = parts.path[len(JOB_VIEW_PREFIX):].strip('/')
+            if job_posting_id.isdigit():
+                return self.render_job_page(int(job_posting_id))
+        return None
+
+    def render_search_page(self, query: dict) -> str:
+        """Render a synthetic search result page (up to 25 cards, fewer on the last page)."""
+        keywords = query.get('keywords', [''])[0]
+        location = query.get('location', [''])[0]
+        start = int(query.get('start', ['0'])[0] or 0)
+        # Stable ids per query, so that rounds and pages overlap like on the real site
+        first_id = 4_000_000_000 + zlib.crc32(f"{keywords}|{location}".encode()) % 1_000_000 * 1_000
+
+        # Ids grow with publication time: 'sortBy=DD' lists the newest postings first
+        newest_first = query.get('sortBy', [''])[0] == 'DD'
+
+        cards = []
+        for rank in range(start, min(start + 25, self.results_per_query)):
+            job_posting_id = first_id + (self.results_per_query - 1 - rank if newest_first else rank)
+            title = f"{TITLES[job_posting_id % len(TITLES)]} ({keywords})" if keywords else TITLES[job_posting_id % len(TITLES)]
+            cards.append(
+                f'<li><div class="base-card base-search-card" data-entity-urn="urn:li:jobPosting:{job_posting_id}">'
+                f'<a class="base-card__full-link" href="{JOB_VIEW_PREFIX}{job_posting_id}/"><span class="sr-only">{title}</span></a>'
+                f'<div class="base-search-card__info">'
+                f'<h3 class="base-search-card__title">{title}</h3>'
+                f'<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="#">{COMPANIES[job_posting_id % len(COMPANIES)]}</a></h4>'
+                f'<div class="base-search-card__metadata">'
+                f'<span class="job-search-card__location">{location or "Remote"}</span>'
+                f'<time class="job-search-card__listdate" datetime="{time.strftime("%Y-%m-%d")}">1 day ago</time>'
+                f'</div></div></div></li>')
+        if not cards:
+            return ''
+        return ''.join(cards) + self.padding
+
+    def render_job_page(self, job_posting_id: int) -> str:
+        """Render a synthetic job description page."""
+        title = TITLES[job_posting_id % len(TITLES)]
+        company = COMPANIES[job_posting_id % len(COMPANIES)]
+        return (f'<!DOCTYPE html><html><head><title>{title} - {company}</title></head><body>{self.padding}'
+                f'<section class="description"><div class="description__text description__text--rich">'
+                f'<div class="show-more-less-html__markup">'
+                f'<p>{company} is hiring a {title} to join its data team.</p>'
+                f'<p><strong>Responsibilities</strong></p>'
+                f'<ul><li>Build and maintain data pipelines in Python</li><li>Work with SQL and Spark</li></ul>'
+                f'<p><strong>Requirements</strong></p>'
+                f'<ul><li>3+ years of experience</li><li>Fluent English</li></ul>'
+                f'</div><button class="show-more-less-html__button"><span>Show more</span></button>'
+                f'</div></section></body></html>')
+
+
+class LinkedInStubHandler(BaseHTTPRequestHandler):
+    """Request handler of LinkedInStubServer."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        """Serve one page, or the injected fault."""
+        if self.path == '/__stats':
+            self.send_body(200, json.dumps(self.server.stats), 'application/json')
+            return
+
+        outcome, delay = self.server.draw_outcome()
+        if delay:
+            time.sleep(delay)
+
+        if outcome == 'reset':
+            # Close with SO_LINGER 0 so that the client gets a TCP reset, not a clean EOF
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            self.close_connection = True
+            self.connection.close()
+            return
+        if outcome == 'throttled':
+            headers = {'Retry-After': str(self.server.retry_after)} if self.server.retry_after is not None else {}
+            self.send_body(429, 'Too Many Requests', headers = headers)
+            return
+        if outcome == 'error':
+            self.send_body(500, 'Internal Server Error')
+            return
+
+        body = self.server.render(self.path)
+        if body is None:
+            self.send_body(404, 'Not Found')
+        else:
+            self.send_body(200, body)
+
+    def send_body(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8', headers: Optional[dict] = None):
+        """Send a complete response with a Content-Length, keeping the connection alive."""
+        data = body.encode('utf-8')
+        headers = dict(headers or {})
+        accepted = [coding.split(';')[0].strip() for coding in self.headers.get('Accept-Encoding', '').split(',')]
+        if self.server.compress and status == 200 and 'gzip' in accepted:
+            data = gzip.compress(data)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """Only log requests in verbose mode."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description = "Local stand-in for the LinkedIn guest job API")
+    parser.add_argument('--host', default = '127.0.0.1')
+    parser.add_argument('--port', type = int, default = 8765)
+    parser.add_argument('--latency', type = float, default = 0.0, help = "mean response delay in seconds")
+    parser.add_argument('--latency-jitter', type = float, default = 0.0, help = "uniform jitter around the mean delay")
+    parser.add_argument('--error-rate', type = float, default = 0.0, help = "probability of a 500 response")
+    parser.add_argument('--throttle-rate', type = float, default = 0.0, help = "probability of starting a 429 burst")
+    parser.add_argument('--throttle-burst', type = int, default = 5, help = "length of a 429 burst")
+    parser.add_argument('--retry-after', type = float, default = 1, help = "Retry-After of 429 responses, negative to omit")
+    parser.add_argument('--reset-rate', type = float, default = 0.0, help = "probability of a connection reset")
+    parser.add_argument('--results-per-query', type = int, default = 100, help = "synthetic job cards per search query")
+    parser.add_argument('--padding-kb', type = int, default = 0, help = "filler markup added to synthetic pages")
+    parser.add_argument('--recordings', help = "directory of recorded pages to replay")
+    parser.add_argument('--upstream', help = "record missing pages from this base URL (e.g. https://www.linkedin.com)")
+    parser.add_argument('--no-compress', action = 'store_true', help = "never gzip responses")
+    parser.add_argument('--seed', type = int, help = "seed of the fault injection")
+    parser.add_argument('--verbose', action = 'store_true')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    server = LinkedInStubServer(address = (args.host, args.port),
+                                latency = args.latency,
+                                latency_jitter = args.latency_jitter,
+                                error_rate = args.error_rate,
+                                throttle_rate = args.throttle_rate,
+                                throttle_burst = args.throttle_burst,
+                                retry_after = args.retry_after if args.retry_after >= 0 else None,
+                                reset_rate = args.reset_rate,
+                                results_per_query = args.results_per_query,
+                                padding_kb = args.padding_kb,
+                                recordings = args.recordings,
+                                upstream = args.upstream,
+                                compress = not args.no_compress,
+                                seed = args.seed,
+                                verbose = args.verbose)
+    print(f"Serving LinkedIn stand-in on {server.base_url} (stats on {server.base_url}/__stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.stats))
@@ -0,0 +1,261 @@
+# src/AsyncBeautifulSoupEngine.py
+
+import aiohttp
+import asyncio
+import time
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from src.BeautifulSoupEngine import BeautifulSoupEngine, FailedPage, parse_page_in_worker
+from src.utils.CrawlFrontier import CrawlFrontier
+from src.utils.ProxyPool import Proxy
+from src.utils.TransferStats import TransferStats
+
+
+
+class AsyncBeautifulSoupEngine(BeautifulSoupEngine):
+    """Asyncio flavour of BeautifulSoupEngine.
+
+    Keeps the get_jobcards(preferences) / get_job_descriptions(urls) contract of the
+    synchronous engine, but fetches URLs concurrently with aiohttp. The number of
+    requests in flight is bounded by the 'max_in_flight' config value and results
+    are always returned in the same order as the input URLs.
+    """
+
+    def __init__(self, config: dict, preferences: dict):
+        """Initialize the async engine with configuration and preferences.
+
+        Args:
+            config (dict): Configuration dictionary (same keys as BeautifulSoupEngine, plus 'max_in_flight').
+            preferences (dict): User preferences for job searching.
+        """
+        super().__init__(config, preferences)
+        self.loop = None
+        self.connection_stats = {'requests': 0, 'connections': 0}
+
+    def __enter__(self):
+        """Context manager entry point, opens the event loop and the HTTP session."""
+        self.open()
+        return self
+
+    def open(self):
+        """Create the private event loop, the aiohttp session and the parse pool if needed."""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        if self.session is None:
+            self.session = self.loop.run_until_complete(self._create_session())
+        self.open_parse_pool()
+
+    def close(self):
+        """Close the aiohttp session and the event loop."""
+        if self.session is not None:
+            self.log_connection_stats(*self.get_connection_stats())
+            self.loop.run_until_complete(self.session.close())
+            self.session = None
+        if self.loop is not None:
+            self.loop.close()
+            self.loop = None
+        self.close_parse_pool()
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create the keep-alive aiohttp session (must run inside the event loop).
+
+        Bodies are decoded by fetch_async rather than aiohttp, so that the compressed size can be counted.
+        """
+        self.connection_stats = {'requests': 0, 'connections': 0}
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        return aiohttp.ClientSession(headers = {'Accept-Encoding': TransferStats.ACCEPT_ENCODING, **self.config['headers']},
+                                     auto_decompress = False,
+                                     timeout = aiohttp.ClientTimeout(total = self.config['request_timeout']),
+                                     connector = aiohttp.TCPConnector(limit = self.max_in_flight),
+                                     trace_configs = [trace_config])
+
+    async def _on_request_start(self, session, context, params):
+        """aiohttp trace hook counting requests."""
+        self.connection_stats['requests'] += 1
+
+    async def _on_connection_create_end(self, session, context, params):
+        """aiohttp trace hook counting newly opened connections."""
+        self.connection_stats['connections'] += 1
+
+    def get_connection_stats(self) -> tuple[int, int]:
+        """Count requests sent and connections opened by the current session.
+
+        Returns:
+            tuple[int, int]: (requests, connections).
+        """
+        return self.connection_stats['requests'], self.connection_stats['connections']
+
+    def get_proxy(self, url: str) -> Optional[str]:
+        """Pick the proxy matching the URL scheme from the requests-style proxies dict.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            Optional[str]: Proxy URL or None if no proxy is configured.
+        """
+        proxies = self.get_proxies()
+        if not proxies or not isinstance(proxies, dict):
+            return None
+        return proxies.get(urlsplit(url).scheme)
+
+    async def acquire_proxy_async(self, poll_interval: float = 0.05) -> Proxy:
+        """Take a slot on a proxy of the pool without blocking the event loop.
+
+        Args:
+            poll_interval (float): Seconds to wait between two attempts while every proxy is busy or quarantined.
+
+        Returns:
+            Proxy: The acquired proxy, to be released with proxy_pool.release.
+        """
+        while True:
+            proxy = self.proxy_pool.try_acquire()
+            if proxy is not None:
+                return proxy
+            await asyncio.sleep(poll_interval)
+
+    async def fetch_async(self, url: str, type: Optional[str] = None) -> Optional[str]:
+        """Fetch a URL with retry logic and return the response body.
+
+        Args:
+            url (str): The URL to fetch.
+            type (str, optional): Type of page, used for the transfer accounting.
+
+        Returns:
+            Optional[str]: Response text if successful, None otherwise.
+        """
+        html = self.read_cache(url, type)
+        if html is not None:
+            return html
+
+        static_proxy = self.get_proxy(url)
+
+        for attempt in range(self.config['max_retry']):
+            retry_after = None
+            pooled = await self.acquire_proxy_async() if self.proxy_pool is not None else None
+            proxy = pooled.url if pooled is not None else static_proxy
+            limiter_key = self.rate_limiter.key_for(url, {urlsplit(url).scheme: proxy} if proxy else None)
+            proxy_ok = False
+            started = time.monotonic()
+            try:
+                delay = self.rate_limiter.reserve(limiter_key)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                started = time.monotonic()
+                async with self.session.get(url, proxy = proxy) as response:
+                    proxy_ok = True
+                    data = await response.read()
+                    body = TransferStats.decode(data, response.headers.get('Content-Encoding'))
+                    self.transfer_stats.record(type, len(data), len(body))
+                    response.raise_for_status()
+                    html = body.decode(response.charset or 'utf-8', errors = 'replace')
+                    if self.cache is not None:
+                        self.cache.set(url, html)
+                    return html
+
+            except aiohttp.ClientResponseError as e:
+                cause = self.retry_policy.classify_status(e.status)
+                if cause is None:
+                    self.logger.error(f"HTTP error for URL: {url}: {e}")
+                    break
+                # Throttled or failing upstream: count it against the proxy that carried it
+                proxy_ok = False
+                retry_after = self.retry_policy.parse_retry_after((e.headers or {}).get('Retry-After'))
+                self.logger.warning(f"HTTP {e.status} for URL: {url}, attempt {attempt + 1}/{self.config['max_retry']}")
+
+            except asyncio.TimeoutError:
+                proxy_ok = False
+                cause = 'timeout'
+                self.logger.warning(f"Timeout occurred for URL: {url}, attempt {attempt + 1}/{self.config['max_retry']}")
+
+            except aiohttp.ClientConnectionError as e:
+                proxy_ok = False
+                cause = 'connection'
+                self.logger.warning(f"Connection error for URL: {url}: {e}, attempt {attempt + 1}/{self.config['max_retry']}")
+
+            except Exception as e:
+                self.logger.error(f"Unexpected error for URL: {url}: {e}")
+                break
+
+            finally:
+                if pooled is not None:
+                    self.proxy_pool.release(pooled, proxy_ok, time.monotonic() - started)
+
+            if attempt == self.config['max_retry'] - 1:
+                break
+            if not self.retry_policy.consume(cause):
+                self.logger.error(f"Retry budget exhausted, giving up on URL: {url}")
+                break
+            await asyncio.sleep(self.retry_policy.compute_delay(attempt, cause, retry_after))
+
+    async def process_url_async(self, url: str, type: str, semaphore: asyncio.Semaphore):
+        """Asynchronous counterpart of process_url.
+
+        Args:
+            url (str): URL to process.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+            semaphore (asyncio.Semaphore): Semaphore bounding the number of requests in flight.
+
+        Returns:
+            Extracted data from the URL, or a FailedPage if the request failed.
+        """
+        if type not in ('job_cards', 'job_descriptions'):
+            raise ValueError(f"Invalid type: {type}")
+
+        data = self.replay(url, type)
+        if data is not CrawlFrontier.MISSING:
+            return data
+
+        async with semaphore:
+            self.logger.info(f"Processing {type.replace('_', ' ')} from: {url}")
+            html = await self.fetch_async(url, type)
+
+        if html is None:
+            return FailedPage()
+        pool = self.parse_pool
+        if pool is None:
+            data = self.parse_page(html, type)
+        else:
+            # Parsing runs in another process while the loop keeps fetching
+            data = await asyncio.wrap_future(pool.submit(parse_page_in_worker, html, type))
+        self.checkpoint(url, type, data)
+        return data
+
+    async def gather_urls(self, urls: List[str], type: str) -> List:
+        """Process all URLs concurrently, at most max_in_flight at a time.
+
+        Args:
+            urls (List[str]): URLs to process.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+
+        Returns:
+            List: Results aligned with urls.
+        """
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        return await asyncio.gather(*(self.process_url_async(url, type, semaphore) for url in urls))
+
+    def map_urls(self, urls: List[str], type: str) -> List:
+        """Process a list of URLs concurrently and return results in input order.
+
+        Args:
+            urls (List[str]): URLs to process.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+
+        Returns:
+            List: Results aligned with urls.
+        """
+        if not urls:
+            return []
+
+        # Allow usage outside of a 'with' block
+        opened_here = self.session is None
+        if opened_here:
+            self.open()
+        try:
+            return list(self.loop.run_until_complete(self.gather_urls(urls, type)))
+        finally:
+            if opened_here:
+                self.close()
@@ -1,18 +1,58 @@
 # src/BeautifulSoupEngine.py
 
 from bs4 import BeautifulSoup as bs
+from bs4 import SoupStrainer
+from bs4.builder import builder_registry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import multiprocessing
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from urllib.parse import quote
 
+from src.utils.CrawlFrontier import CrawlFrontier
+from src.utils.DescriptionExtractor import DescriptionExtractor
+from src.utils.HighWaterMarks import HighWaterMarks
+from src.utils.JobCard import JobCard
 from src.utils.LoggerManager import LoggerManager
+from src.utils.ProxyPool import Proxy, ProxyPool
+from src.utils.RateLimiter import HostRateLimiter
+from src.utils.ResponseCache import ResponseCache
+from src.utils.RetryPolicy import RetryPolicy
+from src.utils.TransferStats import TransferStats
 
 
+# Engine used by parse pool workers, one per process (see init_parse_worker)
+_parse_engine = None
+
+
+def init_parse_worker(config: dict) -> None:
+    """Process pool initializer: build the engine used to parse pages in this worker."""
+    global _parse_engine
+    _parse_engine = BeautifulSoupEngine(config, {})
+
+
+def parse_page_in_worker(html: str, type: str):
+    """Process pool task: parse a raw response body and return only the extracted data."""
+    return _parse_engine.parse_page(html, type)
+
+
+class FailedPage(list):
+    """Result of a URL whose fetch gave up: empty like a page without data, told apart by the search paging."""
+
 
 class BeautifulSoupEngine:
     """Engine for scraping LinkedIn job data using BeautifulSoup and requests."""
     
+    # Only the nodes read by cook_soup, per type of page
+    STRAINERS = {
+        'job_cards': SoupStrainer(attrs = {'data-entity-urn': True}),
+        'job_descriptions': SoupStrainer('div', class_ = 'description__text description__text--rich')
+    }
+    
     def __init__(self, config: dict, preferences: dict):
         """Initialize the BeautifulSoup engine with configuration and preferences.
         
@@ -23,56 +63,362 @@ class BeautifulSoupEngine:
         self.config = config
         self.preferences = preferences
         self.logger = LoggerManager.configure_logger(name='BeautifulSoupEngine')
+        # Overridable to point the engine at a local stand-in server
+        self.base_url = self.config.get('base_url', 'https://www.linkedin.com').rstrip('/')
         self.session = None
+        self.adapter = None
+        self.session_lock = threading.Lock()
+        self.proxy_pool = ProxyPool.from_config(self.config.get('proxy_pool'))
+        # With a proxy pool, default to keeping every proxy slot busy
+        default_in_flight = self.proxy_pool.capacity if self.proxy_pool is not None else 8
+        self.max_in_flight = max(1, int(self.config.get('max_in_flight', default_in_flight)))
+        self.rate_limiter = HostRateLimiter(self.config.get('rate_limits'))
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        self.search_requests = 0
+        self.failed_search_pages = 0
+        self.transfer_stats = TransferStats()
+        self.cache = self.create_cache(self.config.get('cache', {}))
+        # Index of the search round in progress, later rounds must see fresh search pages
+        self.search_round = 0
+        self.frontier = CrawlFrontier.from_config(self.config.get('checkpoint'))
+        self.high_water_marks = HighWaterMarks.from_config(self.config.get('incremental'))
+        # Index of the postings already stored, attached by JobScraper when it has one
+        self.seen_postings = None
+        self.parser = self.select_parser(self.config.get('parser', 'html.parser'))
+        self.partial_parsing = self.config.get('partial_parsing', False)
+        self.fast_extraction = self.config.get('fast_extraction', True)
+        self.parse_workers = max(0, int(self.config.get('parse_workers', 0)))
+        self.parse_pool = None
+        # Fetch threads may all reach parse before the pool exists, only one of them creates it
+        self.parse_pool_lock = threading.Lock()
 
     def __enter__(self):
-        """Context manager entry point."""
+        """Context manager entry point, opens the pooled HTTP session."""
+        self.open()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Context manager exit point."""
         self.close()
 
+    def open(self):
+        """Create the pooled HTTP session (and the parse pool, if enabled) if they are not open yet."""
+        with self.session_lock:
+            if self.session is None:
+                self.session = self.create_session()
+        self.open_parse_pool()
+
     def close(self):
         """Close any open resources like sessions."""
         if hasattr(self, 'session') and self.session:
+            self.log_connection_stats(*self.get_connection_stats())
             self.session.close()
+            self.session = None
+            self.adapter = None
+        self.close_parse_pool()
+
+    def open_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Start the pool of 'parse_workers' processes parsing response bodies, if enabled.
+        
+        Returns:
+            Optional[ProcessPoolExecutor]: The parse pool, None if disabled.
+        """
+        with self.parse_pool_lock:
+            if self.parse_workers and self.parse_pool is None:
+                worker_config = {key: self.config[key] for key in ('parser', 'partial_parsing', 'fast_extraction', 'base_url')
+                                 if key in self.config}
+                # 'spawn' is safe with the fetch threads and event loop of the parent process
+                self.parse_pool = ProcessPoolExecutor(max_workers = self.parse_workers,
+                                                      mp_context = multiprocessing.get_context('spawn'),
+                                                      initializer = init_parse_worker,
+                                                      initargs = (worker_config,))
+            return self.parse_pool
+
+    def close_parse_pool(self) -> None:
+        """Stop the parse pool."""
+        lock = getattr(self, 'parse_pool_lock', None)
+        if lock is None:
+            return
+        with lock:
+            pool, self.parse_pool = self.parse_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    @staticmethod
+    def create_cache(cache_config: dict) -> Optional[ResponseCache]:
+        """Create the on-disk response cache if it is enabled in the configuration.
+        
+        Args:
+            cache_config (dict): The 'cache' section of the engine configuration.
+            
+        Returns:
+            Optional[ResponseCache]: The cache, or None if disabled.
+        """
+        if not cache_config.get('enabled', False):
+            return None
+        return ResponseCache(directory = cache_config.get('directory', './data/cache'),
+                             search_ttl = cache_config.get('search_ttl', 3600),
+                             description_ttl = cache_config.get('description_ttl', 259200),
+                             max_size_mb = cache_config.get('max_size_mb', 200))
+
+    def read_cache(self, url: str, type: Optional[str] = None) -> Optional[str]:
+        """Return the cached body of a URL, or None if it must be fetched.
+
+        Search pages are only read from the cache in the first round: the extra
+        rounds exist to catch the postings that moved between the pages, a cached
+        page would give them the same cards again.
+
+        Args:
+            url (str): The URL to look up.
+            type (str, optional): Type of page ('job_cards' or 'job_descriptions').
+
+        Returns:
+            Optional[str]: Cached response body, None on a miss or a bypass.
+        """
+        if self.cache is None or (type == 'job_cards' and self.search_round > 0):
+            return None
+        return self.cache.get(url)
+
+    def log_run_stats(self) -> None:
+        """Log the cache, retry, proxy and transfer counters, which add up over every session of the run.
+
+        The scraper calls it once at the end of the run, while close only logs the stats of the session it ends.
+        """
+        self.log_cache_stats()
+        self.log_retry_stats()
+        self.log_proxy_stats()
+        self.log_transfer_stats()
+
+    def log_retry_stats(self) -> None:
+        """Log the retries of the run by cause."""
+        if self.retry_policy.counters:
+            self.logger.info(f"Retries by cause: {self.retry_policy.summary()}")
+
+    def log_cache_stats(self) -> None:
+        """Log the response cache hit rate."""
+        if self.cache is not None and (self.cache.hits or self.cache.misses):
+            self.logger.info(f"Cache stats: {self.cache.hits} hits, {self.cache.misses} misses")
+
+    def log_transfer_stats(self) -> None:
+        """Log the bytes transferred by the engine so far, by page type."""
+        if self.transfer_stats.counters:
+            self.logger.info(f"Transfer stats: {self.transfer_stats.summary()}")
+
+    def log_proxy_stats(self) -> None:
+        """Log the health of every proxy of the pool."""
+        if self.proxy_pool is not None:
+            self.logger.info(f"Proxy pool stats: {self.proxy_pool.summary()}")
+
+    def get_proxies(self) -> Optional[dict]:
+        """Return the configured requests-style proxies dict, or None if no proxy is set.
+        
+        The static 'proxies' setting is ignored when a proxy pool is configured.
+        """
+        if self.proxy_pool is not None:
+            return None
+        if self.config.get('proxies') and len(self.config['proxies']) > 0:
+            return self.config['proxies']
+        return None
+
+    def create_session(self) -> requests.Session:
+        """Create a keep-alive session with headers and proxies mounted once.
+        
+        The connection pool holds max_in_flight connections per host so that
+        concurrent workers never have to open throwaway connections.
+        
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        self.adapter = HTTPAdapter(pool_connections = 4,
+                                   pool_maxsize = self.max_in_flight)
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers['Accept-Encoding'] = TransferStats.ACCEPT_ENCODING
+        session.headers.update(self.config['headers'])
+        proxies = self.get_proxies()
+        if proxies:
+            session.proxies.update(proxies)
+        return session
+
+    def get_connection_stats(self) -> tuple[int, int]:
+        """Count requests sent and connections opened by the current session.
+        
+        Returns:
+            tuple[int, int]: (requests, connections) summed over every host and proxy pool.
+        """
+        if self.adapter is None:
+            return 0, 0
+
+        managers = [self.adapter.poolmanager, *self.adapter.proxy_manager.values()]
+        pools = [manager.pools[key] for manager in managers for key in manager.pools.keys()]
+        return (sum(pool.num_requests for pool in pools),
+                sum(pool.num_connections for pool in pools))
+
+    def log_connection_stats(self, requests_count: int, connections_count: int) -> None:
+        """Log how many handshakes the session saved by reusing connections.
+        
+        Args:
+            requests_count (int): Number of requests sent.
+            connections_count (int): Number of connections opened.
+        """
+        if requests_count:
+            self.logger.info(f"Session stats: {requests_count} requests over {connections_count} connections "
+                             f"({requests_count - connections_count} reused)")
 
     def unload_soup(self):
         """Clear the soup object from memory."""
         self.soup = None
 
-    def get_with_retry(self, url: str) -> Optional[bs]:
+    def select_parser(self, parser: str) -> str:
+        """Return the BeautifulSoup tree builder to use, falling back to 'html.parser' if unavailable.
+        
+        Args:
+            parser (str): Requested tree builder ('html.parser', 'lxml', ...).
+            
+        Returns:
+            str: An installed tree builder name.
+        """
+        if builder_registry.lookup(parser) is None:
+            self.logger.warning(f"HTML parser '{parser}' is not installed, falling back to 'html.parser'")
+            return 'html.parser'
+        return parser
+
+    def make_soup(self, html: str, type: Optional[str] = None) -> bs:
+        """Build a BeautifulSoup object from a raw HTML response body.
+        
+        With partial parsing enabled and a known page type, only the subtrees
+        read by cook_soup are materialized.
+        
+        Args:
+            html (str): Raw HTML content.
+            type (str, optional): Type of page ('job_cards' or 'job_descriptions').
+            
+        Returns:
+            bs: Parsed BeautifulSoup object.
+        """
+        parse_only = self.STRAINERS.get(type) if self.partial_parsing else None
+        if parse_only is None:
+            return bs(html, self.parser)
+        return bs(html, self.parser, parse_only = parse_only)
+
+    def get_with_retry(self, url: str, type: Optional[str] = None) -> Optional[bs]:
         """Fetch a URL with retry logic and return BeautifulSoup object.
         
         Args:
             url (str): The URL to fetch.
+            type (str, optional): Type of page, used to restrict parsing to the useful nodes.
             
         Returns:
             Optional[bs]: BeautifulSoup object if successful, None otherwise.
         """
-        proxies = None
-        if self.config.get('proxies') and len(self.config['proxies']) > 0:
-            proxies = self.config['proxies']
+        html = self.fetch(url, type)
+        if html is None:
+            return None
+        return self.make_soup(html, type)
+
+    def fetch(self, url: str, type: Optional[str] = None) -> Optional[str]:
+        """Fetch a URL with retry logic and return the response body.
+        
+        The response cache, when enabled, is checked first and filled on success.
+        Bytes moved by every response, failed ones included, are counted under the page type.
+        
+        Args:
+            url (str): The URL to fetch.
+            type (str, optional): Type of page, used for the transfer accounting.
+            
+        Returns:
+            Optional[str]: Response body if successful, None otherwise.
+        """
+        html = self.read_cache(url, type)
+        if html is not None:
+            return html
+
+        if self.session is None:
+            self.open()
 
         for attempt in range(self.config['max_retry']):
+            retry_after = None
+            # Every attempt may go out through another proxy of the pool
+            proxy = self.proxy_pool.acquire() if self.proxy_pool is not None else None
+            proxy_ok = False
+            started = time.monotonic()
             try:
-                response = requests.get(url,
-                                        proxies = proxies,
-                                        headers = self.config['headers'],
-                                        timeout = self.config['request_timeout'])
+                self.rate_limiter.acquire(self.rate_limiter.key_for(url, proxy.proxies if proxy else self.get_proxies()))
+                started = time.monotonic()
+                response = self.send(url, proxy)
+                proxy_ok = True
+                self.record_transfer(response, type)
                 response.raise_for_status()
-                return bs(response.text, 'html.parser')
-            
+                if self.cache is not None:
+                    self.cache.set(url, response.text)
+                return response.text
+
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                cause = self.retry_policy.classify_status(status)
+                if cause is None:
+                    self.logger.error(f"HTTP error for URL: {url}: {e}")
+                    break
+                # Throttled or failing upstream: count it against the proxy that carried it
+                proxy_ok = False
+                retry_after = self.retry_policy.parse_retry_after(e.response.headers.get('Retry-After'))
+                self.logger.warning(f"HTTP {status} for URL: {url}, attempt {attempt + 1}/{self.config['max_retry']}")
+
             except requests.exceptions.Timeout:
+                cause = 'timeout'
                 self.logger.warning(f"Timeout occurred for URL: {url}, attempt {attempt + 1}/{self.config['max_retry']}")
-                if attempt < self.config['max_retry'] - 1:
-                    time.sleep(self.config['retry_delay'])
+
+            except requests.exceptions.ConnectionError as e:
+                cause = 'connection'
+                self.logger.warning(f"Connection error for URL: {url}: {e}, attempt {attempt + 1}/{self.config['max_retry']}")
 
             except Exception as e:
                 self.logger.error(f"Unexpected error for URL: {url}: {e}")
                 break
 
+            finally:
+                if proxy is not None:
+                    self.proxy_pool.release(proxy, proxy_ok, time.monotonic() - started)
+
+            if attempt == self.config['max_retry'] - 1:
+                break
+            if not self.retry_policy.consume(cause):
+                self.logger.error(f"Retry budget exhausted, giving up on URL: {url}")
+                break
+            time.sleep(self.retry_policy.compute_delay(attempt, cause, retry_after))
+
+    def record_transfer(self, response: requests.Response, type: Optional[str]) -> None:
+        """Count the compressed and decompressed body bytes of a response.
+        
+        Args:
+            response (requests.Response): A response whose body has been read.
+            type (str, optional): Type of page.
+        """
+        body = response.content
+        if not isinstance(body, bytes):
+            return
+        # urllib3 counts the bytes read from the socket, before content decoding
+        wire_bytes = response.raw.tell() if hasattr(response.raw, 'tell') else len(body)
+        self.transfer_stats.record(type, wire_bytes, len(body))
+
+    def send(self, url: str, proxy: Optional[Proxy] = None) -> requests.Response:
+        """Send one GET request through the session, optionally through a proxy of the pool.
+        
+        Args:
+            url (str): The URL to fetch.
+            proxy (Proxy, optional): Proxy to route the request through.
+            
+        Returns:
+            requests.Response: The response, status not checked.
+        """
+        if proxy is None:
+            return self.session.get(url,
+                                    timeout = self.config['request_timeout'])
+        return self.session.get(url,
+                                proxies = proxy.proxies,
+                                timeout = self.config['request_timeout'])
+
     def cook_soup(self, soup: bs, type: str) -> List[Dict]:
         """Parse BeautifulSoup object and extract data based on type.
         
@@ -107,7 +453,7 @@ class BeautifulSoupEngine:
                         
                     entity_urn = parent_div['data-entity-urn']
                     job_posting_id = entity_urn.split(':')[-1]
-                    job_url = f'https://www.linkedin.com/jobs/view/{job_posting_id}/'
+                    job_url = f'{self.base_url}/jobs/view/{job_posting_id}/'
 
                     # Handle date extraction
                     date_tag_new = item.find('time', class_='job-search-card__listdate--new')
@@ -119,13 +465,11 @@ class BeautifulSoupEngine:
                     elif date_tag_new and 'datetime' in date_tag_new.attrs:
                         date = date_tag_new['datetime']
 
-                    job = {
-                        'title': title,
-                        'company': company_elem.text.strip().replace('\n', ' ') if company_elem else '',
-                        'location': location_elem.text.strip() if location_elem else '',
-                        'date': date,
-                        'job_url': job_url
-                    }
+                    job = JobCard(title = title,
+                                  company = company_elem.text.strip().replace('\n', ' ') if company_elem else '',
+                                  location = location_elem.text.strip() if location_elem else '',
+                                  date = date,
+                                  job_url = job_url)
                     joblist.append(job)
                     
                 except Exception as e:
@@ -150,11 +494,7 @@ class BeautifulSoupEngine:
                             li.insert(0, '-')
 
                     text = div.get_text(separator='\n').strip()
-                    text = text.replace('\n\n', '')
-                    text = text.replace('::marker', '-')
-                    text = text.replace('-\n', '- ')
-                    text = text.replace('Show less', '').replace('Show more', '')
-                    return text
+                    return DescriptionExtractor.normalize(text)
                 else:
                     return None
         else:
@@ -171,15 +511,117 @@ class BeautifulSoupEngine:
         """
         urls = []
         for i in range(self.config['rounds']):
-            for query in preferences['search_queries']:
-                # URL Encode keywords and location
-                keywords = quote(query['keywords'])
-                location = quote(query['location'])
-                for j in range(self.config['pages_to_scrape']):
-                    url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keywords}&location={location}&f_TPR=&f_WT={query['f_WT']}&geoId=&f_TPR={self.config['max_age']}&start={25*j}"
-                    urls.append(url)
+            urls.extend(self.generate_round_urls(preferences))
         return urls
 
+    def generate_round_urls(self, preferences: dict) -> List[str]:
+        """Generate the LinkedIn job search URLs of a single search round.
+        
+        Args:
+            preferences (dict): User preferences containing search queries and filters.
+            
+        Returns:
+            List[str]: Every result page URL of every search query.
+        """
+        urls = []
+        for query in preferences['search_queries']:
+            for j in range(self.config['pages_to_scrape']):
+                urls.append(self.build_search_url(query, j))
+        return urls
+
+    def build_search_url(self, query: dict, page: int) -> str:
+        """Build the LinkedIn job search URL of one result page of a query.
+        
+        Args:
+            query (dict): Search query with 'keywords', 'location' and 'f_WT'.
+            page (int): Zero-based result page index.
+            
+        Returns:
+            str: LinkedIn job search URL.
+        """
+        # URL Encode keywords and location
+        keywords = quote(query['keywords'])
+        location = quote(query['location'])
+        max_age = self.config['max_age']
+        sort = ''
+        # Incremental crawling: only the postings published since the last run, newest first
+        if self.high_water_marks is not None:
+            max_age = self.high_water_marks.window(query, max_age)
+            sort = '&sortBy=DD'
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keywords}&location={location}&f_TPR=&f_WT={query['f_WT']}&geoId=&f_TPR={max_age}{sort}&start={self.config.get('page_size', 25) * page}"
+
+    @staticmethod
+    def get_job_posting_id(job: Dict) -> str:
+        """Return the LinkedIn job posting id of a job card.
+        
+        Args:
+            job (Dict): Job card as returned by cook_soup.
+            
+        Returns:
+            str: The numeric job posting id.
+        """
+        return job['job_url'].rstrip('/').split('/')[-1]
+
+    def parse_page(self, html: str, type: str):
+        """Extract data from a raw response body.
+        
+        Job descriptions go through the DescriptionExtractor fast path when
+        'fast_extraction' is enabled, and through BeautifulSoup when the fast path
+        gives up on the markup.
+        
+        Args:
+            html (str): Raw response body.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+            
+        Returns:
+            Extracted data, as returned by cook_soup.
+        """
+        if type == 'job_descriptions' and self.fast_extraction:
+            text = DescriptionExtractor.extract(html)
+            if text is not None:
+                return text
+            self.logger.debug("Fast description extraction not applicable, falling back to BeautifulSoup")
+        soup = self.make_soup(html, type)
+        try:
+            return self.cook_soup(soup, type)
+        finally:
+            self.release_soup(soup)
+
+    @staticmethod
+    def release_soup(soup: bs) -> None:
+        """Free a parse tree right away.
+        
+        Trees are made of reference cycles (parent, siblings, next/previous element),
+        so without this they survive until the next full garbage collection, and
+        several pages worth of trees pile up in memory. The children are decomposed
+        one by one: decomposing the root alone only wipes the root.
+        
+        Args:
+            soup (bs): Parsed page, unusable afterwards.
+        """
+        for child in list(soup.contents):
+            child.decompose()
+        soup.decompose()
+
+    def parse(self, html: str, type: str):
+        """Parse a raw response body, in the parse pool when 'parse_workers' is set.
+        
+        The calling fetch thread waits for the result without holding the GIL, so
+        fetch concurrency (max_in_flight) and parse parallelism (parse_workers) scale
+        independently.
+        
+        Args:
+            html (str): Raw response body.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+            
+        Returns:
+            Extracted data, as returned by parse_page.
+        """
+        pool = self.parse_pool or self.open_parse_pool()
+        if pool is None:
+            return self.parse_page(html, type)
+        return pool.submit(parse_page_in_worker, html, type).result()
+
     def process_url(self, url: str, type: str) -> List[Dict]:
         """Process a single URL and extract data based on type.
         
@@ -188,28 +630,227 @@ class BeautifulSoupEngine:
             type (str): Type of data to extract ('job_cards' or 'job_descriptions').
             
         Returns:
-            List[Dict]: Extracted data from the URL.
+            List[Dict]: Extracted data from the URL, a FailedPage if the request failed.
         """
+        if type not in ('job_cards', 'job_descriptions'):
+            raise ValueError(f"Invalid type: {type}")
+
+        data = self.replay(url, type)
+        if data is not CrawlFrontier.MISSING:
+            return data
+
+        self.logger.info(f"Processing {type.replace('_', ' ')} from: {url}")
+        html = self.fetch(url, type)
+        if html is None:
+            return FailedPage()
+        data = self.parse(html, type)
+        self.checkpoint(url, type, data)
+        return data
+
+    def replay(self, url: str, type: str):
+        """Return the data checkpointed for this request of a URL by an interrupted run.
+        
+        Args:
+            url (str): URL to process.
+            type (str): Type of data ('job_cards' or 'job_descriptions').
+            
+        Returns:
+            The extracted data, or CrawlFrontier.MISSING if it must be fetched.
+        """
+        if self.frontier is None:
+            return CrawlFrontier.MISSING
+        data = self.frontier.replay(url)
+        if data is CrawlFrontier.MISSING:
+            return data
+        self.logger.debug(f"Replaying checkpointed data of: {url}")
         if type == 'job_cards':
-            self.logger.info(f"Processing job cards from: {url}")
-            soup = self.get_with_retry(url)
-            if soup is None:
-                return []
-            else:
-                jobs = self.cook_soup(soup, type)
-                return jobs
+            return [JobCard.from_dict(card) for card in data]
+        return data
 
-        elif type == 'job_descriptions':
-            self.logger.info(f"Processing job descriptions from: {url}")
-            soup = self.get_with_retry(url)
-            if soup is None:
-                return []
-            else:
-                job_descriptions = self.cook_soup(soup, type)
-                return job_descriptions
+    def checkpoint(self, url: str, type: str, data) -> None:
+        """Persist the data extracted from a URL, so that a resumed run does not fetch it again.
+        
+        Args:
+            url (str): Processed URL.
+            type (str): Type of data ('job_cards' or 'job_descriptions').
+            data: Extracted data.
+        """
+        if self.frontier is not None:
+            self.frontier.record(url, type, data)
 
-        else:
-            raise ValueError(f"Invalid type: {type}")
+    def map_urls(self, urls: List[str], type: str) -> List:
+        """Process a list of URLs and return one result per URL, in input order.
+        
+        With execution_mode 'threads', URLs are processed by a pool of max_in_flight
+        threads; request pacing is left to the per-host rate limiter.
+        Concurrent engines override this method; everything built on top of it
+        (job cards, job descriptions) keeps the same ordering guarantees.
+        
+        Args:
+            urls (List[str]): URLs to process.
+            type (str): Type of data to extract ('job_cards' or 'job_descriptions').
+            
+        Returns:
+            List: Results of process_url, aligned with urls.
+        """
+        if self.config.get('execution_mode', 'serial') == 'threads' and len(urls) > 1:
+            with ThreadPoolExecutor(max_workers = min(self.max_in_flight, len(urls))) as executor:
+                return list(executor.map(self.process_url, urls, repeat(type)))
+
+        return [self.process_url(url, type) for url in urls]
+
+    def iter_jobcards(self, preferences: dict) -> Iterator[List[Dict]]:
+        """Yield job cards page by page as soon as they are fetched.
+        
+        The search is repeated up to 'rounds' times. With rounds_mode 'saturation',
+        it stops after the first round whose share of new unique job postings falls
+        below 'min_round_yield'. The yield of every round is logged.
+        
+        Args:
+            preferences (dict): User preferences for job searching.
+            
+        Yields:
+            List[Dict]: Job cards of one search page.
+        """
+        queries = preferences['search_queries']
+        # Stopping at the high-water marks needs the per-query paging of the adaptive rounds
+        adaptive = self.config.get('adaptive_pagination', False) or self.high_water_marks is not None
+        saturation = self.config.get('rounds_mode', 'fixed') == 'saturation'
+        min_round_yield = self.config.get('min_round_yield', 0.05)
+        planned = self.config['rounds'] * len(queries) * self.config['pages_to_scrape']
+        self.search_requests = 0
+        self.failed_search_pages = 0
+        known_ids = set()
+        yield_curve = []
+        if self.high_water_marks is not None:
+            self.high_water_marks.begin()
+
+        try:
+            for round_index in range(self.config['rounds']):
+                self.search_round = round_index
+                known_before = len(known_ids)
+                failed_before = self.failed_search_pages
+                pages = self.iter_round_adaptive(queries, known_ids) if adaptive else self.iter_round(preferences)
+                for jobs in pages:
+                    known_ids.update(self.get_job_posting_id(job) for job in jobs)
+                    yield jobs
+
+                new_ids = len(known_ids) - known_before
+                round_yield = new_ids / known_before if known_before else 1.0
+                yield_curve.append(new_ids)
+                self.logger.info(f"Round {round_index + 1}: {new_ids} new job postings ({round_yield:.1%} of {known_before} already seen)")
+
+                # A round that lost pages to failed requests says nothing about saturation
+                round_failures = self.failed_search_pages - failed_before
+                if round_failures:
+                    self.logger.warning(f"Round {round_index + 1}: {round_failures} search pages failed")
+                if saturation and round_index > 0 and round_yield < min_round_yield and not round_failures:
+                    self.logger.info(f"Search saturated after round {round_index + 1} (yield {round_yield:.1%} < {min_round_yield:.1%})")
+                    break
+        finally:
+            self.search_round = 0
+
+        self.logger.info(f"Round yield curve (new postings per round): {yield_curve}")
+        if adaptive or saturation:
+            failed = f" ({self.failed_search_pages} failed)" if self.failed_search_pages else ""
+            self.logger.info(f"Search requests: {self.search_requests} sent{failed}, "
+                             f"{max(0, planned - self.search_requests)} saved out of {planned}")
+
+    def iter_round(self, preferences: dict) -> Iterator[List[Dict]]:
+        """Yield the job cards of every page of one search round.
+        
+        Pages are fetched in chunks of max_in_flight URLs (one at a time in serial
+        mode), so consumers can start working before the whole search is done.
+        
+        Args:
+            preferences (dict): User preferences for job searching.
+            
+        Yields:
+            List[Dict]: Job cards of one search page.
+        """
+        urls = self.generate_round_urls(preferences)
+        chunk_size = 1 if self.config.get('execution_mode', 'serial') == 'serial' else self.max_in_flight
+
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i:i + chunk_size]
+            self.search_requests += len(chunk)
+            for jobs in self.map_urls(chunk, 'job_cards'):
+                self.failed_search_pages += isinstance(jobs, FailedPage)
+                yield jobs
+
+    def iter_round_adaptive(self, queries: List[dict], known_ids: set) -> Iterator[List[Dict]]:
+        """Yield the job cards of one search round, paging each query only while it returns new postings.
+        
+        Pages are requested in waves: the next page of every still active query at once.
+        A query stops paging as soon as one of its pages is short (fewer than
+        'page_size' cards), empty, only made of known postings, or reaches
+        postings behind the high-water mark of the query (incremental crawling).
+        Postings are known when seen earlier in the run (known_ids) or stored by
+        a previous one (seen_postings index). A page whose request failed says
+        nothing about the query: it is requested once more in the next wave, then
+        skipped, and the query keeps paging.
+        
+        Args:
+            queries (List[dict]): Search queries.
+            known_ids (set): Job posting ids already seen during the run, updated in place.
+            
+        Yields:
+            List[Dict]: Job cards of one search page.
+        """
+        page_size = self.config.get('page_size', 25)
+        pages_to_scrape = self.config['pages_to_scrape']
+        # (query, page, whether the page is a retry)
+        active = [(query, 0, False) for query in queries] if pages_to_scrape > 0 else []
+
+        while active:
+            results = self.map_urls([self.build_search_url(query, page) for query, page, _ in active], 'job_cards')
+            self.search_requests += len(active)
+
+            still_active = []
+            for (query, page, retry), jobs in zip(active, results):
+                if isinstance(jobs, FailedPage):
+                    self.failed_search_pages += 1
+                    if not retry:
+                        still_active.append((query, page, True))
+                    else:
+                        self.logger.warning(f"Query '{query['keywords']}' ({query['location']}): page {page + 1} skipped after failed requests")
+                        # The window of the query was not fully searched, the next run searches it again
+                        if self.high_water_marks is not None:
+                            self.high_water_marks.discard(query)
+                        if page + 1 < pages_to_scrape:
+                            still_active.append((query, page + 1, False))
+                    continue
+
+                ids = {self.get_job_posting_id(job) for job in jobs}
+                behind_mark = False
+                if self.high_water_marks is not None:
+                    behind_mark = self.high_water_marks.is_behind(query, ids)
+                    self.high_water_marks.observe(query, ids)
+                if len(jobs) >= page_size and not self.all_known(ids, known_ids) and not behind_mark:
+                    if page + 1 < pages_to_scrape:
+                        still_active.append((query, page + 1, False))
+                else:
+                    self.logger.debug(f"Query '{query['keywords']}' ({query['location']}) exhausted at page {page + 1}")
+                known_ids |= ids
+                yield jobs
+            active = still_active
+
+    def all_known(self, ids: set, known_ids: set) -> bool:
+        """Return True if every posting id was seen earlier in the run or is already stored.
+        
+        Args:
+            ids (set): Job posting ids of a search page.
+            known_ids (set): Job posting ids already seen during the run.
+            
+        Returns:
+            bool: True if the page holds no new posting.
+        """
+        unseen = ids - known_ids
+        if not unseen:
+            return True
+        if self.seen_postings is None or not all(job_posting_id.isdigit() for job_posting_id in unseen):
+            return False
+        return bool(self.seen_postings.contains(int(job_posting_id) for job_posting_id in unseen).all())
 
     def get_jobcards(self, preferences: dict) -> List[Dict]:
         """Get job cards from LinkedIn based on user preferences.
@@ -222,12 +863,8 @@ class BeautifulSoupEngine:
         """
         job_cards = []
 
-        # Generate urls
-        urls = self.generate_urls(preferences)
-
-        # Process urls to get job cards
-        for url in urls:
-            job_cards.extend(self.process_url(url, 'job_cards'))
+        for jobs in self.iter_jobcards(preferences):
+            job_cards.extend(jobs)
 
         return job_cards
     
@@ -240,9 +877,4 @@ class BeautifulSoupEngine:
         Returns:
             List[str]: List of job descriptions.
         """
-        job_descriptions = []
-
-        for url in urls:
-            job_descriptions.append(self.process_url(url, 'job_descriptions'))
-
-        return job_descriptions
\ No newline at end of file
+        return self.map_urls(urls, 'job_descriptions')
\ No newline at end of file
@@ -1,5 +1,7 @@
 # src/ElasticSearchEngine.py
 
+from typing import Optional
+
 import elasticsearch
 # from src.utils.LoggerManager import LoggerManager
 
@@ -125,12 +127,76 @@ class ElasticSearchEngine:
             return {"hits": {"hits": []}}
         
 
-    def insert_bulk_data(self, data: list, index: str = "jobs"):
+    def scan_field(self, index: str, field: str, batch_size: int = 10000):
+        """Iterate over the values of a keyword field of every document of an index.
+        
+        Documents are paged with search_after on the field, so the whole index can be
+        read whatever its size. Unlike search, errors are raised: callers must not
+        mistake an unreachable cluster for an empty index.
+        
+        Args:
+            index (str): Index name to read.
+            field (str): Keyword field to read (e.g. 'job_url').
+            batch_size (int, optional): Documents per request. Defaults to 10000.
+            
+        Yields:
+            str: Field values, in ascending order.
+            
+        Raises:
+            Exception: If a search request fails.
+        """
+        query = {"query": {"match_all": {}}, "_source": [field], "size": batch_size, "sort": [{field: "asc"}]}
+        while True:
+            try:
+                hits = self.es.search(index = index, body = query)['hits']['hits']
+            except elasticsearch.NotFoundError:
+                return
+            for hit in hits:
+                yield hit['_source'].get(field)
+            if len(hits) < batch_size:
+                return
+            query["search_after"] = hits[-1]['sort']
+
+
+    def index_identity(self, index: str) -> Optional[dict]:
+        """Return what identifies the content of an index: its UUID and its document count.
+        
+        The UUID changes when the index is deleted and created again, the count when
+        anyone writes to it. Pending writes are refreshed first so that the count
+        includes them. Unlike search, errors are raised.
+        
+        Args:
+            index (str): Index name.
+            
+        Returns:
+            Optional[dict]: {'uuid': str, 'count': int}, or None if the index does not exist.
+            
+        Raises:
+            Exception: If a request fails.
+        """
+        try:
+            self.es.indices.refresh(index = index)
+            settings = self.es.indices.get_settings(index = index)
+            count = self.es.count(index = index)['count']
+        except elasticsearch.NotFoundError:
+            return None
+        # Keyed by the concrete index name, which differs from an alias
+        uuid = next(iter(settings.values()))['settings']['index']['uuid']
+        return {'uuid': uuid, 'count': count}
+
+
+    def insert_bulk_data(self, data: list, index: str = "jobs", ids: list = None, create_only: bool = False):
         """Insert job documents into Elasticsearch using bulk operation.
         
+        With create_only, documents are sent as 'create' operations: a document whose
+        _id already exists is rejected with a 409 conflict, left in the response items
+        for the caller to count instead of being treated as an error.
+        
         Args:
             jobs (list): List of job dictionaries to insert.
             index (str, optional): Index name to insert into. Defaults to "jobs".
+            ids (list, optional): Document ids aligned with data (None for a generated id). Defaults to None.
+            create_only (bool, optional): Never overwrite an existing document. Defaults to False.
             
         Returns:
             dict: Bulk operation response.
@@ -141,19 +207,21 @@ class ElasticSearchEngine:
         try:
             self.create_index(index)
             
+            action = "create" if create_only else "index"
             bulk_data = []
-            for d in data:
-                bulk_data.append({
-                    "index": {
-                        "_index": index
-                    }
-                })
+            for position, d in enumerate(data):
+                metadata = {"_index": index}
+                if ids is not None and ids[position] is not None:
+                    metadata["_id"] = str(ids[position])
+                bulk_data.append({action: metadata})
                 bulk_data.append(d)
             
             response = self.es.bulk(body = bulk_data)
             
             if response.get('errors'):
-                error_items = [item for item in response['items'] if 'error' in item.get('index', {})]
+                # Documents already stored are expected with create_only, not errors
+                error_items = [item for item in response['items']
+                               if 'error' in item.get(action, {}) and not (create_only and item[action].get('status') == 409)]
                 if error_items:
                     if self.logger:
                         self.logger.error(f"Bulk insert had errors: {error_items}")
@@ -4,14 +4,40 @@ from datetime import datetime, timedelta
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
 import pandas as pd
-
+import re
+import time
+from typing import Optional
+
+from src.utils.CrawlFrontier import CrawlFrontier
+from src.utils.HighWaterMarks import HighWaterMarks
+from src.utils.KeywordMatcher import CompanySet, KeywordMatcher
+from src.utils.LanguageDetector import LanguageDetector
+from src.utils.LanguagePrescreen import LanguagePrescreen
+from src.utils.SeenPostings import SeenPostings
+from src.utils.TransferStats import TransferStats
 from src.utils.tools import ExecutionTime
 
 class JobScraper:
-    def __init__(self, backend, scrap_engine, logger):
+    # Gender markers that give away the language of a job posting from its title alone
+    TITLE_LANGUAGE_MARKERS = {
+        'de': re.compile(r'\((?=[^)]*\bw\b)[mwdx](?:\s*/\s*[mwdx]){1,2}\)', re.IGNORECASE),
+        'fr': re.compile(r'\b(?:h\s*/\s*f|f\s*/\s*h)\b', re.IGNORECASE),
+        'nl': re.compile(r'\(m\s*/\s*v(?:\s*/\s*x)?\)', re.IGNORECASE)
+    }
+
+    def __init__(self, backend, scrap_engine, logger, config: dict = None):
         self.logger = logger
         self.backend = backend
         self.scrap_engine = scrap_engine
+        self.config = config or {}
+        self.descriptions_left = None
+        self.descriptions_deferred = 0
+        self.frontier = None
+        # Jobs described from the checkpoint before the search of a resumed run
+        self.resumed_urls = set()
+        self.seen_postings = SeenPostings.from_config(self.config.get('seen_postings'))
+        self.language_detector = LanguageDetector.from_config(self.config.get('language_detection'))
+        self.language_prescreen = LanguagePrescreen.from_config(self.config.get('language_prescreen'))
     
 
     @staticmethod
@@ -44,6 +70,88 @@ class JobScraper:
         return True
 
 
+    @staticmethod
+    def lowered_text(values: pd.Series) -> pd.Series:
+        """
+        Lower-case the string form of every value, as str(value).lower() would.
+        Args:
+            values (pd.Series): Column to convert (missing values become 'nan' or 'none').
+        Returns:
+            pd.Series: Lower-cased strings.
+        """
+        return values.map(str).astype(str).str.lower()
+
+
+    @staticmethod
+    def contains_any(texts: pd.Series, words: list) -> pd.Series:
+        """
+        Tell which texts contain at least one of the words, as plain substrings.
+        The words are compiled once into a single pattern, so the texts are scanned
+        once whatever the length of the list.
+        Args:
+            texts (pd.Series): Lower-cased texts.
+            words (list): Words to look for (case-insensitive).
+        Returns:
+            pd.Series: Boolean mask aligned with texts.
+        """
+        return KeywordMatcher.compile(words).match_series(texts)
+
+
+    def detect_languages(self, df: pd.DataFrame, candidates: list) -> pd.Series:
+        """
+        Detect the language of every job description, tier by tier: the stopword prescreen
+        settles the obvious ones, the others go to langdetect (cached and parallel when the
+        language detector is enabled, one by one otherwise).
+        Args:
+            df (pd.DataFrame): The jobs.
+            candidates (list): The allowed languages.
+        Returns:
+            pd.Series: The language of each job, aligned with df (None without a description).
+        """
+        languages = pd.Series(None, index = df.index, dtype = object)
+        if 'description' not in df.columns:
+            return languages
+        descriptions = df['description'].map(str)
+        lowered = descriptions.str.lower()
+        # Missing descriptions (None, NaN, blank) are not filtered
+        has_description = (descriptions.str.strip().ne('') & ~lowered.isin(['nan', 'none'])).to_numpy()
+        if not has_description.any():
+            return languages
+
+        texts = descriptions[has_description].tolist()
+        if self.language_prescreen is not None:
+            detected = [self.language_prescreen.classify(text, candidates) for text in texts]
+        else:
+            detected = [None] * len(texts)
+        escalated = [position for position, language in enumerate(detected) if language is None]
+        if escalated:
+            escalated_texts = [texts[position] for position in escalated]
+            if self.language_detector is not None:
+                full_detection = self.language_detector.detect_many(escalated_texts)
+            else:
+                full_detection = [self.safe_detect(text) for text in escalated_texts]
+            for position, language in zip(escalated, full_detection):
+                detected[position] = language
+        self.logger.debug(f"Language detection: {len(texts) - len(escalated)} descriptions prescreened, {len(escalated)} escalated")
+
+        languages[has_description] = detected
+        return languages
+
+
+    def flag_filtered(self, df: pd.DataFrame, mask: pd.Series, filter_name: str) -> None:
+        """
+        Set 'filtered' to 1 on the rows of the mask, in place.
+        Args:
+            df (pd.DataFrame): The DataFrame to flag.
+            mask (pd.Series): Rows filtered out.
+            filter_name (str): Name of the filter, for the logs.
+        """
+        count = int(mask.sum())
+        if count:
+            self.logger.debug(f"{count} jobs filtered out by filter '{filter_name}'")
+            df.loc[mask.to_numpy(), 'filtered'] = 1
+
+
     def apply_filters(self, df: pd.DataFrame, preferences: dict, filters:list, remove_filtered: bool = False) -> pd.DataFrame:
         """
         Apply filters to the DataFrame.
@@ -60,42 +168,36 @@ class JobScraper:
           # Job titles must not contain any of the words in the title_exclude corresponding to the preferences to avoid filtering
           # Excluded words are more important than included words
         if "title" in filters:
-            title_include = preferences.get('title_include', [])
-            title_exclude = preferences.get('title_exclude', [])
-
-            for idx, row in df.iterrows():
-                title = str(row['title']).lower()
-                title_has_include = any(word.lower() in title for word in title_include)
-                title_has_exclude = any(word.lower() in title for word in title_exclude)
-
-                if not title_has_include or title_has_exclude:
-                    self.logger.debug(f"Job title {title} filtered out by filter 'title'")
-                    df.at[idx, 'filtered'] = 1
+            titles = self.lowered_text(df['title'])
+            title_has_include = self.contains_any(titles, preferences.get('title_include', []))
+            title_has_exclude = self.contains_any(titles, preferences.get('title_exclude', []))
+            self.flag_filtered(df, ~title_has_include | title_has_exclude, 'title')
 
         # Company filter
-            # Exclude companies specified in the company_exclude field
+            # Exclude companies specified in the company_exclude field (case and spacing insensitive)
         if "company" in filters:
-            company_exclude = preferences.get('company_exclude', [])
-            for idx, row in df.iterrows():
-                company = str(row['company'])
-                if company in company_exclude:
-                    self.logger.debug(f"Job company {company} filtered out by filter 'company'")
-                    df.at[idx, 'filtered'] = 1
+            company_exclude = CompanySet.compile(preferences.get('company_exclude', []))
+            self.flag_filtered(df, company_exclude.match_series(df['company']), 'company')
 
         # Max age filter
             # Filter if the job is older than the max age corresponding to the preferences
         if "max_age" in filters:
             max_age_days = preferences.get('max_age', 7)
             cutoff_date = datetime.now() - timedelta(days = max_age_days)
-            for idx, row in df.iterrows():
-                if pd.notna(row['date']) and row['date'] < cutoff_date:
-                    self.logger.debug(f"Job date {row['date']} filtered out by filter 'max_age'")
-                    df.at[idx, 'filtered'] = 1
+            dates = df['date']
+            known = dates.notna()
+            too_old = pd.Series(False, index = df.index)
+            too_old[known] = dates[known] < cutoff_date
+            self.flag_filtered(df, too_old, 'max_age')
         
 
         # Language filter
             # Filter if the job description is not in the languages corresponding to the preferences
-        if "languages" in filters:
+        if "languages" in filters and (self.language_prescreen is not None or self.language_detector is not None):
+            allowed_languages = preferences.get('languages', ['en'])
+            languages = self.detect_languages(df, allowed_languages)
+            self.flag_filtered(df, languages.notna() & ~languages.isin(allowed_languages), 'languages')
+        elif "languages" in filters:
             allowed_languages = preferences.get('languages', ['en'])
             for idx, row in df.iterrows():
                 description_value = row.get('description')
@@ -114,21 +216,12 @@ class JobScraper:
 
         # Description filter
             # Filter if the job description does not contain any of the words in the description_words_include corresponding to the preferences
-        if "description" in filters:
-            description_words_include = preferences.get('description_words_include', [])
-            for idx, row in df.iterrows():
-                description_value = row.get('description')
-                if description_value is not None:
-                    try:
-                        description = str(description_value)
-                        if description.strip() and description.lower() not in ['nan', 'none', '']:
-                            has_required_word = any(word.lower() in description.lower() for word in description_words_include)
-                            if not has_required_word:
-                                self.logger.debug("Job description filtered out by filter 'description'")
-                                df.at[idx, 'filtered'] = 1
-                    except (ValueError, TypeError):
-                        self.logger.debug("Job description filtered out by filter 'description' (invalid data)")
-                        df.at[idx, 'filtered'] = 1
+        if "description" in filters and 'description' in df.columns:
+            descriptions = self.lowered_text(df['description'])
+            # Missing descriptions (None, NaN, blank) are not filtered
+            has_description = descriptions.str.strip().ne('') & ~descriptions.isin(['nan', 'none'])
+            has_required_word = self.contains_any(descriptions, preferences.get('description_words_include', []))
+            self.flag_filtered(df, has_description & ~has_required_word, 'description')
 
 
         # Remove filtered jobs from DataFrame
@@ -143,55 +236,528 @@ class JobScraper:
     def remove_existing_jobs(self, df: pd.DataFrame, es_index: str) -> pd.DataFrame:
         """
         Remove existing jobs from the DataFrame.
+        Jobs are looked up by their exact 'job_url' (a keyword field), 'dedup_batch_size'
+        URLs per request. Each request aggregates the URLs found, so it returns every
+        existing job once however many documents match.
         Args:
             df (pd.DataFrame): The DataFrame to remove existing jobs from.
             es_index (str): The index to remove existing jobs from.
         Returns:
             pd.DataFrame: The DataFrame with existing jobs removed.
         """
-        # Query to find already existing jobs (based on title, company and date)
-        should_clauses = []
-        for _, job in df.iterrows():
-            should_clauses.append({
-                "bool": {
-                    "must": [
-                        {"match": {"title": job['title']}},
-                        {"match": {"company": job['company']}},
-                        {"match": {"date": job['date']}}
-                    ]
-                }
-            })
-        
-        if should_clauses:
+        job_urls = df['job_url'].dropna().astype(str).unique().tolist() if 'job_url' in df.columns else []
+        if not job_urls:
+            return df
+
+        batch_size = self.config.get('dedup_batch_size', 1000)
+        existing_urls = set()
+        for start in range(0, len(job_urls), batch_size):
+            batch = job_urls[start:start + batch_size]
             query = {
-                "query": {
-                    "bool": {
-                        "should": should_clauses,
-                        "minimum_should_match": 1
-                    }
-                },
-                "size": 10000
+                "size": 0,
+                "query": {"terms": {"job_url": batch}},
+                "aggs": {"existing": {"terms": {"field": "job_url", "size": len(batch)}}}
             }
-        
-        else:
+            existing_results = self.backend.search(query = query, index = es_index)
+            buckets = existing_results.get('aggregations', {}).get('existing', {}).get('buckets', [])
+            existing_urls.update(bucket['key'] for bucket in buckets)
+
+        # Filter out jobs that already exist (same job URL)
+        return df[~df['job_url'].isin(existing_urls)]
+
+    
+    def prepare_jobs(self, job_cards: list) -> pd.DataFrame:
+        """
+        Build the jobs DataFrame from scraped job cards.
+        Args:
+            job_cards (list): Job cards returned by the scraping engine.
+        Returns:
+            pd.DataFrame: Jobs with parsed dates and a 'filtered' column.
+        """
+        jobs_df = pd.DataFrame(job_cards)
+        if jobs_df.empty:
+            return jobs_df
+        # Convert date to datetime
+        jobs_df['date'] = pd.to_datetime(jobs_df['date'], format = '%Y-%m-%d', errors = 'coerce')
+        # Create col for filtered jobs (False by default)
+        jobs_df['filtered'] = 0
+        return jobs_df
+
+
+    def screen_jobs(self, jobs_df: pd.DataFrame, preferences: dict) -> pd.DataFrame:
+        """
+        Apply the filters that do not need a job description and drop jobs already in the database.
+        Args:
+            jobs_df (pd.DataFrame): The jobs to screen.
+            preferences (dict): The user preferences.
+        Returns:
+            pd.DataFrame: The jobs worth requesting a description for.
+        """
+        jobs_df = self.apply_filters(jobs_df,
+                                     preferences,
+                                     filters = ["title", "company", "max_age"],
+                                     remove_filtered = True)
+        if self.resumed_urls:
+            jobs_df = jobs_df[~jobs_df['job_url'].isin(self.resumed_urls)]
+        if jobs_df.empty:
+            return jobs_df
+
+        # Remove existing jobs from the DataFrame
+        self.logger.debug("Removing existing jobs from the DataFrame")
+        if not self.checks_existing():
+            # The create-only ingest rejects duplicates, the seen index still spares their descriptions
+            if self.seen_postings is not None and self.seen_postings.ready:
+                return jobs_df[~self.seen_mask(jobs_df)]
+            return jobs_df
+        if self.seen_postings is not None and self.seen_postings.ready:
+            return self.remove_seen_jobs(jobs_df,
+                                         es_index = "jobs")
+        return self.remove_existing_jobs(jobs_df,
+                                         es_index = "jobs")
+
+
+    @staticmethod
+    def get_posting_ids(jobs_df: pd.DataFrame) -> pd.Series:
+        """
+        Read the LinkedIn job posting ids from the job URLs.
+        Args:
+            jobs_df (pd.DataFrame): Jobs with a 'job_url' column.
+        Returns:
+            pd.Series: Numeric posting ids, NaN when a URL does not end with one.
+        """
+        ids = jobs_df['job_url'].astype(str).str.rstrip('/').str.rsplit('/', n = 1).str[-1]
+        return pd.to_numeric(ids, errors = 'coerce')
+
+
+    def checks_existing(self) -> bool:
+        """
+        Tell whether jobs are looked up in the database before being described.
+        The lookup can only be skipped ('check_existing' false) with the create-only ingest.
+        Returns:
+            bool: True if existing jobs are removed by a database query.
+        """
+        return self.config.get('check_existing', True) or not self.config.get('create_only', False)
+
+
+    def seen_mask(self, df: pd.DataFrame):
+        """
+        Tell which jobs have their posting id in the local seen index.
+        Args:
+            df (pd.DataFrame): Jobs with a 'job_url' column.
+        Returns:
+            np.ndarray: Boolean mask aligned with df rows (False without a posting id).
+        """
+        ids = self.get_posting_ids(df)
+        valid = ids.notna().to_numpy()
+        seen = valid.copy()
+        seen[valid] = self.seen_postings.contains(ids[valid].astype('int64'))
+        return seen
+
+
+    @staticmethod
+    def count_conflicts(response) -> int:
+        """
+        Count the documents of a create-only bulk insertion that were already in the database.
+        Args:
+            response: Bulk operation response.
+        Returns:
+            int: The number of 409 conflicts.
+        """
+        body = getattr(response, 'body', response)
+        if not isinstance(body, dict):
+            return 0
+        return sum(1 for item in body.get('items', []) if item.get('create', {}).get('status') == 409)
+
+
+    def remove_seen_jobs(self, df: pd.DataFrame, es_index: str) -> pd.DataFrame:
+        """
+        Remove existing jobs, querying the database only for the postings of the local seen index.
+        Postings missing from the index are new; the others are checked with remove_existing_jobs.
+        Args:
+            df (pd.DataFrame): The DataFrame to remove existing jobs from.
+            es_index (str): The index to remove existing jobs from.
+        Returns:
+            pd.DataFrame: The DataFrame with existing jobs removed.
+        """
+        # URLs without a posting id cannot be looked up locally
+        maybe_known = self.seen_mask(df) | self.get_posting_ids(df).isna().to_numpy()
+
+        candidates = df[maybe_known]
+        self.logger.debug(f"Seen postings index: {len(df) - len(candidates)} new jobs, {len(candidates)} to check in the database")
+        if candidates.empty:
             return df
+        remaining = self.remove_existing_jobs(candidates, es_index = es_index)
+        return df[~maybe_known | df.index.isin(remaining.index)]
+
+
+    def load_seen_postings(self) -> None:
+        """
+        Build the seen postings index from the database, the first time it is used or when
+        the database no longer matches it, and share it with the scraping engine to stop
+        paging through known postings.
+        Until it is built, every job is checked against the database.
+        """
+        if self.seen_postings is None:
+            return
+        try:
+            identity = self.backend.index_identity(index = "jobs")
+        except Exception as e:
+            if self.seen_postings.ready:
+                self.logger.warning(f"Seen postings index not checked against the database: {e}")
+                self.share_seen_postings()
+            else:
+                self.logger.warning(f"Seen postings index not built, jobs are checked in the database: {e}")
+            return
+
+        if self.seen_postings.ready:
+            if identity is not None and identity == self.seen_postings.identity:
+                self.share_seen_postings()
+                return
+            # Reset index, or postings written by another scraper
+            self.logger.warning(f"Seen postings index out of sync with the database ({self.seen_postings.identity} != {identity}), rebuilding it")
+            self.seen_postings.reset()
+
+        self.logger.info("Building the seen postings index from the database")
+        try:
+            job_urls = pd.DataFrame({'job_url': list(self.backend.scan_field(index = "jobs", field = "job_url"))})
+        except Exception as e:
+            self.logger.warning(f"Seen postings index not built, jobs are checked in the database: {e}")
+            return
+        self.seen_postings.add(self.get_posting_ids(job_urls).dropna().astype('int64'))
+        self.logger.info(f"Seen postings index built with {self.seen_postings.save()} postings")
+        self.seen_postings.stamp(identity)
+        self.share_seen_postings()
+
+
+    def stamp_seen_postings(self) -> None:
+        """
+        Record the identity of the database at the end of a run, once the postings the run inserted are in the index.
+        """
+        if self.seen_postings is None or not self.seen_postings.ready:
+            return
+        try:
+            self.seen_postings.stamp(self.backend.index_identity(index = "jobs"))
+        except Exception as e:
+            # The next run rebuilds the index
+            self.logger.warning(f"Seen postings index not stamped: {e}")
+            self.seen_postings.stamp(None)
+
+
+    def share_seen_postings(self) -> None:
+        """
+        Attach the seen postings index to the scraping engine, when the engine can use it.
+        """
+        if hasattr(self.scrap_engine, 'seen_postings'):
+            self.scrap_engine.seen_postings = self.seen_postings
 
-        existing_results = self.backend.search(query = query, index = es_index)
-        existing_combinations = set()
 
-        if existing_results.get('hits', {}).get('hits'):
-            for hit in existing_results['hits']['hits']:
-                source = hit['_source']
-                existing_combinations.add((source.get('title', ''), source.get('company', ''), source.get('date', '')))
+    @classmethod
+    def predict_title_language(cls, title: str):
+        """
+        Predict the language of a job posting from the gender marker of its title.
+        Args:
+            title (str): The job title.
+        Returns:
+            str: The predicted language code, or None if the title gives no hint.
+        """
+        for language, marker in cls.TITLE_LANGUAGE_MARKERS.items():
+            if marker.search(str(title)):
+                return language
+        return None
+
+
+    def score_jobs(self, jobs_df: pd.DataFrame, preferences: dict) -> pd.Series:
+        """
+        Score how promising each job card is, from its title, company and date.
+        Args:
+            jobs_df (pd.DataFrame): The screened jobs.
+            preferences (dict): The user preferences.
+        Returns:
+            pd.Series: The score of each job, aligned with jobs_df (higher is better).
+        """
+        title_include = [word.lower() for word in preferences.get('title_include', [])]
+        description_words = [word.lower() for word in preferences.get('description_words_include', [])]
+        max_age_days = preferences.get('max_age', 7)
+
+        def score(row) -> float:
+            title = str(row['title']).lower()
+            card_text = f"{title} {str(row['company']).lower()}"
+            # Title keywords weigh most, description keywords already visible on the card next
+            value = 2.0 * sum(word in title for word in title_include)
+            value += sum(word in card_text for word in description_words)
+            # Fresh postings first among equals
+            if pd.notna(row['date']) and max_age_days:
+                age_days = (datetime.now() - row['date']).days
+                value += max(0.0, 1.0 - age_days / max_age_days)
+            return value
+
+        return jobs_df.apply(score, axis = 1)
+
+
+    def schedule_descriptions(self, jobs_df: pd.DataFrame, preferences: dict) -> tuple:
+        """
+        Decide which job descriptions to request, and in which order.
+        With 'title_prescreen', cards whose title gives away a language outside of the
+        preferences are not fetched. The others are sorted by score ('prioritize_descriptions')
+        and cut to the remaining run budget ('description_budget'); cards over budget are
+        left for a later run.
+        Args:
+            jobs_df (pd.DataFrame): The screened jobs.
+            preferences (dict): The user preferences.
+        Returns:
+            tuple: (jobs to describe, in fetch order; jobs rejected by the title pre-screen).
+        """
+        prescreened = jobs_df.iloc[0:0]
+        if self.config.get('title_prescreen', False) and not jobs_df.empty:
+            allowed_languages = preferences.get('languages', ['en'])
+            predicted = jobs_df['title'].map(self.predict_title_language)
+            rejected = predicted.notna() & ~predicted.isin(allowed_languages)
+            prescreened = jobs_df[rejected].copy()
+            jobs_df = jobs_df[~rejected]
+
+        if self.config.get('prioritize_descriptions', True) and len(jobs_df) > 1:
+            scores = self.score_jobs(jobs_df, preferences)
+            jobs_df = jobs_df.loc[scores.sort_values(ascending = False, kind = 'stable').index]
+
+        deferred = 0
+        if self.descriptions_left is not None:
+            deferred = max(0, len(jobs_df) - self.descriptions_left)
+            jobs_df = jobs_df.iloc[:self.descriptions_left]
+            self.descriptions_left -= len(jobs_df)
+            self.descriptions_deferred += deferred
+
+        self.logger.info(f"Description schedule: {len(jobs_df)} to fetch, {len(prescreened)} rejected from the title, "
+                         f"{deferred} deferred by the budget")
+        return jobs_df.copy(), prescreened
+
+
+    def describe_and_index(self, bs_engine, jobs_df: pd.DataFrame, preferences: dict) -> int:
+        """
+        Schedule, fetch and index the descriptions of screened jobs.
+        Jobs rejected by the title pre-screen are indexed as filtered, without a description.
+        Args:
+            bs_engine: The open scraping engine.
+            jobs_df (pd.DataFrame): The screened jobs.
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
+        to_describe, prescreened = self.schedule_descriptions(jobs_df, preferences)
+        return self.describe_scheduled(bs_engine, to_describe, prescreened, preferences)
+
+
+    def describe_scheduled(self, bs_engine, to_describe: pd.DataFrame, prescreened: pd.DataFrame, preferences: dict) -> int:
+        """
+        Fetch and index the descriptions of jobs already scheduled by schedule_descriptions.
+        Args:
+            bs_engine: The open scraping engine.
+            to_describe (pd.DataFrame): The jobs to describe, in fetch order.
+            prescreened (pd.DataFrame): The jobs rejected by the title pre-screen.
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
+        job_descriptions = []
+        if not to_describe.empty:
+            if self.frontier is not None:
+                self.frontier.queue_descriptions(to_describe.to_dict(orient = 'records'))
+            self.logger.debug(f"Requesting job descriptions for {len(to_describe)} jobs")
+            job_descriptions = bs_engine.get_job_descriptions([url for url in to_describe['job_url']])
+
+        if not prescreened.empty:
+            prescreened['filtered'] = 1
+            to_describe = pd.concat([to_describe, prescreened])
+            job_descriptions = list(job_descriptions) + [None] * len(prescreened)
+        if to_describe.empty:
+            return 0
+        inserted = self.index_jobs(to_describe, job_descriptions, preferences)
+        if self.frontier is not None:
+            self.frontier.complete_descriptions(list(to_describe['job_url']))
+        return inserted
+
+
+    def index_jobs(self, jobs_df: pd.DataFrame, job_descriptions: list, preferences: dict) -> int:
+        """
+        Attach descriptions, apply the description based filters and insert the jobs into the database.
+        Args:
+            jobs_df (pd.DataFrame): The jobs to index.
+            job_descriptions (list): Descriptions aligned with jobs_df rows.
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
+        jobs_df['description'] = job_descriptions
+
+        # Apply filters: language, description
+        self.logger.debug("Applying filters: language, description")
+        filters = ["languages", "description"]
+        jobs_df = self.apply_filters(jobs_df,
+                                     preferences,
+                                     filters)
         
-        # Filter out jobs that already exist (same title, company and date)
-        df = df[~df.apply(lambda row: (row['title'], row['company'], row['date']) in existing_combinations, axis=1)]
+        # Add additional columns: interest, applied, interview, rejected, hidden
+        self.logger.debug("Adding additional columns: interest, applied, interview, rejected, hidden")
+        jobs_df['interest'] = 0
+        jobs_df['applied'] = 0
+        jobs_df['interview'] = 0
+        jobs_df['rejected'] = 0
+        jobs_df['hidden'] = 0
+
+        # Insert jobs into the database, a bounded number of records at a time
+        self.logger.debug("Inserting jobs into the database")
+        insert_batch_size = max(1, int(self.config.get('insert_batch_size', 500)))
+        create_only = self.config.get('create_only', False)
+        track_seen = self.seen_postings is not None and self.seen_postings.ready
+        conflicts = 0
+        try:
+            for start in range(0, len(jobs_df), insert_batch_size):
+                batch_df = jobs_df.iloc[start:start + insert_batch_size]
+                if create_only:
+                    # The posting id is the document id: a known job is rejected, not duplicated
+                    ids = [str(int(posting_id)) if pd.notna(posting_id) else None for posting_id in self.get_posting_ids(batch_df)]
+                    response = self.backend.insert_bulk_data(data = batch_df.to_dict(orient = 'records'),
+                                                             index = "jobs",
+                                                             ids = ids,
+                                                             create_only = True)
+                    conflicts += self.count_conflicts(response)
+                else:
+                    self.backend.insert_bulk_data(data = batch_df.to_dict(orient = 'records'),
+                                                  index = "jobs")
+                # Inserted postings are known from now on
+                if track_seen:
+                    self.seen_postings.add(self.get_posting_ids(batch_df).dropna().astype('int64'))
+        finally:
+            if track_seen:
+                self.seen_postings.save()
+        if conflicts:
+            self.logger.info(f"{conflicts} jobs already in the database were not inserted again")
+        return len(jobs_df) - conflicts
 
-        return df
 
-    
     @ExecutionTime
-    def execute_scraper(self, preferences: dict) -> None:
+    def execute_scraper(self, preferences: dict, resume: bool = False) -> None:
+        """
+        Run a complete scraping session.
+        Args:
+            preferences (dict): The user preferences.
+            resume (bool): Continue the unfinished run checkpointed by the engine, if any.
+        """
+        self.descriptions_left = self.config.get('description_budget')
+        self.descriptions_deferred = 0
+        self.resumed_urls = set()
+        if not preferences.get('description_words_include'):
+            self.logger.warning("No 'description_words_include' in the preferences, every described job will be flagged by the 'description' filter")
+        self.frontier = self.begin_checkpoint(resume)
+        self.load_seen_postings()
+        inserted = 0
+        if resume and self.frontier is not None:
+            inserted += self.describe_pending(preferences)
+
+        # Streaming mode: cards are screened and indexed while the search goes on
+        if self.config.get('streaming', False):
+            inserted += self.execute_streaming_scraper(preferences)
+        else:
+            inserted += self.execute_batch_scraper(preferences)
+
+        # Every run reports its traffic, including the runs that found nothing new, once for all its sessions
+        self.scrap_engine.log_run_stats()
+        self.log_transfer_cost(inserted)
+        self.stamp_seen_postings()
+        # Only a run that went through is dropped from the checkpoint and moves the high-water marks
+        self.commit_high_water_marks()
+        if self.language_prescreen is not None:
+            self.logger.info(f"Language prescreen: {self.language_prescreen.summary()}")
+        if self.language_detector is not None:
+            self.logger.info(f"Language detection: {self.language_detector.summary()}")
+            self.language_detector.shutdown_pool()
+        if self.frontier is not None:
+            self.logger.info(f"Checkpoint: {self.frontier.summary()}")
+            self.frontier.finish()
+        return
+
+
+    def commit_high_water_marks(self) -> None:
+        """
+        Save the newest postings seen by the run as the high-water marks of their search queries.
+        The marks are left where they were when the description budget deferred jobs,
+        so that the next run searches their window again.
+        """
+        high_water_marks = getattr(self.scrap_engine, 'high_water_marks', None)
+        if not isinstance(high_water_marks, HighWaterMarks):
+            return
+        if self.descriptions_deferred:
+            high_water_marks.discard()
+            self.logger.info(f"High-water marks not moved: {self.descriptions_deferred} descriptions deferred by the budget")
+            return
+        count = high_water_marks.commit()
+        self.logger.info(f"High-water marks saved for {count} search queries")
+
+
+    def begin_checkpoint(self, resume: bool) -> Optional[CrawlFrontier]:
+        """
+        Start the checkpoint of the run, when the scraping engine has one.
+        Args:
+            resume (bool): Replay the records of the unfinished previous run instead of discarding them.
+        Returns:
+            Optional[CrawlFrontier]: The crawl frontier of the engine, or None.
+        """
+        frontier = getattr(self.scrap_engine, 'frontier', None)
+        if not isinstance(frontier, CrawlFrontier):
+            if resume:
+                self.logger.warning("Checkpointing is disabled, nothing to resume")
+            return None
+
+        unfinished = frontier.is_unfinished()
+        available = frontier.begin(resume)
+        if resume and unfinished:
+            self.logger.info(f"Resuming the previous run: {available} checkpointed responses, "
+                             f"{len(frontier.pending_descriptions())} descriptions pending")
+        elif resume:
+            self.logger.info("No unfinished run to resume, starting a new one")
+        elif unfinished:
+            self.logger.warning("Discarding the checkpoint of an unfinished run (use --resume to continue it)")
+        return frontier
+
+
+    def describe_pending(self, preferences: dict) -> int:
+        """
+        Describe and index the jobs the interrupted run had queued for a description, before searching again.
+        The search of the resumed run then skips them.
+        Args:
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
+        cards = self.frontier.pending_descriptions()
+        if not cards:
+            return 0
+        jobs_df = pd.DataFrame(cards)
+        # Dates were queued as timestamps
+        jobs_df['date'] = pd.to_datetime(jobs_df['date'], errors = 'coerce')
+        jobs_df['filtered'] = 0
+        # The interrupted run may have indexed some of them before it stopped
+        jobs_df = self.screen_jobs(jobs_df, preferences)
+        kept = set(jobs_df['job_url']) if 'job_url' in jobs_df.columns else set()
+        self.frontier.complete_descriptions([card['job_url'] for card in cards if card['job_url'] not in kept])
+        if jobs_df.empty:
+            return 0
+
+        with self.scrap_engine as bs_engine:
+            inserted = self.describe_and_index(bs_engine, jobs_df, preferences)
+        # The replayed search finds the same cards again
+        self.resumed_urls = set(jobs_df['job_url'])
+        self.logger.info(f"Resumed {len(jobs_df)} pending descriptions, {inserted} new jobs inserted")
+        return inserted
+
+
+    def execute_batch_scraper(self, preferences: dict) -> int:
+        """
+        Scrape every job card first, then screen, describe and index the new jobs at once.
+        Args:
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
         # Get job cards (one shot research)
         self.logger.info("Starting job scraping")
         with self.scrap_engine as bs_engine:
@@ -199,72 +765,121 @@ class JobScraper:
 
         # Insert jobs in a DataFrame
         self.logger.debug("Inserting jobs in a DataFrame")
-        jobs_df = pd.DataFrame(job_cards)
+        jobs_df = self.prepare_jobs(job_cards)
+        # The DataFrame is the only copy of the cards from now on
+        del job_cards
         self.logger.debug(f"Jobs DataFrame: {jobs_df.head()}")
 
         # DF check length checkpoint
         if not self.check_len_df(jobs_df):
-            return
+            return 0
 
         # Continue if jobs found
         self.logger.debug(f"Found {len(jobs_df)} job cards from scraping")
-        # Convert date to datetime
-        jobs_df['date'] = pd.to_datetime(jobs_df['date'], format = '%Y-%m-%d', errors = 'coerce')
-        # Create col for filtered jobs (False by default)
-        jobs_df['filtered'] = 0
 
         # Apply a first batch of filters to avoid duplicates and scraping job descriptions that are already in the database
         self.logger.debug("Applying first batch of filters to avoid duplicates and scraping job descriptions that are already in the database")
         jobs_df = jobs_df.drop_duplicates(subset = ['title', 'company'], keep = 'first')
         jobs_df = jobs_df.drop_duplicates(subset = ['job_url'], keep = 'first')
-        jobs_df = self.apply_filters(jobs_df,
-                                     preferences,
-                                     filters = ["title", "company", "max_age"],
-                                     remove_filtered = True)
+        jobs_df = self.screen_jobs(jobs_df, preferences)
         
         # DF check length checkpoint
         if not self.check_len_df(jobs_df):
-            return
-        
-        # Remove existing jobs from the DataFrame
-        self.logger.debug("Removing existing jobs from the DataFrame")
-        jobs_df = self.remove_existing_jobs(jobs_df,
-                                            es_index = "jobs")
-        
-        
-        # DF check length checkpoint
-        if not self.check_len_df(jobs_df):
-            return
+            return 0
 
-        # Request job descriptions
+        # Request job descriptions, most promising first
         self.logger.debug("Requesting job descriptions")
         with self.scrap_engine as bs_engine:
-            job_descriptions = bs_engine.get_job_descriptions([url for url in jobs_df['job_url']])
+            inserted = self.describe_and_index(bs_engine, jobs_df, preferences)
 
-        jobs_df['description'] = job_descriptions
+        self.logger.info(f"Successfully inserted {inserted} new jobs into database")
+        return inserted
 
 
-        # Apply filters: language, description
-        self.logger.debug("Applying filters: language, description")
-        filters = ["languages", "description"]
-        jobs_df = self.apply_filters(jobs_df,
-                                     preferences,
-                                     filters)
-        
-        # Add additional columns: interest, applied, interview, rejected, hidden
-        self.logger.debug("Adding additional columns: interest, applied, interview, rejected, hidden")
-        jobs_df['interest'] = 0
-        jobs_df['applied'] = 0
-        jobs_df['interview'] = 0
-        jobs_df['rejected'] = 0
-        jobs_df['hidden'] = 0
+    def execute_streaming_scraper(self, preferences: dict) -> int:
+        """
+        Scrape, screen and index jobs incrementally.
+        Job cards are deduplicated and filtered page by page; survivors are described
+        and inserted in micro-batches of 'micro_batch_size' jobs, so the first new jobs
+        reach the database while the search is still running.
+        With a 'description_budget', the survivors are held until the search is over so
+        that the budget goes to the best cards of the whole run, not to the first ones.
+        Args:
+            preferences (dict): The user preferences.
+        Returns:
+            int: The number of inserted jobs.
+        """
+        micro_batch_size = max(1, int(self.config.get('micro_batch_size', 25)))
+        budgeted = self.descriptions_left is not None
+        seen_urls = set()
+        seen_title_company = set()
+        pending = []
+        inserted = 0
+        start = time.time()
+
+        self.logger.info("Starting job scraping (streaming)")
+        with self.scrap_engine as bs_engine:
 
+            def flush() -> int:
+                batch_df = pd.concat(pending, ignore_index = True)
+                pending.clear()
+                self.logger.debug(f"Describing a micro-batch of {len(batch_df)} jobs")
+                count = self.describe_and_index(bs_engine, batch_df, preferences)
+                if count and not inserted:
+                    self.logger.info(f"First {count} new jobs indexed {time.time() - start:.1f} seconds after start")
+                return count
+
+            for page in bs_engine.iter_jobcards(preferences):
+                # Incremental equivalent of drop_duplicates on (title, company) and job_url
+                new_cards = []
+                for card in page:
+                    key = (card['title'], card['company'])
+                    if card['job_url'] in seen_urls or key in seen_title_company:
+                        continue
+                    seen_urls.add(card['job_url'])
+                    seen_title_company.add(key)
+                    new_cards.append(card)
+
+                if not new_cards:
+                    continue
+
+                jobs_df = self.screen_jobs(self.prepare_jobs(new_cards), preferences)
+                if not jobs_df.empty:
+                    pending.append(jobs_df)
+
+                if not budgeted and sum(len(df) for df in pending) >= micro_batch_size:
+                    inserted += flush()
+
+            if pending and budgeted:
+                # One schedule for the whole run, then the same micro-batches for the fetches
+                to_describe, prescreened = self.schedule_descriptions(pd.concat(pending, ignore_index = True), preferences)
+                pending.clear()
+                inserted += self.describe_scheduled(bs_engine, to_describe.iloc[:micro_batch_size], prescreened, preferences)
+                for offset in range(micro_batch_size, len(to_describe), micro_batch_size):
+                    inserted += self.describe_scheduled(bs_engine, to_describe.iloc[offset:offset + micro_batch_size],
+                                                        prescreened.iloc[0:0], preferences)
+            elif pending:
+                inserted += flush()
+
+        if not seen_urls:
+            self.logger.warning("No jobs found from scraping or all jobs were filtered out")
+        self.logger.info(f"Successfully inserted {inserted} new jobs into database")
+        return inserted
 
 
-        # Insert jobs into the database
-        self.logger.debug("Inserting jobs into the database")
-        self.backend.insert_bulk_data(data = jobs_df.to_dict(orient = 'records'),
-                                      index = "jobs")
+    def log_transfer_cost(self, inserted: int) -> None:
+        """
+        Log the bytes transferred by the run, by page type, and per newly inserted job.
+        Args:
+            inserted (int): The number of jobs inserted by the run.
+        """
+        transfer_stats = getattr(self.scrap_engine, 'transfer_stats', None)
+        if not isinstance(transfer_stats, TransferStats) or not transfer_stats.counters:
+            return
 
-        self.logger.info(f"Successfully inserted {len(jobs_df)} new jobs into database")
-        return
\ No newline at end of file
+        totals = transfer_stats.totals()
+        saved = 1 - totals['wire_bytes'] / totals['body_bytes'] if totals['body_bytes'] else 0.0
+        self.logger.info(f"Transferred {totals['wire_bytes'] / 1024 / 1024:.2f} MiB for {totals['body_bytes'] / 1024 / 1024:.2f} MiB of HTML "
+                         f"({saved:.0%} saved by compression): {transfer_stats.summary()}")
+        if inserted:
+            self.logger.info(f"Transfer cost: {totals['wire_bytes'] / inserted / 1024:.1f} KiB per new job")
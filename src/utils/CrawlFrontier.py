@@ -0,0 +1,193 @@
+# src/utils/CrawlFrontier.py
+
+"""
+SQLite checkpoint of a scraping run, so that an interrupted run can be resumed.
+
+Every page extracted during a run (the job cards of a search page, the text of a
+job description) is written to the store as soon as it is parsed, together with the
+job cards waiting for their description. A run that dies halfway leaves its frontier
+behind: resuming it first describes the pending job cards, then replays the stored
+records instead of sending the requests again, and only the pages that were never
+fetched go to the network.
+
+The same URL can be requested more than once in a run (one search per round), so
+records are keyed by URL and by occurrence: on resume, the n-th request of a URL
+replays the n-th record of that URL.
+
+Usage:
+from src.utils.CrawlFrontier import CrawlFrontier
+
+frontier = CrawlFrontier("./data/frontier.sqlite")
+frontier.begin(resume = True)
+data = frontier.replay(url)
+if data is CrawlFrontier.MISSING:
+    data = parse(download(url))
+    frontier.record(url, 'job_cards', data)
+frontier.finish()
+"""
+
+from collections import Counter
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class CrawlFrontier:
+    """Persisted records and pending descriptions of the current run."""
+
+    # Returned by replay when the request has not been checkpointed
+    MISSING = object()
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS run (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS records (
+            url TEXT NOT NULL,
+            occurrence INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            data TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (url, occurrence)
+        );
+        CREATE TABLE IF NOT EXISTS pending (job_url TEXT PRIMARY KEY, card TEXT NOT NULL, queued_at REAL NOT NULL);
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the checkpoint database.
+
+        Args:
+            path (str): SQLite file holding the frontier.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        self.lock = threading.Lock()
+        # Shared by the fetch threads, every access holds the lock
+        self.connection = sqlite3.connect(str(self.path), check_same_thread = False, isolation_level = None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(self.SCHEMA)
+        self.occurrences = Counter()
+        self.replayed = 0
+        self.recorded = 0
+
+    @classmethod
+    def from_config(cls, checkpoint_config: Optional[dict]) -> Optional['CrawlFrontier']:
+        """Create the frontier if checkpointing is enabled in the configuration.
+
+        Args:
+            checkpoint_config (dict, optional): The 'checkpoint' section of the engine configuration.
+
+        Returns:
+            Optional[CrawlFrontier]: The frontier, or None if disabled.
+        """
+        if not checkpoint_config or not checkpoint_config.get('enabled', False):
+            return None
+        return cls(checkpoint_config.get('path', './data/frontier.sqlite'))
+
+    def is_unfinished(self) -> bool:
+        """Return True if the store holds a run that was started and never finished."""
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM run WHERE key = 'status'").fetchone()
+        return row is not None and row[0] == 'running'
+
+    def begin(self, resume: bool = False) -> int:
+        """Start a run, resuming the unfinished one if asked to.
+
+        Args:
+            resume (bool): Keep the records of an unfinished run, to replay them.
+
+        Returns:
+            int: The number of records available for replay.
+        """
+        keep = resume and self.is_unfinished()
+        with self.lock:
+            if not keep:
+                self.connection.execute("DELETE FROM records")
+                self.connection.execute("DELETE FROM pending")
+            self.connection.execute("INSERT OR REPLACE INTO run (key, value) VALUES ('status', 'running')")
+            self.connection.execute("INSERT OR REPLACE INTO run (key, value) VALUES ('started_at', ?)", (str(time.time()),))
+            self.occurrences.clear()
+            self.replayed = 0
+            self.recorded = 0
+            return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def finish(self) -> None:
+        """Mark the run as complete and drop its records."""
+        with self.lock:
+            self.connection.execute("DELETE FROM records")
+            self.connection.execute("DELETE FROM pending")
+            self.connection.execute("INSERT OR REPLACE INTO run (key, value) VALUES ('status', 'finished')")
+
+    def replay(self, url: str):
+        """Return the checkpointed record of the next request of a URL.
+
+        Every call counts as one request of the URL, whether a record is found or not.
+
+        Args:
+            url (str): Requested URL.
+
+        Returns:
+            The stored data, or CrawlFrontier.MISSING if this request was not checkpointed.
+        """
+        with self.lock:
+            self.occurrences[url] += 1
+            row = self.connection.execute("SELECT data FROM records WHERE url = ? AND occurrence = ?",
+                                          (url, self.occurrences[url])).fetchone()
+            if row is None:
+                return self.MISSING
+            self.replayed += 1
+        return json.loads(row[0])
+
+    def record(self, url: str, type: str, data) -> None:
+        """Checkpoint the data extracted from the last request of a URL.
+
+        Args:
+            url (str): Requested URL, after a call to replay.
+            type (str): Type of page ('job_cards' or 'job_descriptions').
+            data: JSON serializable extracted data.
+        """
+        # Job cards are mappings, stored as JSON objects
+        payload = json.dumps(data, default = dict)
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO records (url, occurrence, type, data, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                                    (url, max(self.occurrences[url], 1), type, payload, time.time()))
+            self.recorded += 1
+
+    def queue_descriptions(self, cards: List[Dict]) -> None:
+        """Remember job cards waiting for their description.
+
+        Args:
+            cards (List[Dict]): Job cards, with a 'job_url' key.
+        """
+        now = time.time()
+        with self.lock:
+            self.connection.executemany("INSERT OR REPLACE INTO pending (job_url, card, queued_at) VALUES (?, ?, ?)",
+                                        [(card['job_url'], json.dumps(card, default = str), now) for card in cards])
+
+    def complete_descriptions(self, job_urls: List[str]) -> None:
+        """Remove job cards from the pending descriptions, once indexed.
+
+        Args:
+            job_urls (List[str]): URLs of the indexed jobs.
+        """
+        with self.lock:
+            self.connection.executemany("DELETE FROM pending WHERE job_url = ?", [(url,) for url in job_urls])
+
+    def pending_descriptions(self) -> List[Dict]:
+        """Return the job cards still waiting for their description, in queue order."""
+        with self.lock:
+            rows = self.connection.execute("SELECT card FROM pending ORDER BY queued_at, rowid").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def summary(self) -> str:
+        """Return a one-line summary of the checkpoint activity of the run."""
+        with self.lock:
+            pending = self.connection.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+        return f"{self.replayed} responses replayed, {self.recorded} checkpointed, {pending} descriptions pending"
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,173 @@
+# src/utils/DescriptionExtractor.py
+
+"""
+Fast extraction of the job description text from a raw job page.
+
+Locates the 'description__text description__text--rich' block in the response body
+with regular expressions, then tokenizes only that block in a single pass. It returns
+the same text as the BeautifulSoup path of BeautifulSoupEngine.cook_soup, without
+building a tree. That means: span and a subtrees removed, one '-' per enclosing ul
+before each li, text nodes joined with newlines, then the same clean-up.
+
+When the markup is not something both paths are known to agree on (unbalanced
+tags, comments, scripts, preformatted text...), extract returns None and the caller
+falls back to BeautifulSoup.
+
+Usage:
+from src.utils.DescriptionExtractor import DescriptionExtractor
+
+text = DescriptionExtractor.extract(html)
+if text is None:
+    text = slow_path(html)
+"""
+
+from html.parser import HTMLParser
+import re
+from typing import Optional
+
+
+class UnexpectedMarkup(Exception):
+    """Raised when the description block cannot be extracted safely by the fast path."""
+
+
+class DescriptionExtractor(HTMLParser):
+    """Single-pass tokenizer producing the description text of cook_soup."""
+
+    DESCRIPTION_START = re.compile(r'<div\b[^>]*?\bclass\s*=\s*(["\'])description__text description__text--rich\1[^>]*>', re.IGNORECASE)
+    DIV_TAG = re.compile(r'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+    # Markup the fast path does not handle the way BeautifulSoup does
+    UNSAFE_MARKERS = ('<!--', '<![cdata[', '<?', '<!doctype')
+    UNSAFE_TAGS = {'script', 'style', 'template', 'pre', 'textarea', 'svg', 'math', 'title', 'noscript'}
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+    REMOVED_TAGS = {'span', 'a'}
+    # lxml closes an open <p> when one of these starts, html.parser nests them
+    BLOCK_TAGS = {'address', 'article', 'aside', 'blockquote', 'details', 'div', 'dl', 'fieldset', 'figure', 'footer',
+                  'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'main', 'nav', 'ol', 'p', 'section', 'table', 'ul'}
+    LIST_TAGS = {'ul', 'ol', 'menu'}
+
+    # Whitespace-only strings are collapsed by BeautifulSoup when it only contains these
+    ASCII_SPACES = frozenset('\x20\x0a\x09\x0c\x0d')
+
+    def __init__(self):
+        super().__init__(convert_charrefs = True)
+        self.stack = []
+        self.removed_depth = 0
+        self.pending = []
+        self.strings = []
+
+    @classmethod
+    def extract(cls, html: str) -> Optional[str]:
+        """Return the normalized description text of a job page.
+
+        Args:
+            html (str): Raw job page.
+
+        Returns:
+            Optional[str]: The description text, or None if the page has no description
+            block or if its markup must be handled by BeautifulSoup.
+        """
+        inner = cls.locate(html)
+        if inner is None:
+            return None
+
+        lowered = inner.lower()
+        if any(marker in lowered for marker in cls.UNSAFE_MARKERS):
+            return None
+
+        extractor = cls()
+        try:
+            extractor.feed(inner)
+            extractor.close()
+            extractor.flush()
+            if extractor.stack:
+                raise UnexpectedMarkup(f"Unclosed tags: {extractor.stack}")
+        except UnexpectedMarkup:
+            return None
+
+        return cls.normalize('\n'.join(extractor.strings).strip())
+
+    @classmethod
+    def locate(cls, html: str) -> Optional[str]:
+        """Return the inner HTML of the first description block, or None if missing or unbalanced."""
+        start = cls.DESCRIPTION_START.search(html)
+        if start is None:
+            return None
+
+        depth = 1
+        for tag in cls.DIV_TAG.finditer(html, start.end()):
+            if tag.group(0).endswith('/>'):
+                continue
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                return html[start.end():tag.start()]
+        return None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Clean-up applied to the joined description text, shared with cook_soup."""
+        text = text.replace('\n\n', '')
+        text = text.replace('::marker', '-')
+        text = text.replace('-\n', '- ')
+        text = text.replace('Show less', '').replace('Show more', '')
+        return text
+
+    def flush(self) -> None:
+        """Turn the buffered character data into one string, like BeautifulSoup does."""
+        if not self.pending:
+            return
+        data = ''.join(self.pending)
+        self.pending = []
+        if self.removed_depth or not data:
+            return
+        if all(char in self.ASCII_SPACES for char in data):
+            data = '\n' if '\n' in data else ' '
+        self.strings.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self.flush()
+        if tag in self.UNSAFE_TAGS:
+            raise UnexpectedMarkup(f"Unsupported tag: {tag}")
+        # Invalid nesting that parsers repair differently
+        if tag in self.BLOCK_TAGS and 'p' in self.stack:
+            raise UnexpectedMarkup(f"Block <{tag}> inside <p>")
+        if tag == 'a' and 'a' in self.stack:
+            raise UnexpectedMarkup("Nested <a>")
+        if tag == 'li' and (not self.stack or self.stack[-1] not in self.LIST_TAGS):
+            raise UnexpectedMarkup("<li> outside of a list")
+        if tag in self.VOID_TAGS:
+            return
+        if tag == 'li' and not self.removed_depth:
+            self.strings.extend(['-'] * self.stack.count('ul'))
+        if tag in self.REMOVED_TAGS:
+            self.removed_depth += 1
+        self.stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # '<br/>' is fine, but parsers disagree on '<span/>'
+        if tag not in self.VOID_TAGS:
+            raise UnexpectedMarkup(f"Self-closing tag: {tag}")
+        self.flush()
+
+    def handle_endtag(self, tag):
+        self.flush()
+        if not self.stack or self.stack[-1] != tag:
+            raise UnexpectedMarkup(f"Unbalanced end tag: {tag}")
+        self.stack.pop()
+        if tag in self.REMOVED_TAGS:
+            self.removed_depth -= 1
+
+    def handle_data(self, data):
+        self.pending.append(data)
+
+    def handle_comment(self, data):
+        raise UnexpectedMarkup("Comment")
+
+    def handle_decl(self, decl):
+        raise UnexpectedMarkup("Declaration")
+
+    def handle_pi(self, data):
+        raise UnexpectedMarkup("Processing instruction")
+
+    def unknown_decl(self, data):
+        raise UnexpectedMarkup("Unknown declaration")
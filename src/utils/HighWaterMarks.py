@@ -0,0 +1,182 @@
+# src/utils/HighWaterMarks.py
+
+"""
+Per-search-query high-water marks for incremental crawling.
+
+For each search query, the store keeps the newest job posting id seen and the time
+of the last completed run. The next run only asks LinkedIn for the postings
+published since then (the f_TPR window, plus an overlap), sorted newest first.
+Paging a query stops at the first page that is mostly made of postings behind the
+mark: a single older posting (a repost, a promoted job) on a page of new ones does
+not end the query.
+
+LinkedIn posting ids grow with publication time, so they order postings more finely
+than the day-resolution card dates.
+
+Marks observed during a run are only written by commit, once the run has indexed
+its jobs: an interrupted run searches the same window again. A query with a page
+that could not be fetched is discarded from the run, so its mark stays where it
+was and the next run searches its window again.
+
+Usage:
+from src.utils.HighWaterMarks import HighWaterMarks
+
+marks = HighWaterMarks("./data/high_water_marks.json", overlap = 3600)
+marks.begin()
+f_tpr = marks.window(query, "r86400")
+marks.observe(query, ['4012345678', '4012345012'])
+marks.commit()
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+class HighWaterMarks:
+    """JSON store of the newest posting id and last run time of every search query."""
+
+    MAX_AGE = re.compile(r'^r(\d+)$')
+    # Share of a page behind the mark from which the query has caught up with the previous run
+    BEHIND_SHARE = 0.5
+
+    def __init__(self, path: str, overlap: float = 3600, granularity: float = 3600):
+        """Load the marks saved by previous runs.
+
+        Args:
+            path (str): JSON file holding the marks.
+            overlap (float): Seconds added to the window, to catch postings indexed late by LinkedIn.
+            granularity (float): Windows are rounded up to a multiple of it (seconds), so that
+                the search URLs of a run resumed shortly after stay the same.
+        """
+        self.path = Path(path)
+        self.overlap = overlap
+        self.granularity = max(1, granularity)
+        self.lock = threading.Lock()
+        self.marks = json.loads(self.path.read_text(encoding = 'utf-8')) if self.path.exists() else {}
+        self.observed = {}
+        # Keys of the queries discarded during the run, left out of the commit
+        self.discarded = set()
+        self.started_at = time.time()
+
+    @classmethod
+    def from_config(cls, incremental_config: Optional[dict]) -> Optional['HighWaterMarks']:
+        """Create the store if incremental crawling is enabled in the configuration.
+
+        Args:
+            incremental_config (dict, optional): The 'incremental' section of the engine configuration.
+
+        Returns:
+            Optional[HighWaterMarks]: The store, or None if disabled.
+        """
+        if not incremental_config or not incremental_config.get('enabled', False):
+            return None
+        return cls(incremental_config.get('path', './data/high_water_marks.json'),
+                   overlap = incremental_config.get('overlap', 3600),
+                   granularity = incremental_config.get('granularity', 3600))
+
+    @staticmethod
+    def key(query: dict) -> str:
+        """Return the store key of a search query."""
+        return f"{query['keywords']}|{query['location']}|{query.get('f_WT', '')}"
+
+    def begin(self) -> None:
+        """Start observing a new run."""
+        with self.lock:
+            self.observed = {}
+            self.discarded = set()
+            self.started_at = time.time()
+
+    def mark(self, query: dict) -> Optional[Dict]:
+        """Return the committed mark of a query ('newest_id', 'scraped_at'), or None."""
+        with self.lock:
+            return self.marks.get(self.key(query))
+
+    def window(self, query: dict, max_age: str) -> str:
+        """Return the f_TPR value of a query: the time since its last run, at most max_age.
+
+        Args:
+            query (dict): Search query.
+            max_age (str): Configured f_TPR value ('r' followed by seconds).
+
+        Returns:
+            str: The f_TPR value to request.
+        """
+        mark = self.mark(query)
+        match = self.MAX_AGE.match(max_age or '')
+        if mark is None or match is None:
+            return max_age
+        elapsed = max(0.0, time.time() - mark['scraped_at']) + self.overlap
+        seconds = int(math.ceil(elapsed / self.granularity) * self.granularity)
+        return f"r{min(seconds, int(match.group(1)))}"
+
+    def is_behind(self, query: dict, job_posting_ids: Iterable[str]) -> bool:
+        """Return True if at least BEHIND_SHARE of the postings are not newer than the mark of the query.
+
+        Args:
+            query (dict): Search query.
+            job_posting_ids (Iterable[str]): Posting ids of a result page.
+
+        Returns:
+            bool: True if the page reached the postings seen by a previous run.
+        """
+        mark = self.mark(query)
+        if mark is None:
+            return False
+        ids = [int(job_posting_id) for job_posting_id in job_posting_ids if job_posting_id.isdigit()]
+        if not ids:
+            return False
+        behind = sum(job_posting_id <= mark['newest_id'] for job_posting_id in ids)
+        return behind >= self.BEHIND_SHARE * len(ids)
+
+    def observe(self, query: dict, job_posting_ids: Iterable[str]) -> None:
+        """Record the postings of a result page, to move the mark forward at commit.
+
+        Args:
+            query (dict): Search query.
+            job_posting_ids (Iterable[str]): Posting ids of a result page.
+        """
+        ids = [int(job_posting_id) for job_posting_id in job_posting_ids if job_posting_id.isdigit()]
+        with self.lock:
+            key = self.key(query)
+            self.observed[key] = max(ids + [self.observed.get(key, 0)])
+
+    def commit(self) -> int:
+        """Move the marks of the observed queries forward and save them.
+
+        Returns:
+            int: The number of queries whose mark was saved.
+        """
+        with self.lock:
+            committed = {key: newest_id for key, newest_id in self.observed.items() if key not in self.discarded}
+            for key, newest_id in committed.items():
+                previous = self.marks.get(key, {}).get('newest_id', 0)
+                self.marks[key] = {'newest_id': max(newest_id, previous), 'scraped_at': self.started_at}
+            count = len(committed)
+            self.observed = {}
+            self.discarded = set()
+
+            self.path.parent.mkdir(parents = True, exist_ok = True)
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(self.marks, indent = 2, sort_keys = True), encoding = 'utf-8')
+            os.replace(tmp_path, self.path)
+        return count
+
+    def discard(self, query: Optional[dict] = None) -> None:
+        """Forget the observations of the run, leaving the saved marks untouched.
+
+        Args:
+            query (dict, optional): Only discard this query, for the rest of the run. Defaults to every query.
+        """
+        with self.lock:
+            if query is None:
+                self.observed = {}
+                return
+            key = self.key(query)
+            self.observed.pop(key, None)
+            self.discarded.add(key)
@@ -0,0 +1,72 @@
+# src/utils/JobCard.py
+
+"""
+Compact record of a job card scraped from a LinkedIn search page.
+
+A card is a read-only mapping over five slots instead of a dict: no per-instance
+dict, and the low-cardinality values (location and date) are interned so that every
+card of a run shares one copy. Titles and company names are free text: interned
+strings are never freed on recent Pythons, so they stay plain strings. It still
+reads like the dicts it replaces: card['job_url'], dict(card), pd.DataFrame(cards),
+and it compares equal to a dict with the same items.
+
+Usage:
+from src.utils.JobCard import JobCard
+
+card = JobCard(title = "Data Engineer", company = "ACME", location = "Paris",
+               date = "2024-01-01", job_url = "https://www.linkedin.com/jobs/view/4000000001/")
+card['title']
+"""
+
+from collections.abc import Mapping
+import sys
+
+
+class JobCard(Mapping):
+    """Slotted, read-only mapping of the fields of a job card."""
+
+    __slots__ = ('title', 'company', 'location', 'date', 'job_url')
+    FIELDS = __slots__
+
+    def __init__(self, title: str = '', company: str = '', location: str = '', date: str = '', job_url: str = ''):
+        """Store the fields as plain strings, interning the low-cardinality ones.
+
+        Args:
+            title (str): Job title.
+            company (str): Company name.
+            location (str): Job location.
+            date (str): Listing date ('YYYY-MM-DD'), or '' if unknown.
+            job_url (str): URL of the job page.
+        """
+        # str() drops any reference from the value to the parse tree it came from
+        object.__setattr__(self, 'title', str(title))
+        object.__setattr__(self, 'company', str(company))
+        object.__setattr__(self, 'location', sys.intern(str(location)))
+        object.__setattr__(self, 'date', sys.intern(str(date)))
+        object.__setattr__(self, 'job_url', str(job_url))
+
+    @classmethod
+    def from_dict(cls, card: Mapping) -> 'JobCard':
+        """Build a card from a mapping with the card fields (extra keys are ignored)."""
+        return cls(**{field: card.get(field, '') for field in cls.FIELDS})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JobCard is read-only")
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __reduce__(self):
+        # Cards cross process boundaries (parse pool), keep the pickle small
+        return (self.__class__, tuple(getattr(self, field) for field in self.FIELDS))
+
+    def __repr__(self) -> str:
+        return f"JobCard({', '.join(f'{field}={getattr(self, field)!r}' for field in self.FIELDS)})"
@@ -0,0 +1,160 @@
+# src/utils/KeywordMatcher.py
+
+"""
+Compiled matchers for the keyword lists of the user preferences.
+
+KeywordMatcher turns a keyword list into one regular expression built from the
+trie of the keywords, e.g. ['data', 'dev', 'devops'] -> 'd(?:ata|ev(?:ops)?)'.
+Alternatives sharing a prefix are tried once, so a text is scanned in a single
+pass whatever the number of keywords, instead of once per keyword. Matching keeps
+the semantics of `any(word.lower() in text.lower() for word in words)`: keywords
+are plain, case-insensitive substrings.
+
+CompanySet is the normalized hash set of an exclusion list: names are compared
+case-insensitively, with surrounding and repeated whitespace ignored.
+
+Compiled objects are cached by keyword list, so preferences are compiled once per
+run even when the filters are applied batch after batch.
+
+Usage:
+from src.utils.KeywordMatcher import CompanySet, KeywordMatcher
+
+matcher = KeywordMatcher.compile(['Python', 'Django'])
+matcher.matches("Senior python developer")  # True
+CompanySet.compile(['Bad Company Inc']).contains(" bad  company inc")  # True
+"""
+
+from functools import lru_cache
+import re
+from typing import Iterable, Optional
+
+import pandas as pd
+
+
+class KeywordMatcher:
+    """Case-insensitive 'contains any of the keywords' test, compiled to a trie-shaped regex."""
+
+    def __init__(self, words: Iterable[str]):
+        """Compile a keyword list.
+
+        Args:
+            words (Iterable[str]): Keywords, matched as case-insensitive substrings.
+        """
+        self.words = sorted({word.lower() for word in words})
+        # '' is a substring of every text
+        self.matches_everything = '' in self.words
+        self.pattern: Optional[re.Pattern] = None
+        if self.words and not self.matches_everything:
+            self.pattern = re.compile(self.trie_pattern(self.words))
+
+    @classmethod
+    def compile(cls, words: Iterable[str]) -> 'KeywordMatcher':
+        """Return the matcher of a keyword list, compiled once per distinct list."""
+        return cls._compile(tuple(words))
+
+    @classmethod
+    @lru_cache(maxsize = 64)
+    def _compile(cls, words: tuple) -> 'KeywordMatcher':
+        return cls(words)
+
+    @classmethod
+    def trie_pattern(cls, words: list) -> str:
+        """Return a regex matching any of the words, factored by common prefixes.
+
+        Args:
+            words (list): Non-empty, distinct keywords.
+
+        Returns:
+            str: The regular expression.
+        """
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return cls._node_pattern(trie)
+
+    @classmethod
+    def _node_pattern(cls, node: dict) -> str:
+        """Return the regex of the words below a trie node."""
+        optional = '' in node
+        branches = [re.escape(char) + cls._node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if optional else '')
+
+    def matches(self, text: str) -> bool:
+        """Return True if the text contains any of the keywords.
+
+        Args:
+            text (str): Text to search, of any case.
+
+        Returns:
+            bool: The match result.
+        """
+        if self.matches_everything:
+            return True
+        if self.pattern is None:
+            return False
+        return self.pattern.search(text.lower()) is not None
+
+    def match_series(self, texts: pd.Series) -> pd.Series:
+        """Vectorized matches over a column of lower-cased strings.
+
+        Args:
+            texts (pd.Series): Lower-cased texts.
+
+        Returns:
+            pd.Series: Boolean mask aligned with texts.
+        """
+        if self.matches_everything or self.pattern is None:
+            return pd.Series(self.matches_everything, index = texts.index)
+        search = self.pattern.search
+        return texts.map(lambda text: search(text) is not None).astype(bool)
+
+
+class CompanySet:
+    """Hash set of normalized company names."""
+
+    def __init__(self, names: Iterable[str]):
+        """Normalize an exclusion list.
+
+        Args:
+            names (Iterable[str]): Company names.
+        """
+        self.names = frozenset(self.normalize(name) for name in names)
+
+    @classmethod
+    def compile(cls, names: Iterable[str]) -> 'CompanySet':
+        """Return the set of a name list, built once per distinct list."""
+        return cls._compile(tuple(names))
+
+    @classmethod
+    @lru_cache(maxsize = 64)
+    def _compile(cls, names: tuple) -> 'CompanySet':
+        return cls(names)
+
+    @staticmethod
+    def normalize(name) -> str:
+        """Return the comparison key of a company name: case-folded, whitespace collapsed."""
+        return ' '.join(str(name).casefold().split())
+
+    def contains(self, name) -> bool:
+        """Return True if the company is in the set."""
+        return self.normalize(name) in self.names
+
+    def match_series(self, companies: pd.Series) -> pd.Series:
+        """Vectorized contains over a column of company names.
+
+        Args:
+            companies (pd.Series): Company names.
+
+        Returns:
+            pd.Series: Boolean mask aligned with companies.
+        """
+        if not self.names:
+            return pd.Series(False, index = companies.index)
+        return companies.map(self.normalize).isin(self.names)
@@ -0,0 +1,164 @@
+# src/utils/LanguageDetector.py
+
+"""
+Deterministic, cached and parallel language detection for the 'languages' filter.
+
+langdetect draws random samples of n-grams, so the same text can get two different
+answers on two calls. The detector factory is seeded here, in the parent process and
+in every worker, so a text always gets the same language.
+
+Detected languages are memoized in a SQLite table keyed by a hash of the text: a
+reposted job, or a job filtered again by a later run, is never detected twice.
+Texts missing from the cache are detected in batches, by a pool of 'workers'
+processes when there are enough of them to pay for the pool, in-process otherwise.
+
+Usage:
+from src.utils.LanguageDetector import LanguageDetector
+
+detector = LanguageDetector("./data/languages.sqlite", workers = 4)
+languages = detector.detect_many(["Hello world", "Bonjour le monde"])
+detector.close()
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from langdetect import DetectorFactory, detect
+from langdetect.lang_detect_exception import LangDetectException
+
+
+# Seed of the langdetect sampling, set on import so that pool workers share it
+SEED = 0
+DetectorFactory.seed = SEED
+
+
+def detect_language(text: str) -> str:
+    """Detect the language of a text, 'en' when it cannot be detected (see JobScraper.safe_detect)."""
+    try:
+        return detect(text)
+    except LangDetectException:
+        return 'en'
+
+
+def detect_batch(texts: List[str]) -> List[str]:
+    """Detect the language of a batch of texts, in a pool worker."""
+    return [detect_language(text) for text in texts]
+
+
+class LanguageDetector:
+    """Language detection memoized by text hash, fanned out to a process pool."""
+
+    SCHEMA = "CREATE TABLE IF NOT EXISTS languages (hash BLOB PRIMARY KEY, language TEXT NOT NULL)"
+
+    def __init__(self, path: Optional[str] = None, workers: int = 0, batch_size: int = 64):
+        """Open (or create) the detection cache.
+
+        Args:
+            path (str, optional): SQLite file of the cache, None to keep it in memory.
+            workers (int): Detection processes, 0 to detect in-process.
+            batch_size (int): Texts sent to a worker at once.
+        """
+        self.workers = workers
+        self.batch_size = max(1, batch_size)
+        self.pool = None
+        self.lock = threading.Lock()
+        if path is not None:
+            Path(path).parent.mkdir(parents = True, exist_ok = True)
+        self.connection = sqlite3.connect(str(path) if path is not None else ':memory:', check_same_thread = False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(self.SCHEMA)
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, detection_config: Optional[dict]) -> Optional['LanguageDetector']:
+        """Create the detector if it is enabled in the configuration.
+
+        Args:
+            detection_config (dict, optional): The 'language_detection' section of the JobScraper configuration.
+
+        Returns:
+            Optional[LanguageDetector]: The detector, or None if disabled.
+        """
+        if not detection_config or not detection_config.get('enabled', False):
+            return None
+        return cls(detection_config.get('path', './data/languages.sqlite'),
+                   workers = detection_config.get('workers', 0),
+                   batch_size = detection_config.get('batch_size', 64))
+
+    @staticmethod
+    def text_hash(text: str) -> bytes:
+        """Return the cache key of a text."""
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size = 16).digest()
+
+    def lookup(self, hashes: List[bytes]) -> Dict[bytes, str]:
+        """Return the cached languages of the given hashes."""
+        found = {}
+        with self.lock:
+            # Stay below the SQLite limit of bound parameters
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                rows = self.connection.execute(f"SELECT hash, language FROM languages WHERE hash IN ({','.join('?' * len(chunk))})",
+                                               chunk).fetchall()
+                found.update(rows)
+        return found
+
+    def detect_texts(self, texts: List[str]) -> List[str]:
+        """Detect the languages of uncached texts, in the pool if it is worth it."""
+        if not self.workers or len(texts) < 2 * self.batch_size:
+            return detect_batch(texts)
+        if self.pool is None:
+            # 'spawn' is safe with the fetch threads of the parent process
+            self.pool = ProcessPoolExecutor(max_workers = self.workers, mp_context = multiprocessing.get_context('spawn'))
+        batches = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        return [language for languages in self.pool.map(detect_batch, batches) for language in languages]
+
+    def detect_many(self, texts: List[str]) -> List[str]:
+        """Return the language of every text, in order.
+
+        Args:
+            texts (List[str]): Texts to detect.
+
+        Returns:
+            List[str]: Language codes, aligned with texts.
+        """
+        hashes = [self.text_hash(text) for text in texts]
+        languages = self.lookup(list(set(hashes)))
+
+        # Repeated texts of the batch are detected once
+        missing = {}
+        for key, text in zip(hashes, texts):
+            if key not in languages:
+                missing.setdefault(key, text)
+        self.hits += len(texts) - sum(key not in languages for key in hashes)
+        self.misses += len(missing)
+
+        if missing:
+            detected = dict(zip(missing, self.detect_texts(list(missing.values()))))
+            with self.lock:
+                self.connection.executemany("INSERT OR REPLACE INTO languages (hash, language) VALUES (?, ?)", detected.items())
+                self.connection.commit()
+            languages.update(detected)
+        return [languages[key] for key in hashes]
+
+    def summary(self) -> str:
+        """Return a one-line summary of the cache activity."""
+        return f"{self.hits} languages from cache, {self.misses} detected"
+
+    def shutdown_pool(self) -> None:
+        """Stop the worker processes, a later detection starts them again."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def close(self) -> None:
+        """Stop the pool and close the cache."""
+        self.shutdown_pool()
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,178 @@
+# src/utils/LanguagePrescreen.py
+
+"""
+Cheap first tier of the 'languages' filter: stopword profiles on a prefix of the text.
+
+Job descriptions are long and their language is usually obvious from their first
+sentences. The prescreen reads the first 'max_chars' characters, counts the words of
+every language profile (its most frequent function words) and settles the language
+when the best profile is frequent enough and clearly ahead of the runner-up. A text
+settled in an allowed language passes the filter, one settled in another profiled
+language fails it, both without langdetect. When an allowed language has no profile
+(it could not be told apart), or the text is short, mixed or unusual, the prescreen
+abstains and the text escalates to the full langdetect detection.
+
+The escalation rate (share of texts sent to langdetect) is reported to tune the
+thresholds: lowering 'min_ratio' or 'margin' escalates less, at the risk of errors.
+
+Usage:
+from src.utils.LanguagePrescreen import LanguagePrescreen
+
+prescreen = LanguagePrescreen()
+prescreen.classify("We are looking for a data engineer to join the team", ['en', 'fr'])  # 'en'
+prescreen.summary()
+"""
+
+from collections import Counter
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+
+# Function words per language. English and French are the stopwords of the web UI
+# (src/flask/app_functions.py get_stopwords)
+STOPWORDS: Dict[str, FrozenSet[str]] = {
+    'en': frozenset({
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'been', 'by', 'for', 'from', 'has', 'he', 'in',
+        'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'will', 'with', 'would', 'you',
+        'your', 'yours', 'yourself', 'yourselves', 'i', 'me', 'my', 'myself', 'we', 'our', 'ours',
+        'ourselves', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which', 'who',
+        'whom', 'this', 'these', 'those', 'am', 'were', 'being', 'have', 'had', 'having', 'do',
+        'does', 'did', 'doing', 'can', 'could', 'should', 'ought', 'now', 'about', 'above',
+        'after', 'again', 'against', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
+        'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
+        's', 't', 'just', 'don'
+    }),
+    'fr': frozenset({
+        'le', 'la', 'les', 'un', 'une', 'des', 'de', 'du', 'et', 'à', 'ce', 'il', 'elle', 'on',
+        'ils', 'elles', 'je', 'tu', 'nous', 'vous', 'me', 'te', 'se', 'lui', 'leur', 'mon', 'ma',
+        'mes', 'ton', 'ta', 'tes', 'son', 'sa', 'ses', 'notre', 'nos', 'votre', 'vos', 'leurs',
+        'qui', 'que', 'quoi', 'dont', 'où', 'comment', 'quand', 'pourquoi', 'est', 'sont', 'être',
+        'avoir', 'ai', 'as', 'a', 'avons', 'avez', 'ont', 'été', 'étant', 'ayant', 'eu', 'eue',
+        'eues', 'eus', 'eut', 'eûmes', 'eûtes', 'eurent', 'suis', 'es', 'sommes', 'êtes', 'était',
+        'étais', 'étions', 'étiez', 'étaient', 'fus', 'fut', 'fûmes', 'fûtes', 'furent', 'serai',
+        'seras', 'sera', 'serons', 'serez', 'seront', 'serais', 'serait', 'serions', 'seriez',
+        'seraient', 'aurai', 'auras', 'aura', 'aurons', 'aurez', 'auront', 'aurais', 'aurait',
+        'aurions', 'auriez', 'auraient', 'dans', 'sur', 'avec', 'par', 'pour', 'sans', 'sous',
+        'vers', 'chez', 'contre', 'entre', 'parmi', 'pendant', 'selon', 'malgré', 'grâce', 'si',
+        'comme', 'lorsque', 'puisque', 'car', 'mais', 'ou', 'donc', 'or', 'ni', 'soit', 'très',
+        'plus', 'moins', 'aussi', 'encore', 'déjà', 'toujours', 'jamais', 'souvent', 'parfois',
+        'quelquefois', 'bien', 'mal', 'mieux', 'pire', 'peut', 'peuvent', 'pouvez', 'pouvons',
+        'puis', 'pourrai', 'pourras', 'pourra', 'pourrons', 'pourrez', 'pourront', 'pourrais',
+        'pourrait', 'pourrions', 'pourriez', 'pourraient', 'veux', 'veut', 'voulons', 'voulez',
+        'veulent', 'voudrai', 'voudras', 'voudra', 'voudrons', 'voudrez', 'voudront', 'voudrais',
+        'voudrait', 'voudrions', 'voudriez', 'voudraient'
+    }),
+    'de': frozenset({
+        'der', 'die', 'das', 'und', 'ist', 'nicht', 'ein', 'eine', 'einen', 'dem', 'den', 'des', 'mit',
+        'sich', 'auf', 'für', 'von', 'zu', 'im', 'auch', 'wir', 'sie', 'ihr', 'ihre', 'du', 'dein',
+        'deine', 'bei', 'oder', 'wie', 'als', 'uns', 'unser', 'unsere', 'sind', 'werden', 'wird',
+        'kannst', 'hast', 'bist', 'nach', 'über', 'zur', 'zum', 'durch', 'sowie', 'haben', 'eines'
+    }),
+    'es': frozenset({
+        'el', 'los', 'las', 'del', 'y', 'en', 'con', 'por', 'para', 'una', 'es', 'al', 'lo', 'como',
+        'más', 'pero', 'sus', 'su', 'este', 'esta', 'ser', 'son', 'también', 'nuestro', 'nuestra',
+        'tu', 'tus', 'muy', 'sin', 'sobre', 'entre', 'cuando', 'todo', 'hay', 'buscamos', 'equipo'
+    }),
+    'it': frozenset({
+        'il', 'di', 'che', 'e', 'è', 'per', 'una', 'con', 'non', 'della', 'del', 'dei', 'delle', 'gli',
+        'nel', 'nella', 'alla', 'al', 'sono', 'come', 'anche', 'più', 'tra', 'questo', 'questa',
+        'nostro', 'nostra', 'ti', 'tuo', 'tua', 'essere', 'cerchiamo', 'lavoro', 'ed', 'degli'
+    }),
+    'nl': frozenset({
+        'de', 'het', 'een', 'en', 'van', 'ik', 'te', 'dat', 'die', 'is', 'niet', 'op', 'zijn', 'voor',
+        'met', 'als', 'er', 'maar', 'om', 'ook', 'bij', 'naar', 'wij', 'jij', 'je', 'jouw', 'ons',
+        'onze', 'wordt', 'worden', 'heb', 'hebt', 'heeft', 'kun', 'kunnen', 'deze', 'zoeken'
+    }),
+    'pt': frozenset({
+        'o', 'os', 'as', 'e', 'do', 'da', 'dos', 'das', 'em', 'no', 'na', 'nos', 'um', 'uma', 'com',
+        'não', 'para', 'por', 'mais', 'como', 'seu', 'sua', 'ser', 'são', 'também', 'nosso', 'nossa',
+        'você', 'pela', 'pelo', 'muito', 'sobre', 'entre', 'quando', 'buscamos', 'equipe'
+    })
+}
+
+# Words, accents included, digits and underscores excluded
+WORD = re.compile(r"[^\W\d_]+")
+
+
+class LanguagePrescreen:
+    """Stopword classifier settling the obvious languages, escalating the rest."""
+
+    def __init__(self, max_chars: int = 600, min_words: int = 15, min_ratio: float = 0.15, margin: float = 2.0):
+        """Set the confidence thresholds.
+
+        Args:
+            max_chars (int): Length of the prefix read from each text.
+            min_words (int): Words the prefix needs before the prescreen decides.
+            min_ratio (float): Minimum share of the prefix words found in the winning profile.
+            margin (float): Minimum ratio between the stopword counts of the winner and of the runner-up.
+        """
+        self.max_chars = max_chars
+        self.min_words = min_words
+        self.min_ratio = min_ratio
+        self.margin = margin
+        self.settled = Counter()
+        self.escalated = 0
+
+    @classmethod
+    def from_config(cls, prescreen_config: Optional[dict]) -> Optional['LanguagePrescreen']:
+        """Create the prescreen if it is enabled in the configuration.
+
+        Args:
+            prescreen_config (dict, optional): The 'language_prescreen' section of the JobScraper configuration.
+
+        Returns:
+            Optional[LanguagePrescreen]: The prescreen, or None if disabled.
+        """
+        if not prescreen_config or not prescreen_config.get('enabled', False):
+            return None
+        return cls(**{key: prescreen_config[key] for key in ('max_chars', 'min_words', 'min_ratio', 'margin')
+                      if key in prescreen_config})
+
+    def classify(self, text: str, candidates: Iterable[str]) -> Optional[str]:
+        """Return the language of a text if it is obvious, None to escalate it.
+
+        Args:
+            text (str): The text.
+            candidates (Iterable[str]): Allowed languages; a text can only be settled
+                when all of them have a profile.
+
+        Returns:
+            Optional[str]: The language code, or None when the text needs the full detection.
+        """
+        language = self.predict(text) if all(candidate in STOPWORDS for candidate in candidates) else None
+        if language is None:
+            self.escalated += 1
+        else:
+            self.settled[language] += 1
+        return language
+
+    def predict(self, text: str) -> Optional[str]:
+        """Return the best profile of the prefix of a text, if it passes the thresholds."""
+        words = WORD.findall(text[:self.max_chars].lower())
+        if len(words) < self.min_words:
+            return None
+
+        counts = Counter()
+        for word in words:
+            for language, stopwords in STOPWORDS.items():
+                if word in stopwords:
+                    counts[language] += 1
+        ranking = counts.most_common(2)
+        if not ranking:
+            return None
+        best, best_count = ranking[0]
+        runner_up = ranking[1][1] if len(ranking) > 1 else 0
+        if best_count < self.min_ratio * len(words) or best_count < self.margin * runner_up:
+            return None
+        return best
+
+    @property
+    def escalation_rate(self) -> float:
+        """Share of the classified texts sent to the full detection."""
+        total = self.escalated + sum(self.settled.values())
+        return self.escalated / total if total else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line summary of the prescreen decisions."""
+        settled = ', '.join(f"{language} {count}" for language, count in self.settled.most_common()) or 'none'
+        return f"{sum(self.settled.values())} settled ({settled}), {self.escalated} escalated ({self.escalation_rate:.1%})"
@@ -0,0 +1,121 @@
+# src/utils/RateLimiter.py
+
+"""
+Token-bucket rate limiting keyed by host.
+
+Usage:
+from src.utils.RateLimiter import HostRateLimiter
+
+limiter = HostRateLimiter({"linkedin.com": {"requests_per_second": 1, "burst": 3}})
+limiter.acquire(limiter.key_for(url, proxies))
+"""
+
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are refilled continuously at 'rate' per second, up to 'burst'.
+    A reservation always succeeds and returns how long the caller has to wait
+    before its token becomes valid, so waiting callers are spaced by 1/rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the bucket full.
+
+        Args:
+            rate (float): Refill rate in tokens (requests) per second.
+            burst (int): Maximum number of tokens the bucket can hold.
+        """
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the delay (in seconds) before it can be used."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until one token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HostRateLimiter:
+    """Collection of token buckets, one per host.
+
+    Limits are configured per host name. A limit set for 'linkedin.com' also applies
+    to 'www.linkedin.com'; the 'default' entry applies to every other host. Hosts
+    without any matching entry are not limited.
+    """
+
+    def __init__(self, limits: Optional[dict] = None):
+        """Initialize the limiter.
+
+        Args:
+            limits (dict, optional): Mapping of host (or 'default') to
+                {"requests_per_second": float, "burst": int}.
+        """
+        self.limits = {host.lower(): settings for host, settings in (limits or {}).items()}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url: str, proxies: Optional[dict] = None) -> str:
+        """Return the host a request is charged to: the proxy endpoint if one is used, the target host otherwise.
+
+        Args:
+            url (str): The URL to fetch.
+            proxies (dict, optional): requests-style proxies dict.
+
+        Returns:
+            str: Host name used as limiter key.
+        """
+        target = urlsplit(url)
+        if proxies and isinstance(proxies, dict) and proxies.get(target.scheme):
+            return (urlsplit(proxies[target.scheme]).hostname or '').lower()
+        return (target.hostname or '').lower()
+
+    def settings_for(self, host: str) -> Optional[dict]:
+        """Find the limit settings matching a host (exact, parent domain, then 'default')."""
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            candidate = '.'.join(labels[i:])
+            if candidate in self.limits:
+                return self.limits[candidate]
+        return self.limits.get(host, self.limits.get('default'))
+
+    def bucket_for(self, host: str) -> Optional[TokenBucket]:
+        """Return the bucket of a host, creating it on first use. None if the host is unlimited."""
+        with self.lock:
+            if host not in self.buckets:
+                settings = self.settings_for(host)
+                self.buckets[host] = TokenBucket(settings['requests_per_second'], settings.get('burst', 1)) if settings else None
+            return self.buckets[host]
+
+    def reserve(self, host: str) -> float:
+        """Take one token for a host and return the delay before it can be used."""
+        bucket = self.bucket_for(host)
+        return bucket.reserve() if bucket else 0.0
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to this host is allowed."""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,171 @@
+# src/utils/ResponseCache.py
+
+"""
+Compressed on-disk cache for HTTP response bodies.
+
+Entries are keyed by normalized URL and expire after a TTL that depends on the
+kind of page: search result pages change fast, job description pages barely change.
+The store is bounded in size and evicts the least recently used entries first.
+
+Usage:
+from src.utils.ResponseCache import ResponseCache
+
+cache = ResponseCache(directory = "./data/cache", search_ttl = 3600, description_ttl = 259200)
+html = cache.get(url)
+if html is None:
+    html = download(url)
+    cache.set(url, html)
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import zlib
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of response bodies, stored zlib-compressed on disk."""
+
+    SUFFIX = '.z'
+
+    def __init__(self, directory: str, search_ttl: float = 3600, description_ttl: float = 259200, max_size_mb: float = 200):
+        """Initialize the cache and index the entries already on disk.
+
+        Args:
+            directory (str): Directory holding the cache files.
+            search_ttl (float): Time to live (seconds) of search result pages.
+            description_ttl (float): Time to live (seconds) of '/jobs/view/' pages.
+            max_size_mb (float): Maximum size of the compressed store, in megabytes.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents = True, exist_ok = True)
+        self.search_ttl = search_ttl
+        self.description_ttl = description_ttl
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # LRU index: file name -> compressed size, least recently used first
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            stat = path.stat()
+            entries.append((stat.st_atime, path.name, stat.st_size))
+        self.index = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self.size = sum(self.index.values())
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalize a URL so that equivalent URLs share one cache entry.
+
+        Scheme and host are lower-cased, the fragment and trailing slash are dropped,
+        query parameters are sorted.
+
+        Args:
+            url (str): URL to normalize.
+
+        Returns:
+            str: Normalized URL.
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip('/') or '/'
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values = True)))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL matching the kind of page behind a URL."""
+        return self.description_ttl if '/jobs/view/' in urlsplit(url).path else self.search_ttl
+
+    def path_for(self, url: str) -> Path:
+        """Return the file holding the cache entry of a URL."""
+        name = hashlib.sha256(self.normalize_url(url).encode()).hexdigest() + self.SUFFIX
+        return self.directory / name
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached body of a URL, or None if missing or expired.
+
+        Args:
+            url (str): URL to look up.
+
+        Returns:
+            Optional[str]: Cached response body.
+        """
+        path = self.path_for(url)
+        with self.lock:
+            known = path.name in self.index
+        if not known:
+            return self._miss()
+
+        # Disk I/O and decompression run outside the lock, concurrent fetches do not wait on each other
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl_for(url):
+                self._remove([path.name])
+                return self._miss()
+            data = path.read_bytes()
+            # Keep the write time (TTL) in mtime, the last access (LRU) in atime
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            # Evicted by another thread meanwhile
+            return self._miss()
+
+        with self.lock:
+            if path.name in self.index:
+                self.index.move_to_end(path.name)
+            self.hits += 1
+        return zlib.decompress(data).decode('utf-8')
+
+    def set(self, url: str, body: str) -> None:
+        """Store the body of a URL, evicting least recently used entries if the store is full.
+
+        Args:
+            url (str): URL of the response.
+            body (str): Response body.
+        """
+        data = zlib.compress(body.encode('utf-8'))
+        path = self.path_for(url)
+        # One temporary file per thread, concurrent writes of a URL never share it
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        evicted = []
+        with self.lock:
+            self.size += len(data) - self.index.pop(path.name, 0)
+            self.index[path.name] = len(data)
+            while self.size > self.max_bytes and len(self.index) > 1:
+                oldest, size = self.index.popitem(last = False)
+                self.size -= size
+                evicted.append(oldest)
+        self._unlink(evicted)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self.lock:
+            names = list(self.index)
+        self._remove(names)
+
+    def _miss(self) -> None:
+        """Count a cache miss."""
+        with self.lock:
+            self.misses += 1
+
+    def _remove(self, names: list) -> None:
+        """Drop entries from the index, then delete their files."""
+        with self.lock:
+            for name in names:
+                self.size -= self.index.pop(name, 0)
+        self._unlink(names)
+
+    def _unlink(self, names: list) -> None:
+        """Delete the files of entries already dropped from the index."""
+        for name in names:
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,158 @@
+# src/utils/RetryPolicy.py
+
+"""
+Retry policy shared by the fetch engines.
+
+Decides which failures are retried (timeouts, connection errors and a configurable
+set of HTTP statuses), how long to wait (exponential backoff with full jitter, or the
+server's Retry-After) and enforces a per-run retry budget. Retries are counted by cause.
+
+Usage:
+from src.utils.RetryPolicy import RetryPolicy
+
+policy = RetryPolicy.from_config(config)
+cause = policy.classify_status(503)
+if cause and policy.consume(cause):
+    time.sleep(policy.compute_delay(attempt, cause, retry_after))
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+from typing import Optional
+
+
+class RetryPolicy:
+    """Exponential backoff retry policy with full jitter, Retry-After support and a retry budget."""
+
+    # HTTP status -> retry class
+    DEFAULT_RETRY_STATUSES = {
+        429: 'throttled',
+        500: 'server_error',
+        502: 'server_error',
+        503: 'unavailable',
+        504: 'server_error'
+    }
+
+    def __init__(self,
+                 max_retry: int = 3,
+                 base_delay: float = 5,
+                 max_delay: float = 60,
+                 max_retry_after: float = 300,
+                 jitter: bool = True,
+                 retry_statuses: Optional[dict] = None,
+                 class_delays: Optional[dict] = None,
+                 budget: Optional[int] = None):
+        """Initialize the policy.
+
+        Args:
+            max_retry (int): Maximum number of attempts per request.
+            base_delay (float): Backoff base delay in seconds (delay cap of the first retry).
+            max_delay (float): Upper bound of the backoff delay in seconds.
+            max_retry_after (float): Upper bound of a server provided Retry-After delay.
+            jitter (bool): Draw the delay uniformly in [0, cap] (full jitter) instead of waiting the cap.
+            retry_statuses (dict, optional): HTTP status -> retry class. Statuses not listed are not retried.
+            class_delays (dict, optional): Retry class or cause -> base delay overriding base_delay.
+            budget (int, optional): Maximum number of retries for the whole run. None means unlimited.
+        """
+        self.max_retry = max_retry
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.retry_statuses = self.DEFAULT_RETRY_STATUSES if retry_statuses is None else {int(status): cause for status, cause in retry_statuses.items()}
+        self.class_delays = class_delays or {}
+        self.budget = budget
+        self.retries = 0
+        self.counters = Counter()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'RetryPolicy':
+        """Build the policy from the engine configuration ('max_retry', 'retry_delay' and the 'retry_policy' section).
+
+        Args:
+            config (dict): BeautifulSoupEngine configuration.
+
+        Returns:
+            RetryPolicy: The configured policy.
+        """
+        policy_config = config.get('retry_policy', {})
+        return cls(max_retry = config.get('max_retry', 3),
+                   base_delay = config.get('retry_delay', 5),
+                   max_delay = policy_config.get('max_delay', 60),
+                   max_retry_after = policy_config.get('max_retry_after', 300),
+                   jitter = policy_config.get('jitter', True),
+                   retry_statuses = policy_config.get('retry_statuses'),
+                   class_delays = policy_config.get('class_delays'),
+                   budget = policy_config.get('budget'))
+
+    def classify_status(self, status: Optional[int]) -> Optional[str]:
+        """Return the retry class of an HTTP status, or None if it must not be retried."""
+        return self.retry_statuses.get(status)
+
+    def consume(self, cause: str) -> bool:
+        """Record a retry and take it from the budget.
+
+        Args:
+            cause (str): Why the request is retried ('timeout', 'connection' or a status class).
+
+        Returns:
+            bool: False if the run's retry budget is exhausted (the retry must not happen).
+        """
+        with self.lock:
+            if self.budget is not None and self.retries >= self.budget:
+                self.counters['budget_exhausted'] += 1
+                return False
+            self.retries += 1
+            self.counters[cause] += 1
+            return True
+
+    def compute_delay(self, attempt: int, cause: Optional[str] = None, retry_after: Optional[float] = None) -> float:
+        """Return how long to wait before the next attempt.
+
+        Args:
+            attempt (int): Zero-based index of the attempt that just failed.
+            cause (str, optional): Retry cause, used to pick a class specific base delay.
+            retry_after (float, optional): Delay requested by the server, takes precedence.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_retry_after)
+
+        base_delay = self.class_delays.get(cause, self.base_delay)
+        cap = min(self.max_delay, base_delay * 2 ** attempt)
+        return random.uniform(0, cap) if self.jitter else cap
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delay in seconds or HTTP date).
+
+        Args:
+            value (str, optional): Header value.
+
+        Returns:
+            Optional[float]: Delay in seconds, None if missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo = timezone.utc)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+    def summary(self) -> str:
+        """Return a one-line summary of the retries by cause."""
+        with self.lock:
+            return ", ".join(f"{cause}: {count}" for cause, count in sorted(self.counters.items()))
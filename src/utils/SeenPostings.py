@@ -0,0 +1,153 @@
+# src/utils/SeenPostings.py
+
+"""
+Local index of the LinkedIn job posting ids already stored in the database.
+
+The ids are kept as a sorted array of unsigned 64-bit integers in a raw binary file,
+memory-mapped read-only: a lookup is a binary search over the mapped pages, with no
+load time and no database round-trip. Ids added during a run are merged into the
+file by save().
+
+The index only lists postings that were inserted into the database, so a card whose
+id is missing is new. A card whose id is present is a posting the database held at
+some point: callers confirm those possible positives against the database.
+
+The identity of the database index the ids were read from (its UUID and document
+count) is stamped in a JSON file next to them. An index that was reset, or written
+by another scraper, no longer matches it: callers then reset and rebuild the index.
+
+Usage:
+from src.utils.SeenPostings import SeenPostings
+
+seen = SeenPostings("./data/seen_postings.u64")
+known = seen.contains([4012345678, 4012345012])
+seen.add([4012345678])
+seen.save()
+seen.stamp({'uuid': "Jx2kq...", 'count': 1234})
+"""
+
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class SeenPostings:
+    """Sorted, memory-mapped array of posting ids, plus the ids added since the last save."""
+
+    DTYPE = np.uint64
+
+    def __init__(self, path: str):
+        """Map the index saved by previous runs.
+
+        Args:
+            path (str): Binary file holding the sorted ids.
+        """
+        self.path = Path(path)
+        self.identity_path = self.path.with_suffix('.json')
+        self.lock = threading.Lock()
+        self.pending = set()
+        self.ids = self._map()
+
+    @classmethod
+    def from_config(cls, seen_config: Optional[dict]) -> Optional['SeenPostings']:
+        """Create the index if it is enabled in the configuration.
+
+        Args:
+            seen_config (dict, optional): The 'seen_postings' section of the JobScraper configuration.
+
+        Returns:
+            Optional[SeenPostings]: The index, or None if disabled.
+        """
+        if not seen_config or not seen_config.get('enabled', False):
+            return None
+        return cls(seen_config.get('path', './data/seen_postings.u64'))
+
+    @property
+    def ready(self) -> bool:
+        """True once the index has been saved, i.e. built from the database or by a previous run."""
+        return self.path.exists()
+
+    @property
+    def identity(self) -> Optional[dict]:
+        """Identity of the database index stamped by the last build or run, None if unknown."""
+        if not self.identity_path.exists():
+            return None
+        return json.loads(self.identity_path.read_text(encoding = 'utf-8'))
+
+    def stamp(self, identity: Optional[dict]) -> None:
+        """Record the identity of the database index the saved ids match.
+
+        Args:
+            identity (dict, optional): As returned by ElasticSearchEngine.index_identity.
+        """
+        self.identity_path.parent.mkdir(parents = True, exist_ok = True)
+        self.identity_path.write_text(json.dumps(identity), encoding = 'utf-8')
+
+    def reset(self) -> None:
+        """Forget every id and the stamped identity, the index is not ready anymore."""
+        with self.lock:
+            self.ids = np.empty(0, dtype = self.DTYPE)
+            self.pending = set()
+            self.path.unlink(missing_ok = True)
+            self.identity_path.unlink(missing_ok = True)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.ids) + len(self.pending)
+
+    def _map(self) -> np.ndarray:
+        """Return the saved ids, memory-mapped (an empty array if there are none)."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return np.empty(0, dtype = self.DTYPE)
+        return np.memmap(self.path, dtype = self.DTYPE, mode = 'r')
+
+    def contains(self, job_posting_ids: Iterable[int]) -> np.ndarray:
+        """Tell which posting ids are in the index.
+
+        Args:
+            job_posting_ids (Iterable[int]): Posting ids to look up.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with the ids.
+        """
+        wanted = np.fromiter(job_posting_ids, dtype = self.DTYPE)
+        with self.lock:
+            positions = np.searchsorted(self.ids, wanted)
+            found = positions < len(self.ids)
+            found[found] = self.ids[positions[found]] == wanted[found]
+            if self.pending:
+                found |= np.isin(wanted, np.fromiter(self.pending, dtype = self.DTYPE, count = len(self.pending)))
+        return found
+
+    def add(self, job_posting_ids: Iterable[int]) -> None:
+        """Add posting ids to the index (kept in memory until save).
+
+        Args:
+            job_posting_ids (Iterable[int]): Ids of postings inserted into the database.
+        """
+        with self.lock:
+            self.pending.update(int(job_posting_id) for job_posting_id in job_posting_ids)
+
+    def save(self) -> int:
+        """Merge the added ids into the file and map it again.
+
+        Returns:
+            int: The number of ids in the index.
+        """
+        with self.lock:
+            added = np.fromiter(self.pending, dtype = self.DTYPE, count = len(self.pending))
+            merged = np.union1d(self.ids, added).astype(self.DTYPE)
+
+            self.path.parent.mkdir(parents = True, exist_ok = True)
+            tmp_path = self.path.with_suffix('.tmp')
+            merged.tofile(tmp_path)
+            # Drop the mapping of the old file before replacing it
+            self.ids = merged
+            os.replace(tmp_path, self.path)
+            self.ids = self._map()
+            self.pending = set()
+            return len(self.ids)
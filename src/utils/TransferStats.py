@@ -0,0 +1,105 @@
+# src/utils/TransferStats.py
+
+"""
+Per-run accounting of the bytes moved by the fetch engines.
+
+Responses are counted by page type, with both the bytes received on the wire
+(compressed body) and the decompressed body size, so that the transfer savings
+and the traffic billed by proxies can be reported per run.
+
+Usage:
+from src.utils.TransferStats import TransferStats
+
+stats = TransferStats()
+session.headers['Accept-Encoding'] = TransferStats.ACCEPT_ENCODING
+stats.record('job_descriptions', wire_bytes = 18000, body_bytes = 95000)
+print(stats.summary())
+"""
+
+from collections import defaultdict
+import threading
+from typing import Dict, Optional
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+class TransferStats:
+    """Thread-safe counters of requests, wire bytes and body bytes by page type."""
+
+    # Content codings the engines can decode, best first
+    ACCEPT_ENCODING = 'br, gzip, deflate' if brotli is not None else 'gzip, deflate'
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.lock = threading.Lock()
+        self.counters = defaultdict(lambda: {'requests': 0, 'wire_bytes': 0, 'body_bytes': 0})
+
+    def record(self, type: Optional[str], wire_bytes: int, body_bytes: int) -> None:
+        """Count one response.
+
+        Args:
+            type (str, optional): Type of page ('job_cards', 'job_descriptions'), None for other requests.
+            wire_bytes (int): Body bytes received, before content decoding.
+            body_bytes (int): Body bytes after content decoding.
+        """
+        with self.lock:
+            counters = self.counters[type or 'other']
+            counters['requests'] += 1
+            counters['wire_bytes'] += wire_bytes
+            counters['body_bytes'] += body_bytes
+
+    def totals(self) -> Dict[str, int]:
+        """Return the counters summed over every page type."""
+        with self.lock:
+            return {key: sum(counters[key] for counters in self.counters.values())
+                    for key in ('requests', 'wire_bytes', 'body_bytes')}
+
+    def summary(self) -> str:
+        """Return a one-line summary of the traffic by page type."""
+        with self.lock:
+            parts = []
+            for type, counters in sorted(self.counters.items()):
+                saved = 1 - counters['wire_bytes'] / counters['body_bytes'] if counters['body_bytes'] else 0.0
+                parts.append(f"{type}: {counters['requests']} responses, {counters['wire_bytes'] / 1024:.1f} KiB transferred "
+                             f"for {counters['body_bytes'] / 1024:.1f} KiB of HTML ({saved:.0%} saved)")
+            return ", ".join(parts)
+
+    @staticmethod
+    def decode(data: bytes, content_encoding: Optional[str]) -> bytes:
+        """Undo the content codings of a response body.
+
+        Args:
+            data (bytes): Body as received.
+            content_encoding (str, optional): Content-Encoding header, codings applied in order.
+
+        Returns:
+            bytes: Decoded body.
+
+        Raises:
+            ValueError: If a coding is not supported.
+        """
+        if not content_encoding:
+            return data
+        for coding in reversed([coding.strip().lower() for coding in content_encoding.split(',')]):
+            if coding in ('', 'identity'):
+                continue
+            if coding in ('gzip', 'x-gzip'):
+                data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+            elif coding == 'deflate':
+                # Servers send either zlib-wrapped or raw deflate streams
+                try:
+                    data = zlib.decompress(data)
+                except zlib.error:
+                    data = zlib.decompress(data, -zlib.MAX_WBITS)
+            elif coding == 'br' and brotli is not None:
+                data = brotli.decompress(data)
+            else:
+                raise ValueError(f"Unsupported content encoding: {coding}")
+        return data
@@ -0,0 +1,157 @@
+# tests/test_async_beautiful_soup_engine.py
+
+import asyncio
+import pytest
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from src.AsyncBeautifulSoupEngine import AsyncBeautifulSoupEngine
+
+
+JOB_CARD_PAGE = """
+<html>
+    <div data-entity-urn="urn:li:fsd_jobPosting:{id}">
+        <div class="base-search-card__info">
+            <h3>Job {id}</h3>
+            <a class="hidden-nested-link">Company {id}</a>
+            <span class="job-search-card__location">Paris</span>
+            <time class="job-search-card__listdate" datetime="2024-01-15"></time>
+        </div>
+    </div>
+</html>
+"""
+
+
+class TestAsyncBeautifulSoupEngine:
+    """Test suite for AsyncBeautifulSoupEngine class."""
+
+    @pytest.fixture
+    def sample_config(self):
+        """Fixture providing sample configuration."""
+        return {
+            'max_retry': 2,
+            'retry_delay': 0,
+            'request_timeout': 5,
+            'headers': {'User-Agent': 'test-agent'},
+            'proxies': {},
+            'rounds': 1,
+            'pages_to_scrape': 3,
+            'max_age': 'r86400',
+            'max_in_flight': 3
+        }
+
+    @pytest.fixture
+    def engine(self, sample_config):
+        """Fixture providing initialized AsyncBeautifulSoupEngine instance."""
+        return AsyncBeautifulSoupEngine(sample_config, {})
+
+    def test_context_manager_opens_and_closes_session(self, engine):
+        """Test that the session and loop only live inside the 'with' block."""
+        with engine as bs_engine:
+            assert bs_engine is engine
+            assert engine.session is not None
+            assert engine.loop is not None
+        assert engine.session is None
+        assert engine.loop is None
+
+    def test_get_proxy_uses_url_scheme(self, engine):
+        """Test that the proxy is picked from the requests-style dict."""
+        engine.config['proxies'] = {'http': 'http://proxy:8080', 'https': 'http://proxy:8443'}
+        assert engine.get_proxy('https://www.linkedin.com/jobs') == 'http://proxy:8443'
+        assert engine.get_proxy('http://www.linkedin.com/jobs') == 'http://proxy:8080'
+
+    def test_get_proxy_returns_none_without_proxies(self, engine):
+        """Test that no proxy is used when none is configured."""
+        assert engine.get_proxy('https://www.linkedin.com/jobs') is None
+
+    def test_map_urls_keeps_order_and_bounds_concurrency(self, engine):
+        """Test that results follow input order and in-flight requests never exceed the limit."""
+        state = {'in_flight': 0, 'peak': 0}
+
+        async def fake_fetch(url, type = None):
+            state['in_flight'] += 1
+            state['peak'] = max(state['peak'], state['in_flight'])
+            await asyncio.sleep(random.uniform(0, 0.02))
+            state['in_flight'] -= 1
+            return JOB_CARD_PAGE.format(id = url.split('/')[-1])
+
+        urls = [f"https://example.com/{i}" for i in range(12)]
+        with patch.object(engine, 'fetch_async', side_effect = fake_fetch):
+            results = engine.map_urls(urls, 'job_cards')
+
+        assert [jobs[0]['title'] for jobs in results] == [f"Job {i}" for i in range(12)]
+        assert state['peak'] <= engine.max_in_flight
+
+    def test_map_urls_returns_empty_list_for_failed_requests(self, engine):
+        """Test that failed requests produce an empty result at the right position."""
+        async def fake_fetch(url, type = None):
+            return None if url.endswith('1') else "<html></html>"
+
+        with patch.object(engine, 'fetch_async', side_effect = fake_fetch):
+            results = engine.map_urls(["https://example.com/0", "https://example.com/1"], 'job_descriptions')
+
+        assert results == [None, []]
+
+    def test_map_urls_invalid_type_raises_error(self, engine):
+        """Test that invalid type parameter raises ValueError."""
+        with pytest.raises(ValueError, match = "Invalid type: invalid"):
+            engine.map_urls(["https://example.com"], 'invalid')
+
+    def test_map_urls_empty_list(self, engine):
+        """Test that an empty URL list does not open a session."""
+        assert engine.map_urls([], 'job_cards') == []
+        assert engine.session is None
+
+
+class TestAsyncBeautifulSoupEngineIntegration:
+    """Integration tests against a local HTTP server."""
+
+    @pytest.fixture
+    def server(self):
+        """Serve a job card page for every path, and a 500 on /error."""
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path == '/error':
+                    self.send_response(500)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = JOB_CARD_PAGE.format(id = self.path.strip('/')).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target = httpd.serve_forever, daemon = True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_port}"
+        httpd.shutdown()
+
+    def test_get_job_descriptions_and_cards_over_http(self, server):
+        """Test the complete flow through a real aiohttp session."""
+        config = {
+            'max_retry': 1,
+            'retry_delay': 0,
+            'request_timeout': 5,
+            'headers': {'User-Agent': 'test-agent'},
+            'proxies': {},
+            'max_in_flight': 2
+        }
+        with AsyncBeautifulSoupEngine(config, {}) as engine:
+            results = engine.map_urls([f"{server}/{i}" for i in range(5)] + [f"{server}/error"], 'job_cards')
+            requests_count, connections_count = engine.get_connection_stats()
+
+        assert requests_count == 6
+        assert connections_count <= config['max_in_flight']
+
+        assert [jobs[0]['job_url'] for jobs in results[:5]] == [f"https://www.linkedin.com/jobs/view/{i}/" for i in range(5)]
+        assert results[5] == []
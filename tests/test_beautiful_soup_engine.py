@@ -1,10 +1,22 @@
 # tests/test_beautiful_soup_engine.py
 
+import gc
+import itertools
 import pytest
+import re
+import tracemalloc
 from unittest.mock import Mock, patch
 from bs4 import BeautifulSoup
 import requests
-from src.BeautifulSoupEngine import BeautifulSoupEngine
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from scripts.linkedin_stub_server import LinkedInStubServer
+from src.BeautifulSoupEngine import BeautifulSoupEngine, FailedPage
+from src.utils.CrawlFrontier import CrawlFrontier
+from src.utils.HighWaterMarks import HighWaterMarks
+from src.utils.JobCard import JobCard
+from src.utils.SeenPostings import SeenPostings
 
 
 class TestBeautifulSoupEngine:
@@ -92,72 +104,210 @@ class TestBeautifulSoupEngine:
         engine.unload_soup()
         assert engine.soup is None
     
-    @patch('src.BeautifulSoupEngine.requests.get')
+    def test_enter_opens_pooled_session(self, engine):
+        """Test that entering the context creates a keep-alive session sized on max_in_flight."""
+        engine.max_in_flight = 5
+        with engine:
+            assert isinstance(engine.session, requests.Session)
+            assert engine.session.get_adapter('https://www.linkedin.com')._pool_maxsize == 5
+            assert engine.session.headers['User-Agent'] == 'test-agent'
+        assert engine.session is None
+    
+    def test_close_logs_connection_stats(self, engine):
+        """Test that closing the session reports requests and connections."""
+        engine.logger = Mock()
+        engine.session = Mock()
+        with patch.object(engine, 'get_connection_stats', return_value = (10, 2)):
+            engine.close()
+        
+        engine.logger.info.assert_called_once_with("Session stats: 10 requests over 2 connections (8 reused)")
+    
+    def test_run_stats_are_logged_once_for_every_session(self, engine):
+        """Test that the cumulative transfer counters are left to log_run_stats rather than each close."""
+        engine.logger = Mock()
+        engine.transfer_stats.record('job_cards', 1024, 4096)
+        for _ in range(2):
+            engine.session = Mock()
+            with patch.object(engine, 'get_connection_stats', return_value = (0, 0)):
+                engine.close()
+        engine.logger.info.assert_not_called()
+        
+        engine.log_run_stats()
+        
+        engine.logger.info.assert_called_once()
+        assert engine.logger.info.call_args.args[0].startswith("Transfer stats: ")
+    
     @patch('src.BeautifulSoupEngine.bs')
-    def test_get_with_retry_success_on_first_attempt(self, mock_bs, mock_get, engine):
+    def test_get_with_retry_success_on_first_attempt(self, mock_bs, engine):
         """Test successful request on first attempt."""
         url = "https://example.com"
         mock_response = Mock()
         mock_response.text = "<html>test</html>"
-        mock_get.return_value = mock_response
+        engine.session = Mock()
+        engine.session.get.return_value = mock_response
         mock_soup = Mock()
         mock_bs.return_value = mock_soup
         
         result = engine.get_with_retry(url)
         
         assert result == mock_soup
-        mock_get.assert_called_once_with(
+        engine.session.get.assert_called_once_with(
             url,
-            proxies=None,
-            headers=engine.config['headers'],
             timeout=engine.config['request_timeout']
         )
         mock_response.raise_for_status.assert_called_once()
         mock_bs.assert_called_once_with("<html>test</html>", 'html.parser')
     
-    @patch('src.BeautifulSoupEngine.requests.get')
     @patch('src.BeautifulSoupEngine.time.sleep')
-    def test_get_with_retry_handles_timeout_with_retry(self, mock_sleep, mock_get, engine):
+    def test_get_with_retry_handles_timeout_with_retry(self, mock_sleep, engine):
         """Test retry logic on timeout exception."""
         url = "https://example.com"
-        mock_get.side_effect = [requests.exceptions.Timeout(), requests.exceptions.Timeout(), requests.exceptions.Timeout()]
+        engine.session = Mock()
+        engine.session.get.side_effect = [requests.exceptions.Timeout(), requests.exceptions.Timeout(), requests.exceptions.Timeout()]
         
         result = engine.get_with_retry(url)
         
         assert result is None
-        assert mock_get.call_count == 3
+        assert engine.session.get.call_count == 3
         assert mock_sleep.call_count == 2  # Sleep called between retries
-        mock_sleep.assert_called_with(engine.config['retry_delay'])
+        # Exponential backoff with full jitter: attempt n waits at most retry_delay * 2**n
+        for attempt, call in enumerate(mock_sleep.call_args_list):
+            assert 0 <= call.args[0] <= engine.config['retry_delay'] * 2 ** attempt
+        assert engine.retry_policy.counters['timeout'] == 2
+    
+    @patch('src.BeautifulSoupEngine.time.sleep')
+    def test_get_with_retry_retries_retryable_status_and_honors_retry_after(self, mock_sleep, engine):
+        """Test that 429/5xx are retried, waiting the delay requested by the server."""
+        throttled = Mock()
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(response = Mock(status_code = 429, headers = {'Retry-After': '7'}))
+        unavailable = Mock()
+        unavailable.raise_for_status.side_effect = requests.exceptions.HTTPError(response = Mock(status_code = 503, headers = {}))
+        engine.session = Mock()
+        engine.session.get.side_effect = [throttled, unavailable, Mock(text = "<html>ok</html>")]
+        
+        result = engine.fetch("https://example.com")
+        
+        assert result == "<html>ok</html>"
+        assert mock_sleep.call_args_list[0].args[0] == 7.0
+        assert engine.retry_policy.counters == {'throttled': 1, 'unavailable': 1}
+    
+    def test_get_with_retry_does_not_retry_client_errors(self, engine):
+        """Test that a 404 is not retried."""
+        not_found = Mock()
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(response = Mock(status_code = 404, headers = {}))
+        engine.session = Mock()
+        engine.session.get.return_value = not_found
+        
+        assert engine.fetch("https://example.com") is None
+        engine.session.get.assert_called_once()
     
-    @patch('src.BeautifulSoupEngine.requests.get')
-    def test_get_with_retry_handles_unexpected_error(self, mock_get, engine):
+    @patch('src.BeautifulSoupEngine.time.sleep')
+    def test_get_with_retry_stops_when_budget_is_exhausted(self, mock_sleep, engine):
+        """Test that no retry happens once the run's retry budget is spent."""
+        engine.retry_policy.budget = 1
+        engine.session = Mock()
+        engine.session.get.side_effect = requests.exceptions.ConnectionError("reset")
+        
+        assert engine.fetch("https://example.com/1") is None
+        assert engine.fetch("https://example.com/2") is None
+        
+        assert engine.session.get.call_count == 3  # 2 attempts for the first URL, 1 for the second
+        assert engine.retry_policy.counters == {'connection': 1, 'budget_exhausted': 2}
+    
+    def test_get_with_retry_handles_unexpected_error(self, engine):
         """Test handling of unexpected errors."""
         url = "https://example.com"
-        mock_get.side_effect = Exception("Unexpected error")
+        engine.session = Mock()
+        engine.session.get.side_effect = Exception("Unexpected error")
         
         result = engine.get_with_retry(url)
         
         assert result is None
-        mock_get.assert_called_once()
+        engine.session.get.assert_called_once()
     
-    @patch('src.BeautifulSoupEngine.requests.get')
-    def test_get_with_retry_uses_proxies_when_configured(self, mock_get, engine):
-        """Test that proxies are used when configured."""
-        engine.config['proxies'] = ['http://proxy1.com:8080']
-        url = "https://example.com"
-        mock_response = Mock()
-        mock_response.text = "<html>test</html>"
-        mock_get.return_value = mock_response
+    def test_fetch_serves_cached_body_without_request(self, engine):
+        """Test that a cache hit does not send any request."""
+        engine.cache = Mock()
+        engine.cache.get.return_value = "<html>cached</html>"
+        engine.session = Mock()
         
-        with patch('src.BeautifulSoupEngine.bs'):
-            engine.get_with_retry(url)
+        result = engine.fetch("https://www.linkedin.com/jobs/view/1/")
         
-        mock_get.assert_called_once_with(
-            url,
-            proxies=['http://proxy1.com:8080'],
-            headers=engine.config['headers'],
-            timeout=engine.config['request_timeout']
-        )
+        assert result == "<html>cached</html>"
+        engine.session.get.assert_not_called()
+    
+    def test_fetch_stores_successful_response_in_cache(self, engine):
+        """Test that a fetched body is written to the cache."""
+        engine.cache = Mock()
+        engine.cache.get.return_value = None
+        engine.session = Mock()
+        engine.session.get.return_value = Mock(text = "<html>fresh</html>")
+        
+        result = engine.fetch("https://www.linkedin.com/jobs/view/1/")
+        
+        assert result == "<html>fresh</html>"
+        engine.cache.set.assert_called_once_with("https://www.linkedin.com/jobs/view/1/", "<html>fresh</html>")
+    
+    def test_fetch_bypasses_cached_search_pages_after_first_round(self, engine):
+        """Test that later search rounds refetch the card pages but still read cached descriptions."""
+        engine.cache = Mock()
+        engine.cache.get.return_value = "<html>cached</html>"
+        engine.session = Mock()
+        engine.session.get.return_value = Mock(text = "<html>fresh</html>")
+        engine.search_round = 1
+        
+        assert engine.fetch("https://www.linkedin.com/jobs/search?start=0", 'job_cards') == "<html>fresh</html>"
+        assert engine.fetch("https://www.linkedin.com/jobs/view/1/", 'job_descriptions') == "<html>cached</html>"
+        engine.session.get.assert_called_once()
+        engine.cache.set.assert_called_once_with("https://www.linkedin.com/jobs/search?start=0", "<html>fresh</html>")
+    
+    def test_create_cache_disabled_by_default(self):
+        """Test that no cache is created unless enabled."""
+        assert BeautifulSoupEngine.create_cache({}) is None
+    
+    def test_get_with_retry_opens_session_lazily(self, engine):
+        """Test that get_with_retry works outside of a 'with' block."""
+        with patch.object(engine, 'create_session') as mock_create_session:
+            mock_create_session.return_value.get.return_value = Mock(text = "<html></html>")
+            engine.get_with_retry("https://example.com")
+        
+        mock_create_session.assert_called_once()
+        assert engine.session is mock_create_session.return_value
+    
+    def test_create_session_mounts_proxies_when_configured(self, engine):
+        """Test that proxies are mounted on the session when configured."""
+        engine.config['proxies'] = {'https': 'http://proxy1.com:8080'}
+        
+        session = engine.create_session()
+        
+        assert session.proxies['https'] == 'http://proxy1.com:8080'
+    
+    @patch('src.BeautifulSoupEngine.time.sleep')
+    def test_fetch_rotates_pool_proxies_and_reports_health(self, mock_sleep, sample_config, sample_preferences):
+        """Test that each attempt goes through a pool proxy and that failures are reported to the pool."""
+        sample_config['proxy_pool'] = {'proxies': [{'url': 'http://proxy1.com:8080', 'max_concurrency': 2},
+                                                   {'url': 'http://proxy2.com:8080', 'max_concurrency': 2}]}
+        engine = BeautifulSoupEngine(sample_config, sample_preferences)
+        engine.session = Mock()
+        engine.session.get.side_effect = [requests.exceptions.ConnectionError("reset"), Mock(text = "<html>ok</html>")]
+        
+        result = engine.fetch("https://www.linkedin.com/jobs/view/1/")
+        
+        assert result == "<html>ok</html>"
+        used = [call.kwargs['proxies']['https'] for call in engine.session.get.call_args_list]
+        assert set(used) <= {'http://proxy1.com:8080', 'http://proxy2.com:8080'}
+        assert engine.max_in_flight == 4
+        assert engine.get_proxies() is None
+        pool = engine.proxy_pool
+        assert sum(proxy.errors for proxy in pool.proxies) == 1
+        assert sum(proxy.requests for proxy in pool.proxies) == 2
+        assert all(proxy.in_flight == 0 for proxy in pool.proxies)
+    
+    def test_create_session_without_proxies(self, engine):
+        """Test that no proxy is mounted when none is configured."""
+        session = engine.create_session()
+        
+        assert 'https' not in session.proxies
     
     def test_cook_soup_job_cards_success(self, engine):
         """Test successful parsing of job cards from soup."""
@@ -275,58 +425,379 @@ class TestBeautifulSoupEngine:
         assert "python%20%26%20data%20science" in urls[0]
         assert "New%20York%2C%20NY" in urls[0]
     
-    @patch.object(BeautifulSoupEngine, 'get_with_retry')
+    @patch.object(BeautifulSoupEngine, 'fetch')
     @patch.object(BeautifulSoupEngine, 'cook_soup')
-    def test_process_url_job_cards_success(self, mock_cook_soup, mock_get_with_retry, engine):
+    def test_process_url_job_cards_success(self, mock_cook_soup, mock_fetch, engine):
         """Test successful processing of URL for job cards."""
         url = "https://example.com"
-        mock_soup = Mock()
-        mock_get_with_retry.return_value = mock_soup
+        mock_fetch.return_value = "<html></html>"
         mock_cook_soup.return_value = [{'title': 'Test Job'}]
         
         result = engine.process_url(url, 'job_cards')
         
         assert result == [{'title': 'Test Job'}]
-        mock_get_with_retry.assert_called_once_with(url)
-        mock_cook_soup.assert_called_once_with(mock_soup, 'job_cards')
+        mock_fetch.assert_called_once_with(url, 'job_cards')
+        mock_cook_soup.assert_called_once()
+        assert mock_cook_soup.call_args.args[1] == 'job_cards'
     
-    @patch.object(BeautifulSoupEngine, 'get_with_retry')
-    def test_process_url_returns_empty_list_on_failed_request(self, mock_get_with_retry, engine):
+    @patch.object(BeautifulSoupEngine, 'fetch')
+    def test_process_url_returns_empty_list_on_failed_request(self, mock_fetch, engine):
         """Test that process_url returns empty list when request fails."""
-        mock_get_with_retry.return_value = None
+        mock_fetch.return_value = None
         
         result = engine.process_url("https://example.com", 'job_cards')
         
         assert result == []
     
+    @patch.object(BeautifulSoupEngine, 'parse')
+    @patch.object(BeautifulSoupEngine, 'fetch')
+    def test_process_url_checkpoints_and_replays(self, mock_fetch, mock_parse, engine, tmp_path):
+        """Test that extracted data is checkpointed, then replayed by a resumed run without a request."""
+        engine.frontier = CrawlFrontier(tmp_path / "frontier.sqlite")
+        engine.frontier.begin()
+        card = JobCard(title = 'Test Job', job_url = 'https://www.linkedin.com/jobs/view/1/')
+        mock_fetch.return_value = "<html></html>"
+        mock_parse.return_value = [card]
+        engine.process_url("https://example.com", 'job_cards')
+
+        engine.frontier.begin(resume = True)
+        result = engine.process_url("https://example.com", 'job_cards')
+
+        assert result == [card]
+        assert isinstance(result[0], JobCard)
+        mock_fetch.assert_called_once()
+        engine.frontier.close()
+
+    @pytest.mark.parametrize("parser, partial_parsing, unique_texts", [('html.parser', False, False), ('lxml', True, False),
+                                                                        ('lxml', True, True)])
+    def test_parse_page_memory_per_thousand_cards(self, parser, partial_parsing, unique_texts, sample_preferences):
+        """Test the documented memory ceiling: 512 KiB retained per 1000 cards, one page tree at a time."""
+        server = LinkedInStubServer(results_per_query = 1000, padding_kb = 150)
+        pages = [server.render_search_page({'keywords': ['python'], 'location': ['Paris'], 'start': [str(start)]})
+                 for start in range(0, 1000, 25)]
+        server.server_close()
+        if unique_texts:
+            # Real searches rarely repeat a title or a company, nothing is shared between the cards
+            counter = itertools.count()
+            pages = [re.sub(r'(base-search-card__title">|hidden-nested-link" href="#">)[^<]*',
+                            lambda match: f"{match.group(1)}Senior Data Platform Engineer {next(counter)} - Cloud & Analytics (H/F)", html)
+                     for html in pages]
+        engine = BeautifulSoupEngine({'parser': parser, 'partial_parsing': partial_parsing}, sample_preferences)
+        engine.parse_page(pages[0], 'job_cards')
+        
+        # Without the garbage collector, only what is freed right away is freed
+        gc.collect()
+        gc.disable()
+        tracemalloc.start()
+        try:
+            cards = []
+            for html in pages:
+                cards.extend(engine.parse_page(html, 'job_cards'))
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            gc.enable()
+        
+        assert len(cards) == 1000
+        assert retained < 512 * 1024
+        assert peak < 8 * 1024 * 1024
+    
+    @patch.object(BeautifulSoupEngine, 'cook_soup')
+    def test_parse_page_uses_fast_description_path(self, mock_cook_soup, engine):
+        """Test that descriptions skip BeautifulSoup unless the fast path gives up."""
+        assert engine.parse_page(JOB_DESCRIPTION_PAGE, 'job_descriptions').startswith("About us")
+        mock_cook_soup.assert_not_called()
+        
+        engine.parse_page(JOB_DESCRIPTION_PAGE.replace("<br>", "<!-- --><br>"), 'job_descriptions')
+        mock_cook_soup.assert_called_once()
+    
+    def test_parse_runs_in_process_without_parse_workers(self, engine):
+        """Test that no process pool is started by default."""
+        with patch.object(engine, 'parse_page', return_value = 'text') as mock_parse_page:
+            assert engine.parse("<html></html>", 'job_descriptions') == 'text'
+        
+        mock_parse_page.assert_called_once_with("<html></html>", 'job_descriptions')
+        assert engine.parse_pool is None
+    
+    def test_parse_uses_worker_processes(self, sample_config, sample_preferences):
+        """Test that pages are parsed by the pool and the pool is stopped on close."""
+        sample_config.update({'parse_workers': 1, 'base_url': 'https://example.com'})
+        engine = BeautifulSoupEngine(sample_config, sample_preferences)
+        html = '<div data-entity-urn="urn:li:jobPosting:42"><div class="base-search-card__info"><h3>Job</h3></div></div>'
+        
+        try:
+            jobs = engine.parse(html, 'job_cards')
+            assert engine.parse_pool is not None
+        finally:
+            engine.close()
+        
+        assert jobs[0]['job_url'] == 'https://example.com/jobs/view/42/'
+        assert engine.parse_pool is None
+    
+    def test_parse_pool_created_once_by_concurrent_threads(self, sample_config, sample_preferences):
+        """Test that fetch threads reaching parse together share a single lazily created pool."""
+        sample_config['parse_workers'] = 2
+        engine = BeautifulSoupEngine(sample_config, sample_preferences)
+        barrier = threading.Barrier(8)
+        
+        def slow_pool(*args, **kwargs):
+            # Leave the other threads time to race for the pool
+            time.sleep(0.05)
+            pool = Mock()
+            pool.submit.return_value.result.return_value = []
+            return pool
+        
+        def parse():
+            barrier.wait()
+            engine.parse("<html></html>", 'job_cards')
+        
+        with patch('src.BeautifulSoupEngine.ProcessPoolExecutor', side_effect = slow_pool) as mock_pool:
+            threads = [threading.Thread(target = parse) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        mock_pool.assert_called_once()
+        engine.close()
+        assert engine.parse_pool is None
+    
+    @patch.object(BeautifulSoupEngine, 'cook_soup')
+    def test_parse_page_fast_extraction_can_be_disabled(self, mock_cook_soup, engine):
+        """Test the 'fast_extraction' switch."""
+        engine.fast_extraction = False
+        
+        engine.parse_page(JOB_DESCRIPTION_PAGE, 'job_descriptions')
+        
+        mock_cook_soup.assert_called_once()
+    
     def test_process_url_invalid_type_raises_error(self, engine):
         """Test that invalid type parameter raises ValueError."""
         with pytest.raises(ValueError, match="Invalid type: invalid"):
             engine.process_url("https://example.com", 'invalid')
     
-    @patch.object(BeautifulSoupEngine, 'generate_urls')
+    @patch.object(BeautifulSoupEngine, 'generate_round_urls')
     @patch.object(BeautifulSoupEngine, 'process_url')
-    def test_get_jobcards_aggregates_results(self, mock_process_url, mock_generate_urls, engine, sample_preferences):
+    def test_get_jobcards_aggregates_results(self, mock_process_url, mock_generate_round_urls, engine, sample_preferences):
         """Test that get_jobcards properly aggregates results from all URLs."""
-        mock_generate_urls.return_value = ["url1", "url2", "url3"]
+        mock_generate_round_urls.return_value = ["url1", "url2", "url3"]
         mock_process_url.side_effect = [
-            [{'title': 'Job 1'}],
-            [{'title': 'Job 2'}, {'title': 'Job 3'}],
-            [{'title': 'Job 4'}]
+            [{'title': 'Job 1', 'job_url': 'https://www.linkedin.com/jobs/view/1/'}],
+            [{'title': 'Job 2', 'job_url': 'https://www.linkedin.com/jobs/view/2/'},
+             {'title': 'Job 3', 'job_url': 'https://www.linkedin.com/jobs/view/3/'}],
+            [{'title': 'Job 4', 'job_url': 'https://www.linkedin.com/jobs/view/4/'}]
         ]
         
         result = engine.get_jobcards(sample_preferences)
         
-        expected = [
-            {'title': 'Job 1'},
-            {'title': 'Job 2'},
-            {'title': 'Job 3'},
-            {'title': 'Job 4'}
-        ]
-        assert result == expected
-        mock_generate_urls.assert_called_once_with(sample_preferences)
+        assert [job['title'] for job in result] == ['Job 1', 'Job 2', 'Job 3', 'Job 4']
+        mock_generate_round_urls.assert_called_once_with(sample_preferences)
         assert mock_process_url.call_count == 3
     
+    def test_saturation_mode_stops_when_rounds_stop_finding_new_postings(self, engine, sample_preferences):
+        """Test that extra rounds stop once their share of new postings is below the threshold."""
+        engine.config.update({'rounds': 5, 'rounds_mode': 'saturation', 'min_round_yield': 0.1})
+        engine.logger = Mock()
+        rounds = iter([
+            [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(20)]],       # 20 new
+            [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(15, 25)]],   # 5 new (25%)
+            [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(20, 26)]],   # 1 new (4%)
+        ])
+        
+        with patch.object(engine, 'iter_round', side_effect = lambda preferences: next(rounds)):
+            pages = list(engine.iter_jobcards(sample_preferences))
+        
+        assert len(pages) == 3
+        engine.logger.info.assert_any_call("Round yield curve (new postings per round): [20, 5, 1]")
+    
+    def test_saturation_mode_does_not_stop_on_a_failed_round(self, engine, sample_preferences):
+        """Test that a round whose pages all failed is not mistaken for a saturated search."""
+        engine.config.update({'rounds': 3, 'rounds_mode': 'saturation', 'min_round_yield': 0.1, 'pages_to_scrape': 1})
+        engine.logger = Mock()
+        sample_preferences['search_queries'] = sample_preferences['search_queries'][:1]
+        rounds = iter([
+            [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(20)]],
+            [FailedPage()],
+            [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(15, 25)]],
+        ])
+        
+        with patch.object(engine, 'map_urls', side_effect = lambda urls, type: next(rounds)):
+            list(engine.iter_jobcards(sample_preferences))
+        
+        engine.logger.info.assert_any_call("Round yield curve (new postings per round): [20, 0, 5]")
+        engine.logger.warning.assert_any_call("Round 2: 1 search pages failed")
+    
+    def test_fixed_rounds_mode_runs_every_round(self, engine, sample_preferences):
+        """Test that the default mode keeps repeating the search 'rounds' times."""
+        engine.config['rounds'] = 3
+        page = [{'job_url': 'https://www.linkedin.com/jobs/view/1/'}]
+        
+        with patch.object(engine, 'iter_round', side_effect = lambda preferences: iter([page])) as mock_iter_round:
+            pages = list(engine.iter_jobcards(sample_preferences))
+        
+        assert len(pages) == 3
+        assert mock_iter_round.call_count == 3
+    
+    @patch.object(BeautifulSoupEngine, 'process_url')
+    def test_map_urls_threads_mode_keeps_order(self, mock_process_url, engine):
+        """Test that the thread-pool mode returns results aligned with the input URLs."""
+        engine.config['execution_mode'] = 'threads'
+        engine.max_in_flight = 4
+        mock_process_url.side_effect = lambda url, type: f"{type}:{url}"
+        urls = [f"url{i}" for i in range(20)]
+        
+        result = engine.map_urls(urls, 'job_descriptions')
+        
+        assert result == [f"job_descriptions:url{i}" for i in range(20)]
+        assert mock_process_url.call_count == 20
+    
+    def test_get_with_retry_acquires_rate_limiter_per_attempt(self, engine):
+        """Test that every attempt takes a token from the limiter of the target host."""
+        engine.session = Mock()
+        engine.session.get.side_effect = [requests.exceptions.Timeout(), Mock(text = "<html></html>")]
+        with patch.object(engine.rate_limiter, 'acquire') as mock_acquire, patch('src.BeautifulSoupEngine.time.sleep'):
+            engine.get_with_retry("https://www.linkedin.com/jobs/view/1/")
+        
+        assert mock_acquire.call_count == 2
+        mock_acquire.assert_called_with('www.linkedin.com')
+    
+    @patch.object(BeautifulSoupEngine, 'generate_round_urls')
+    @patch.object(BeautifulSoupEngine, 'map_urls')
+    def test_iter_jobcards_yields_pages_in_chunks(self, mock_map_urls, mock_generate_round_urls, engine, sample_preferences):
+        """Test that job cards are yielded page by page, fetched max_in_flight pages at a time."""
+        engine.config['execution_mode'] = 'threads'
+        engine.max_in_flight = 2
+        mock_generate_round_urls.return_value = ["url1", "url2", "url3"]
+        mock_map_urls.side_effect = lambda urls, type: [[{'job_url': url}] for url in urls]
+        
+        pages = list(engine.iter_jobcards(sample_preferences))
+        
+        assert pages == [[{'job_url': 'url1'}], [{'job_url': 'url2'}], [{'job_url': 'url3'}]]
+        assert [call.args[0] for call in mock_map_urls.call_args_list] == [["url1", "url2"], ["url3"]]
+    
+    def test_get_job_posting_id(self):
+        """Test that the posting id is read from the job URL."""
+        assert BeautifulSoupEngine.get_job_posting_id({'job_url': 'https://www.linkedin.com/jobs/view/123456/'}) == '123456'
+    
+    def test_adaptive_pagination_stops_exhausted_queries(self, engine, sample_preferences):
+        """Test that a query stops paging after a short, empty or already known page."""
+        engine.config.update({'adaptive_pagination': True, 'page_size': 2, 'pages_to_scrape': 4, 'rounds': 2})
+        engine.logger = Mock()
+        
+        def cards(*ids):
+            return [{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in ids]
+        
+        # python developer: full, full, short -> stops at page 3
+        # data scientist: empty -> stops at page 1
+        responses = {
+            ('python%20developer', 0): cards(1, 2),
+            ('python%20developer', 2): cards(3, 4),
+            ('python%20developer', 4): cards(5),
+            ('data%20scientist', 0): [],
+        }
+        requested = []
+        
+        def fake_map_urls(urls, type):
+            requested.extend(urls)
+            return [responses[(url.split('keywords=')[1].split('&')[0], int(url.split('start=')[1]))] for url in urls]
+        
+        with patch.object(engine, 'map_urls', side_effect = fake_map_urls):
+            pages = list(engine.iter_jobcards(sample_preferences))
+        
+        # Round 1: 3 + 1 requests. Round 2: first pages only (already known / empty)
+        assert len(requested) == 6
+        assert sum(len(page) for page in pages) == 7
+        engine.logger.info.assert_called_with("Search requests: 6 sent, 10 saved out of 16")
+    
+    def test_adaptive_pagination_stops_at_postings_stored_by_previous_runs(self, engine, sample_preferences, tmp_path):
+        """Test that a page only made of postings already in the seen postings index ends the query."""
+        engine.config.update({'adaptive_pagination': True, 'page_size': 2, 'pages_to_scrape': 4, 'rounds': 1})
+        engine.seen_postings = SeenPostings(tmp_path / "seen.u64")
+        engine.seen_postings.add([3, 4])
+        sample_preferences['search_queries'] = sample_preferences['search_queries'][:1]
+        pages = {0: [1, 2], 2: [3, 4], 4: [5, 6]}
+        requested = []
+        
+        def fake_map_urls(urls, type):
+            requested.extend(urls)
+            return [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in pages[int(url.split('start=')[1])]] for url in urls]
+        
+        with patch.object(engine, 'map_urls', side_effect = fake_map_urls):
+            list(engine.iter_jobcards(sample_preferences))
+        
+        assert len(requested) == 2
+        assert engine.all_known({'1', '3'}, {'1'})
+        assert not engine.all_known({'1', '5'}, {'1'})
+    
+    def test_adaptive_pagination_retries_a_failed_page(self, engine, sample_preferences):
+        """Test that a failed page neither ends its query nor counts as a saved request."""
+        engine.config.update({'adaptive_pagination': True, 'page_size': 2, 'pages_to_scrape': 4, 'rounds': 1})
+        engine.logger = Mock()
+        sample_preferences['search_queries'] = sample_preferences['search_queries'][:1]
+        failures = {2: 1, 4: 2}
+        requested = []
+        
+        def fake_map_urls(urls, type):
+            requested.extend(urls)
+            results = []
+            for url in urls:
+                start = int(url.split('start=')[1])
+                if failures.get(start):
+                    failures[start] -= 1
+                    results.append(FailedPage())
+                else:
+                    results.append([{'job_url': f'https://www.linkedin.com/jobs/view/{start + i}/'} for i in range(2)])
+            return results
+        
+        with patch.object(engine, 'map_urls', side_effect = fake_map_urls):
+            pages = list(engine.iter_jobcards(sample_preferences))
+        
+        # Page 2 recovers on its retry, page 3 fails twice and is skipped, page 4 is still requested
+        assert [int(url.split('start=')[1]) for url in requested] == [0, 2, 2, 4, 4, 6]
+        assert len(pages) == 3
+        engine.logger.info.assert_any_call("Search requests: 6 sent (3 failed), 0 saved out of 4")
+    
+    def test_build_search_url_uses_page_size_offset(self, engine):
+        """Test that the start offset follows the configured page size."""
+        engine.config['page_size'] = 10
+        url = engine.build_search_url({'keywords': 'data', 'location': 'Paris', 'f_WT': ''}, 3)
+        
+        assert url.endswith("&start=30")
+    
+    def test_build_search_url_incremental_window(self, engine, tmp_path):
+        """Test that incremental crawling sorts by date and narrows the window to the time since the last run."""
+        query = {'keywords': 'data', 'location': 'Paris', 'f_WT': ''}
+        engine.config['max_age'] = 'r86400'
+        engine.high_water_marks = HighWaterMarks(tmp_path / "marks.json", overlap = 0, granularity = 3600)
+        assert "&f_TPR=r86400&sortBy=DD&start=0" in engine.build_search_url(query, 0)
+        
+        engine.high_water_marks.observe(query, ['4000000001'])
+        engine.high_water_marks.commit()
+        
+        assert "&f_TPR=r3600&sortBy=DD&start=0" in engine.build_search_url(query, 0)
+    
+    def test_incremental_paging_stops_behind_the_mark(self, engine, sample_preferences, tmp_path):
+        """Test that a query stops paging at the first page reaching postings of a previous run."""
+        engine.config.update({'page_size': 2, 'pages_to_scrape': 4, 'rounds': 1})
+        engine.high_water_marks = HighWaterMarks(tmp_path / "marks.json")
+        query = sample_preferences['search_queries'][0]
+        preferences = {'search_queries': [query]}
+        engine.high_water_marks.observe(query, ['10'])
+        engine.high_water_marks.commit()
+        pages = {0: [14, 13], 1: [12, 10], 2: [9, 8]}
+        
+        def map_urls(urls, type):
+            page = int(urls[0].split('start=')[1]) // 2
+            return [[{'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in pages[page]]]
+        
+        with patch.object(engine, 'map_urls', side_effect = map_urls):
+            cards = [job for jobs in engine.iter_jobcards(preferences) for job in jobs]
+        
+        assert len(cards) == 4
+        assert engine.search_requests == 2
+        engine.high_water_marks.commit()
+        assert engine.high_water_marks.mark(query)['newest_id'] == 14
+    
     @patch.object(BeautifulSoupEngine, 'process_url')
     def test_get_job_descriptions_processes_all_urls(self, mock_process_url, engine):
         """Test that get_job_descriptions processes all provided URLs."""
@@ -341,6 +812,118 @@ class TestBeautifulSoupEngine:
             mock_process_url.assert_any_call(url, 'job_descriptions')
 
 
+JOB_CARDS_PAGE = """
+<li>
+    <div class="base-card" data-entity-urn="urn:li:jobPosting:4100000001">
+        <a class="base-card__full-link" href="#"><span class="sr-only">Data Engineer</span></a>
+        <div class="base-search-card__info">
+            <h3 class="base-search-card__title">
+                Data Engineer
+            </h3>
+            <h4 class="base-search-card__subtitle">
+                <a class="hidden-nested-link" href="#">
+                    ACME &amp; Co
+                </a>
+            </h4>
+            <div class="base-search-card__metadata">
+                <span class="job-search-card__location">Paris, Île-de-France, France</span>
+                <time class="job-search-card__listdate--new" datetime="2024-01-20">1 hour ago</time>
+            </div>
+        </div>
+    </div>
+</li>
+<li>
+    <div class="base-card" data-entity-urn="urn:li:jobPosting:4100000002">
+        <div class="base-search-card__info">
+            <h3 class="base-search-card__title">ML Engineer</h3>
+            <span class="job-search-card__location">Lyon</span>
+            <time class="job-search-card__listdate" datetime="2024-01-18">2 days ago</time>
+        </div>
+    </div>
+</li>
+<div class="base-search-card__info"><h3>Orphan card without urn</h3></div>
+"""
+
+JOB_DESCRIPTION_PAGE = """
+<html><head><title>Job</title></head><body>
+<section class="core-section-container">
+    <div class="description__text description__text--rich">
+        <section class="show-more-less-html">
+            <div class="show-more-less-html__markup">
+                <strong>About us</strong><br><br>
+                We build <em>data</em> platforms &amp; pipelines.<br>
+                <ul>
+                    <li>Python &gt; 3 years</li>
+                    <li>SQL<ul><li>PostgreSQL</li></ul></li>
+                </ul>
+                <ol><li>Apply</li></ol>
+                <p>Salary: 50k€ <a href="#">link</a> <span>hidden</span></p>
+            </div>
+        </section>
+        <button class="show-more-less-html__button">Show more</button>
+        <button class="show-more-less-html__button">Show less</button>
+    </div>
+</section>
+</body></html>
+"""
+
+
+class TestBeautifulSoupEngineParsers:
+    """Parser backends and partial parsing must produce the same data as the default parser."""
+    
+    @pytest.fixture
+    def reference_engine(self):
+        """Engine using the full 'html.parser' tree."""
+        return BeautifulSoupEngine({'parser': 'html.parser', 'partial_parsing': False}, {})
+    
+    @pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+    @pytest.mark.parametrize("partial_parsing", [False, True])
+    @pytest.mark.parametrize("html,type", [
+        (JOB_CARDS_PAGE, 'job_cards'),
+        (JOB_DESCRIPTION_PAGE, 'job_descriptions'),
+        ("<html></html>", 'job_cards'),
+        ("<html></html>", 'job_descriptions'),
+        ('<div class="base-search-card__info"><!-- Missing required elements --></div>', 'job_cards'),
+    ])
+    def test_parsers_produce_same_output(self, reference_engine, parser, partial_parsing, html, type):
+        """Test that every backend extracts exactly what the default parser extracts."""
+        if parser != 'html.parser':
+            pytest.importorskip(parser)
+        engine = BeautifulSoupEngine({'parser': parser, 'partial_parsing': partial_parsing}, {})
+        
+        expected = reference_engine.cook_soup(reference_engine.make_soup(html, type), type)
+        result = engine.cook_soup(engine.make_soup(html, type), type)
+        
+        assert result == expected
+    
+    def test_reference_outputs(self, reference_engine):
+        """Sanity check of the reference fixtures."""
+        jobs = reference_engine.cook_soup(reference_engine.make_soup(JOB_CARDS_PAGE), 'job_cards')
+        description = reference_engine.cook_soup(reference_engine.make_soup(JOB_DESCRIPTION_PAGE), 'job_descriptions')
+        
+        assert [job['job_url'] for job in jobs] == ['https://www.linkedin.com/jobs/view/4100000001/',
+                                                     'https://www.linkedin.com/jobs/view/4100000002/']
+        assert jobs[0]['company'] == 'ACME & Co'
+        assert jobs[1]['company'] == ''
+        assert "- Python > 3 years" in description
+        assert "hidden" not in description
+    
+    def test_partial_parsing_keeps_only_useful_nodes(self):
+        """Test that the strainer drops the rest of the page."""
+        engine = BeautifulSoupEngine({'partial_parsing': True}, {})
+        
+        soup = engine.make_soup(JOB_DESCRIPTION_PAGE, 'job_descriptions')
+        
+        assert soup.find('title') is None
+        assert soup.find('div', class_='description__text description__text--rich') is not None
+    
+    def test_unknown_parser_falls_back_to_html_parser(self):
+        """Test that an unavailable backend is replaced by the default one."""
+        engine = BeautifulSoupEngine({'parser': 'not-a-parser'}, {})
+        
+        assert engine.parser == 'html.parser'
+
+
 class TestBeautifulSoupEngineIntegration:
     """Integration tests for BeautifulSoupEngine."""
     
@@ -366,8 +949,8 @@ class TestBeautifulSoupEngineIntegration:
                 assert hasattr(engine, 'config')
                 assert hasattr(engine, 'logger')
     
-    @patch('src.BeautifulSoupEngine.requests.get')
-    def test_full_job_card_extraction_flow(self, mock_get, engine_config):
+    @patch('src.BeautifulSoupEngine.requests.Session')
+    def test_full_job_card_extraction_flow(self, mock_session, engine_config):
         """Test the complete flow of extracting job cards."""
         # Mock HTML response that resembles LinkedIn structure
         mock_html = """
@@ -383,7 +966,7 @@ class TestBeautifulSoupEngineIntegration:
         
         mock_response = Mock()
         mock_response.text = mock_html
-        mock_get.return_value = mock_response
+        mock_session.return_value.get.return_value = mock_response
         
         preferences = {
             'search_queries': [{
@@ -421,4 +1004,30 @@ class TestBeautifulSoupEngineIntegration:
                 assert job['company'] == 'Amazing Tech Co'
                 assert job['location'] == 'Remote'
                 assert job['date'] == '2024-01-20'
-                assert job['job_url'] == 'https://www.linkedin.com/jobs/view/987654/' 
\ No newline at end of file
+                assert job['job_url'] == 'https://www.linkedin.com/jobs/view/987654/' 
+    
+    def test_session_reuses_connections(self, engine_config):
+        """Test that a keep-alive session serves many requests over one connection."""
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def do_GET(self):
+                body = b"<html></html>"
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target = httpd.serve_forever, daemon = True).start()
+        try:
+            with patch('src.BeautifulSoupEngine.LoggerManager'):
+                with BeautifulSoupEngine(engine_config, {}) as engine:
+                    for i in range(5):
+                        assert engine.get_with_retry(f"http://127.0.0.1:{httpd.server_port}/{i}") is not None
+                    assert engine.get_connection_stats() == (5, 1)
+        finally:
+            httpd.shutdown()
@@ -0,0 +1,91 @@
+# tests/test_crawl_frontier.py
+
+import pytest
+
+from src.utils.CrawlFrontier import CrawlFrontier
+
+
+class TestCrawlFrontier:
+    """Test suite for the SQLite crawl frontier."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Fixture providing the path of the checkpoint database."""
+        return tmp_path / "frontier.sqlite"
+
+    @pytest.fixture
+    def frontier(self, path):
+        """Fixture providing a started frontier."""
+        frontier = CrawlFrontier(path)
+        frontier.begin()
+        yield frontier
+        frontier.close()
+
+    def test_from_config_disabled_by_default(self, path):
+        """Test that no frontier is created unless enabled."""
+        assert CrawlFrontier.from_config(None) is None
+        assert CrawlFrontier.from_config({'path': str(path)}) is None
+        assert isinstance(CrawlFrontier.from_config({'enabled': True, 'path': str(path)}), CrawlFrontier)
+
+    def test_replay_missing_then_recorded(self, path, frontier):
+        """Test that a recorded request is replayed by a resumed run only."""
+        url = "https://www.linkedin.com/jobs/view/1/"
+        assert frontier.replay(url) is CrawlFrontier.MISSING
+        frontier.record(url, 'job_descriptions', "Python job")
+
+        resumed = CrawlFrontier(path)
+        assert resumed.is_unfinished()
+        assert resumed.begin(resume = True) == 1
+        assert resumed.replay(url) == "Python job"
+        assert resumed.replayed == 1
+        resumed.close()
+
+    def test_none_is_a_valid_record(self, path, frontier):
+        """Test that an empty extraction is replayed, not refetched."""
+        url = "https://www.linkedin.com/jobs/view/1/"
+        frontier.replay(url)
+        frontier.record(url, 'job_descriptions', None)
+
+        frontier.begin(resume = True)
+        assert frontier.replay(url) is None
+
+    def test_occurrences_of_a_url_are_replayed_in_order(self, frontier):
+        """Test that each search round replays its own result of the same URL."""
+        url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?start=0"
+        for round_cards in (['a'], ['b']):
+            frontier.replay(url)
+            frontier.record(url, 'job_cards', round_cards)
+
+        frontier.begin(resume = True)
+        assert frontier.replay(url) == ['a']
+        assert frontier.replay(url) == ['b']
+        assert frontier.replay(url) is CrawlFrontier.MISSING
+
+    def test_begin_without_resume_discards_unfinished_run(self, path, frontier):
+        """Test that a new run starts from an empty frontier."""
+        frontier.replay("u")
+        frontier.record("u", 'job_cards', [])
+        frontier.queue_descriptions([{'job_url': 'u1'}])
+
+        assert frontier.begin(resume = False) == 0
+        assert frontier.replay("u") is CrawlFrontier.MISSING
+        assert frontier.pending_descriptions() == []
+
+    def test_finish_clears_the_run(self, path, frontier):
+        """Test that a completed run leaves nothing to resume."""
+        frontier.replay("u")
+        frontier.record("u", 'job_cards', [])
+        frontier.finish()
+
+        resumed = CrawlFrontier(path)
+        assert not resumed.is_unfinished()
+        assert resumed.begin(resume = True) == 0
+        resumed.close()
+
+    def test_pending_descriptions_queue(self, frontier):
+        """Test that pending cards are kept in order until completed."""
+        frontier.queue_descriptions([{'job_url': 'u1', 'title': 'A'}, {'job_url': 'u2', 'title': 'B'}])
+        frontier.complete_descriptions(['u1'])
+
+        assert frontier.pending_descriptions() == [{'job_url': 'u2', 'title': 'B'}]
+        assert frontier.summary() == "0 responses replayed, 0 checkpointed, 1 descriptions pending"
@@ -0,0 +1,144 @@
+# tests/test_description_extractor.py
+
+import pytest
+import random
+
+from scripts.linkedin_stub_server import LinkedInStubServer
+from src.BeautifulSoupEngine import BeautifulSoupEngine
+from src.utils.DescriptionExtractor import DescriptionExtractor
+
+
+def wrap(description: str) -> str:
+    """Embed a description block in a job page."""
+    return ('<html><head><title>Job</title><script>var x = "<div>";</script></head><body>'
+            '<div class="top-card"><div><span>Top card</span></div></div>'
+            f'<section><div class="description__text description__text--rich">{description}</div></section>'
+            '<div class="similar-jobs"><ul><li>Other job</li></ul></div></body></html>')
+
+
+DESCRIPTIONS = [
+    # LinkedIn-like markup
+    """
+        <section class="show-more-less-html">
+            <div class="show-more-less-html__markup">
+                <strong>About us</strong><br><br>
+                We build <em>data</em> platforms &amp; pipelines.<br/>
+                <ul>
+                    <li>Python &gt; 3 years</li>
+                    <li>SQL<ul><li>PostgreSQL</li></ul></li>
+                </ul>
+                <ol><li>Apply</li></ol>
+                <p>Salary: 50k&euro; <a href="#">link</a> <span>hidden <a>nested</a></span></p>
+            </div>
+        </section>
+        <button class="show-more-less-html__button">Show more</button>
+        <button class="show-more-less-html__button">Show less</button>
+    """,
+    # Nested divs, lists in lists, entities and non-breaking spaces
+    "<div><div><p>Team&nbsp;lead</p></div>\n\t<div> </div></div><ul><li><ol><li>deep</li></ol></li><li> </li></ul>",
+    # Whitespace only nodes of every kind, '::marker' and dashes
+    "<p>::marker item</p>\r\n<p>a -</p>\n\n\n<p>b</p>\t<p>-\n</p>",
+    # Empty block
+    "",
+    # Text only
+    "Just some text with a - dash\nand a line break",
+    # Uppercase tags and attributes with '>' free values
+    '<P CLASS="x">Upper</P><UL><LI>Item</LI></UL><SPAN>gone</SPAN>',
+]
+
+
+class TestDescriptionExtractor:
+    """Test suite for DescriptionExtractor class."""
+
+    @pytest.fixture(params = [('html.parser', False), ('html.parser', True), ('lxml', False), ('lxml', True)])
+    def engine(self, request):
+        """Fixture providing a BeautifulSoup-only engine for every parser setting."""
+        parser, partial_parsing = request.param
+        if parser != 'html.parser':
+            pytest.importorskip(parser)
+        return BeautifulSoupEngine({'parser': parser, 'partial_parsing': partial_parsing, 'fast_extraction': False}, {})
+
+    @staticmethod
+    def slow_path(engine, html):
+        return engine.cook_soup(engine.make_soup(html, 'job_descriptions'), 'job_descriptions')
+
+    @pytest.mark.parametrize("description", DESCRIPTIONS)
+    def test_same_output_as_beautifulsoup(self, engine, description):
+        """Test that the fast path returns exactly the text of cook_soup."""
+        html = wrap(description)
+
+        assert DescriptionExtractor.extract(html) == self.slow_path(engine, html)
+
+    def test_same_output_on_stub_pages(self, engine):
+        """Test the synthetic pages of the stand-in server."""
+        with LinkedInStubServer(padding_kb = 5) as server:
+            html = server.render_job_page(4000000123)
+
+        assert DescriptionExtractor.extract(html) == self.slow_path(engine, html)
+
+    def test_same_output_on_random_markup(self, engine):
+        """Test randomly generated descriptions following the HTML content model."""
+        rng = random.Random(42)
+        texts = ['word', ' ', '\n', '\n  \t', '-', 'Show more', '&amp; co', '::marker', 'a -\n', '&nbsp;']
+
+        def phrasing(depth, in_link = False):
+            parts = []
+            for _ in range(rng.randint(0, 3)):
+                tags = ['strong', 'em', 'span'] + ([] if in_link else ['a'])
+                if depth < 5 and rng.random() < 0.4:
+                    tag = rng.choice(tags)
+                    parts.append(f"<{tag}>{phrasing(depth + 1, in_link or tag == 'a')}</{tag}>")
+                elif rng.random() < 0.2:
+                    parts.append('<br>')
+                else:
+                    parts.append(rng.choice(texts))
+            return ''.join(parts)
+
+        def flow(depth):
+            parts = []
+            for _ in range(rng.randint(0, 4)):
+                kind = rng.choice(['p', 'div', 'section', 'list', 'inline']) if depth < 4 else 'inline'
+                if kind == 'p':
+                    parts.append(f"<p>{phrasing(depth + 1)}</p>")
+                elif kind == 'list':
+                    tag = rng.choice(['ul', 'ol'])
+                    items = ''.join(f"<li>{flow(depth + 1)}</li>" + rng.choice(texts[1:4]) for _ in range(rng.randint(0, 3)))
+                    parts.append(f"<{tag}>{items}</{tag}>")
+                elif kind == 'inline':
+                    parts.append(phrasing(depth + 1))
+                else:
+                    parts.append(f"<{kind}>{flow(depth + 1)}</{kind}>")
+            return ''.join(parts)
+
+        for _ in range(300):
+            html = wrap(flow(0))
+            assert DescriptionExtractor.extract(html) == self.slow_path(engine, html), html
+
+    @pytest.mark.parametrize("description", [
+        "<p>unclosed",
+        "<ul><li>one<li>two</ul>",
+        "<p>text</span></p>",
+        "<!-- comment --><p>text</p>",
+        "<pre>  keep   spaces </pre>",
+        "<script>var a;</script>",
+        "<span/>after",
+        "<![CDATA[x]]>",
+        "<p><div>block in paragraph</div></p>",
+        "<a>outer<a>inner</a></a>",
+        "<li>orphan item</li>",
+    ])
+    def test_unexpected_markup_falls_back(self, description):
+        """Test that markup the fast path cannot mirror is left to BeautifulSoup."""
+        assert DescriptionExtractor.extract(wrap(description)) is None
+
+    def test_missing_or_unterminated_block(self):
+        """Test pages without a complete description block."""
+        assert DescriptionExtractor.extract("<html><body><p>No description</p></body></html>") is None
+        assert DescriptionExtractor.extract('<div class="description__text description__text--rich"><div>') is None
+        assert DescriptionExtractor.extract('<div class="description__text--rich description__text">x</div>') is None
+
+    def test_locate_returns_inner_html(self):
+        """Test that nested divs are balanced to find the end of the block."""
+        html = "<div class='description__text description__text--rich' id=d><div>a</div><div/>b</div><div>c</div>"
+
+        assert DescriptionExtractor.locate(html) == "<div>a</div><div/>b"
@@ -0,0 +1,54 @@
+# tests/test_elasticsearch_engine.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ElasticSearchEngine import ElasticSearchEngine
+
+
+class TestElasticSearchEngine:
+    """Test suite for the bulk insertion of the Elasticsearch engine."""
+
+    @pytest.fixture
+    def engine(self):
+        """Fixture providing an engine with a mocked client."""
+        engine = ElasticSearchEngine({'hosts': "http://localhost:9200", 'verify_certs': False}, logger = MagicMock())
+        engine.es = MagicMock()
+        engine.es.indices.exists.return_value = True
+        return engine
+
+    def test_insert_bulk_data_without_ids(self, engine):
+        """Test that plain insertions keep generated ids."""
+        engine.es.bulk.return_value = {'errors': False, 'items': [{'index': {'status': 201}}]}
+
+        engine.insert_bulk_data([{'title': "A"}], index = "jobs")
+
+        assert engine.es.bulk.call_args.kwargs['body'] == [{'index': {'_index': "jobs"}}, {'title': "A"}]
+
+    def test_create_only_ignores_conflicts(self, engine):
+        """Test that create operations carry the ids and that 409 conflicts are not errors."""
+        response = {'errors': True, 'items': [{'create': {'status': 201}},
+                                              {'create': {'status': 409, 'error': {'type': 'version_conflict_engine_exception'}}}]}
+        engine.es.bulk.return_value = response
+
+        assert engine.insert_bulk_data([{'title': "A"}, {'title': "B"}], ids = ['1', None], create_only = True) is response
+        assert engine.es.bulk.call_args.kwargs['body'] == [{'create': {'_index': "jobs", '_id': '1'}}, {'title': "A"},
+                                                           {'create': {'_index': "jobs"}}, {'title': "B"}]
+
+    def test_create_only_raises_other_errors(self, engine):
+        """Test that failures other than conflicts still raise."""
+        engine.es.bulk.return_value = {'errors': True, 'items': [
+            {'create': {'status': 409, 'error': {'type': 'version_conflict_engine_exception'}}},
+            {'create': {'status': 400, 'error': {'type': 'mapper_parsing_exception'}}}]}
+
+        with pytest.raises(Exception, match = "1 errors"):
+            engine.insert_bulk_data([{'title': "A"}, {'title': "B"}], ids = ['1', '2'], create_only = True)
+
+    def test_index_identity_reads_uuid_and_count(self, engine):
+        """Test that the identity carries the UUID of the concrete index and the refreshed count."""
+        engine.es.indices.get_settings.return_value = {'jobs-v2': {'settings': {'index': {'uuid': "abc"}}}}
+        engine.es.count.return_value = {'count': 42}
+
+        assert engine.index_identity("jobs") == {'uuid': "abc", 'count': 42}
+        engine.es.indices.refresh.assert_called_once_with(index = "jobs")
@@ -0,0 +1,106 @@
+# tests/test_high_water_marks.py
+
+import json
+import pytest
+from unittest.mock import patch
+
+from src.utils.HighWaterMarks import HighWaterMarks
+
+
+class TestHighWaterMarks:
+    """Test suite for the per-query high-water marks."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Fixture providing the path of the marks file."""
+        return tmp_path / "high_water_marks.json"
+
+    @pytest.fixture
+    def query(self):
+        """Fixture providing a search query."""
+        return {'keywords': 'python', 'location': 'Paris', 'f_WT': '2'}
+
+    def test_from_config_disabled_by_default(self, path):
+        """Test that no store is created unless enabled."""
+        assert HighWaterMarks.from_config(None) is None
+        assert HighWaterMarks.from_config({'path': str(path)}) is None
+        assert isinstance(HighWaterMarks.from_config({'enabled': True, 'path': str(path)}), HighWaterMarks)
+
+    def test_window_without_mark_is_max_age(self, path, query):
+        """Test that a query never scraped uses the configured window."""
+        assert HighWaterMarks(path).window(query, "r86400") == "r86400"
+
+    @patch('src.utils.HighWaterMarks.time.time')
+    def test_window_covers_time_since_last_run(self, mock_time, path, query):
+        """Test that the window is the time since the last run plus the overlap, rounded up and capped."""
+        mock_time.return_value = 1_000_000.0
+        marks = HighWaterMarks(path, overlap = 600, granularity = 3600)
+        marks.begin()
+        marks.observe(query, ['4000000010'])
+        marks.commit()
+
+        mock_time.return_value = 1_000_000.0 + 3000
+        assert marks.window(query, "r86400") == "r3600"
+        mock_time.return_value = 1_000_000.0 + 3 * 86400
+        assert marks.window(query, "r86400") == "r86400"
+        # Unknown formats are left alone
+        assert marks.window(query, "") == ""
+
+    def test_is_behind_compares_with_newest_id(self, path, query):
+        """Test that a page reaching postings seen by a previous run is detected."""
+        marks = HighWaterMarks(path)
+        assert not marks.is_behind(query, ['4000000010'])
+
+        marks.observe(query, ['4000000010', '4000000005'])
+        marks.commit()
+
+        assert marks.is_behind(query, ['4000000020', '4000000010'])
+        assert not marks.is_behind(query, ['4000000020', '4000000011'])
+        assert not marks.is_behind({**query, 'location': 'Lyon'}, ['4000000001'])
+
+    def test_is_behind_ignores_a_stale_card_on_a_new_page(self, path, query):
+        """Test that one old posting among new ones does not stop the paging, a mostly old page does."""
+        marks = HighWaterMarks(path)
+        marks.observe(query, ['4000000010'])
+        marks.commit()
+        new_page = [str(4000000100 + i) for i in range(24)]
+
+        assert not marks.is_behind(query, new_page + ['4000000003'])
+        assert marks.is_behind(query, new_page[:10] + [str(4000000000 + i) for i in range(10)])
+
+    def test_discarded_query_keeps_its_mark(self, path, query):
+        """Test that a query discarded during the run is left out of the commit, the others move."""
+        other = {**query, 'location': 'Lyon'}
+        marks = HighWaterMarks(path)
+        marks.begin()
+        marks.observe(query, ['4000000010'])
+        marks.observe(other, ['4000000020'])
+        marks.discard(query)
+        marks.observe(query, ['4000000030'])
+
+        assert marks.commit() == 1
+        assert marks.mark(query) is None
+        assert marks.mark(other)['newest_id'] == 4000000020
+
+    def test_observations_are_saved_only_on_commit(self, path, query):
+        """Test that an interrupted run does not move the marks."""
+        marks = HighWaterMarks(path)
+        marks.observe(query, ['4000000010'])
+        marks.discard()
+        assert marks.commit() == 0
+        assert HighWaterMarks(path).mark(query) is None
+
+        marks.observe(query, ['4000000010'])
+        assert marks.commit() == 1
+        saved = json.loads(path.read_text())
+        assert saved['python|Paris|2']['newest_id'] == 4000000010
+
+    def test_commit_never_moves_a_mark_backward(self, path, query):
+        """Test that a run seeing only older postings keeps the newest id."""
+        marks = HighWaterMarks(path)
+        marks.observe(query, ['4000000010'])
+        marks.commit()
+        marks.observe(query, ['4000000003', 'not-an-id'])
+        marks.commit()
+
+        assert HighWaterMarks(path).mark(query)['newest_id'] == 4000000010
@@ -0,0 +1,58 @@
+# tests/test_job_card.py
+
+import json
+import pickle
+import sys
+
+import pandas as pd
+import pytest
+
+from src.utils.JobCard import JobCard
+
+
+class TestJobCard:
+    """Test suite for the compact job card record."""
+
+    @pytest.fixture
+    def card(self):
+        """Fixture providing a job card."""
+        return JobCard(title = "Data Engineer", company = "ACME", location = "Paris",
+                       date = "2024-01-01", job_url = "https://www.linkedin.com/jobs/view/4000000001/")
+
+    def test_reads_like_a_dict(self, card):
+        """Test that a card is used like the dict it replaces."""
+        as_dict = {'title': "Data Engineer", 'company': "ACME", 'location': "Paris",
+                   'date': "2024-01-01", 'job_url': "https://www.linkedin.com/jobs/view/4000000001/"}
+
+        assert card['job_url'] == as_dict['job_url']
+        assert card.get('missing', 'default') == 'default'
+        assert dict(card) == as_dict
+        assert card == as_dict
+        assert json.loads(json.dumps(card, default = dict)) == as_dict
+        with pytest.raises(KeyError):
+            card['description']
+
+    def test_has_no_instance_dict_and_is_read_only(self, card):
+        """Test that the record is slotted and immutable."""
+        assert not hasattr(card, '__dict__')
+        with pytest.raises(AttributeError):
+            card.title = "Other"
+
+    def test_repeated_values_are_shared(self):
+        """Test that low-cardinality fields repeated across cards point to one string, free text is not interned."""
+        first = JobCard(title = "".join(["Data ", "Engineer"]), company = "".join(["AC", "ME"]), location = "".join(["Par", "is"]))
+        second = JobCard(title = "".join(["Data Eng", "ineer"]), company = "".join(["ACM", "E"]), location = "".join(["Pa", "ris"]))
+
+        assert first.location is second.location
+        assert first.title is not second.title
+        assert first.company is not second.company
+        assert sys.getsizeof(first) < sys.getsizeof(dict(first))
+
+    def test_round_trips(self, card):
+        """Test pickling (parse pool) and rebuilding from a dict (checkpoint replay)."""
+        assert pickle.loads(pickle.dumps(card)) == card
+        assert JobCard.from_dict({**dict(card), 'extra': 1}) == card
+
+    def test_dataframe_columns(self, card):
+        """Test that a list of cards builds the same DataFrame as a list of dicts."""
+        pd.testing.assert_frame_equal(pd.DataFrame([card, card]), pd.DataFrame([dict(card), dict(card)]))
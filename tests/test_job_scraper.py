@@ -6,7 +6,11 @@ import pandas as pd
 from datetime import datetime, timedelta
 from langdetect.lang_detect_exception import LangDetectException
 
+from scripts.benchmark_filters import FILTERS, PREFERENCES, legacy_apply_filters, make_jobs, with_keywords
 from src.JobScraper import JobScraper
+from src.utils.CrawlFrontier import CrawlFrontier
+from src.utils.HighWaterMarks import HighWaterMarks
+from src.utils.TransferStats import TransferStats
 
 
 class TestJobScraper:
@@ -150,6 +154,14 @@ class TestJobScraper:
         filtered_jobs = result[result['filtered'] == 1]
         assert len(filtered_jobs) == 1
         assert filtered_jobs.iloc[0]['company'] == 'Bad Company Inc'
+
+    def test_apply_filters_company_exclude_ignores_case_and_spacing(self, job_scraper, sample_jobs_df, sample_preferences):
+        """Test that excluded company names match whatever their case and spacing."""
+        sample_jobs_df['company'] = sample_jobs_df['company'].replace({'Bad Company Inc': ' bad  COMPANY inc'})
+
+        result = job_scraper.apply_filters(sample_jobs_df, sample_preferences, ["company"])
+
+        assert result[result['filtered'] == 1]['company'].tolist() == [' bad  COMPANY inc']
     
     def test_apply_filters_max_age_filter(self, job_scraper, sample_jobs_df, sample_preferences):
         """Test max age filter removes old jobs."""
@@ -185,6 +197,38 @@ class TestJobScraper:
             filtered_jobs = result[result['filtered'] == 1]
             assert len(filtered_jobs) == 0
     
+    def test_apply_filters_language_filter_with_cached_detector(self, mock_backend, mock_scrap_engine, mock_logger, sample_jobs_df, tmp_path):
+        """Test that the languages filter goes through the cached detector when it is enabled."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'language_detection': {'enabled': True, 'path': str(tmp_path / 'languages.sqlite')}})
+        sample_jobs_df.loc[1, 'description'] = "Nous recherchons un développeur Python expérimenté pour notre équipe."
+        sample_jobs_df.loc[2, 'description'] = None
+
+        result = scraper.apply_filters(sample_jobs_df.copy(), {'languages': ['en']}, ["languages"])
+        assert list(result['filtered']) == [0, 1, 0]
+
+        with patch('src.utils.LanguageDetector.detect_batch') as mock_detect:
+            result = scraper.apply_filters(sample_jobs_df.copy(), {'languages': ['en']}, ["languages"])
+        mock_detect.assert_not_called()
+        assert list(result['filtered']) == [0, 1, 0]
+        scraper.language_detector.close()
+
+    def test_apply_filters_language_filter_prescreens_before_detection(self, mock_backend, mock_scrap_engine, mock_logger, sample_jobs_df):
+        """Test that only the descriptions the prescreen is unsure about go to langdetect."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'language_prescreen': {'enabled': True}})
+        sample_jobs_df.loc[0, 'description'] = ("We are looking for a Python developer who will work with the team on "
+                                                "the design of our platform, and you should have experience with Django.")
+        sample_jobs_df.loc[1, 'description'] = ("Wir suchen einen Python Entwickler, der mit dem Team an der Gestaltung "
+                                                "unserer Plattform arbeitet und Erfahrung mit Django hat.")
+
+        with patch.object(JobScraper, 'safe_detect', return_value = 'es') as mock_detect:
+            result = scraper.apply_filters(sample_jobs_df, {'languages': ['en']}, ["languages"])
+
+        mock_detect.assert_called_once_with(sample_jobs_df.loc[2, 'description'])
+        assert list(result['filtered']) == [0, 1, 1]
+        assert scraper.language_prescreen.escalation_rate == pytest.approx(1 / 3)
+
     def test_apply_filters_description_filter(self, job_scraper, sample_jobs_df, sample_preferences):
         """Test description filter removes jobs without required description words."""
         result = job_scraper.apply_filters(sample_jobs_df, sample_preferences, ["description"])
@@ -238,30 +282,40 @@ class TestJobScraper:
         assert result.iloc[0]['title'] == 'Python Developer'
     
     def test_remove_existing_jobs(self, job_scraper, sample_jobs_df):
-        """Test removing existing jobs based on title, company, and date."""
+        """Test removing existing jobs looked up by their exact job URL."""
         mock_backend = job_scraper.backend
         
         # Mock search result with one existing job
         mock_search_result = {
-            'hits': {
-                'hits': [
-                    {'_source': {
-                        'title': 'Python Developer', 
-                        'company': 'Tech Corp',
-                        'date': sample_jobs_df.iloc[0]['date']
-                    }}
-                ]
-            }
+            'hits': {'hits': []},
+            'aggregations': {'existing': {'buckets': [{'key': 'https://linkedin.com/jobs/view/123', 'doc_count': 2}]}}
         }
         mock_backend.search.return_value = mock_search_result
         
         result = job_scraper.remove_existing_jobs(sample_jobs_df, "jobs")
         
-        # Should remove the job with matching title, company, and date
+        # Should remove the job with matching URL
         assert len(result) == 2  # Originally 3, removed 1
         remaining_titles = set(result['title'].tolist())
         assert 'Python Developer' not in remaining_titles
+        query = mock_backend.search.call_args.kwargs['query']
+        assert query['query'] == {'terms': {'job_url': list(sample_jobs_df['job_url'])}}
+        assert query['size'] == 0
     
+    def test_remove_existing_jobs_in_batches(self, mock_backend, mock_scrap_engine, mock_logger):
+        """Test that large batches are checked in chunks of job URLs, each found URL removed once."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'dedup_batch_size': 2})
+        jobs_df = pd.DataFrame({'title': ['Same title'] * 5,
+                                'job_url': [f'https://www.linkedin.com/jobs/view/{i}/' for i in range(5)]})
+        mock_backend.search.side_effect = lambda query, index: {'aggregations': {'existing': {'buckets': [
+            {'key': url, 'doc_count': 1} for url in query['query']['terms']['job_url'] if url.endswith(('1/', '4/'))]}}}
+
+        result = scraper.remove_existing_jobs(jobs_df, "jobs")
+
+        assert [len(call.kwargs['query']['query']['terms']['job_url']) for call in mock_backend.search.call_args_list] == [2, 2, 1]
+        assert list(result['job_url'].str[-2]) == ['0', '2', '3']
+
     def test_remove_existing_jobs_no_existing_jobs(self, job_scraper, sample_jobs_df):
         """Test behavior when no existing jobs are found in database."""
         mock_backend = job_scraper.backend
@@ -390,6 +444,407 @@ class TestJobScraper:
         with pytest.raises(Exception, match="Database insertion failed"):
             job_scraper.execute_scraper(sample_preferences)
     
+    def test_execute_scraper_streaming_indexes_micro_batches(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that streaming mode describes and inserts jobs page by page in micro-batches."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'streaming': True, 'micro_batch_size': 2})
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+
+        def card(job_id, title='Python Developer', company=None):
+            return {'title': title, 'company': company or f'Company {job_id}', 'location': 'Paris',
+                    'date': recent_date, 'job_url': f'https://linkedin.com/jobs/view/{job_id}'}
+
+        pages = [
+            [card(1), card(2)],
+            [card(2), card(3, title='Senior Lead')],       # duplicate + filtered by title
+            [card(4), card(5, company='Company 4')],       # same title/company as job 4
+            [],
+        ]
+        mock_scrap_engine.iter_jobcards.return_value = iter(pages)
+        mock_scrap_engine.get_job_descriptions.side_effect = lambda urls: ['Python and Django job.'] * len(urls)
+        mock_backend.search.return_value = {'hits': {'hits': []}}
+
+        scraper.execute_scraper(sample_preferences)
+
+        described = [call.args[0] for call in mock_scrap_engine.get_job_descriptions.call_args_list]
+        assert described == [['https://linkedin.com/jobs/view/1', 'https://linkedin.com/jobs/view/2'],
+                             ['https://linkedin.com/jobs/view/4']]
+        inserted = [len(call.kwargs['data']) for call in mock_backend.insert_bulk_data.call_args_list]
+        assert inserted == [2, 1]
+        mock_scrap_engine.get_jobcards.assert_not_called()
+
+    def test_execute_scraper_streaming_no_jobs_found(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that streaming mode stops cleanly when no card is found."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'streaming': True})
+        mock_scrap_engine.iter_jobcards.return_value = iter([[], []])
+
+        scraper.execute_scraper(sample_preferences)
+
+        mock_scrap_engine.get_job_descriptions.assert_not_called()
+        mock_backend.insert_bulk_data.assert_not_called()
+        mock_logger.warning.assert_called_once()
+
+    @pytest.mark.parametrize("title, language", [
+        ("Data Engineer (m/w/d)", 'de'),
+        ("Data Engineer (W/M/D)", 'de'),
+        ("Data Engineer (m/f/d)", None),
+        ("Ingénieur Data H/F", 'fr'),
+        ("Data Engineer (F/H)", 'fr'),
+        ("Data Engineer (m/v)", 'nl'),
+        ("Data Engineer", None),
+    ])
+    def test_predict_title_language(self, title, language):
+        """Test the gender marker based language prediction."""
+        assert JobScraper.predict_title_language(title) == language
+
+    def test_schedule_descriptions_prioritizes_prescreens_and_budgets(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that the best cards come first, foreign-language titles are skipped and the budget is enforced."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'title_prescreen': True})
+        scraper.descriptions_left = 2
+        jobs_df = pd.DataFrame([
+            {'title': 'Developer', 'company': 'A', 'date': datetime.now() - timedelta(days=6), 'job_url': 'u1'},
+            {'title': 'Python Developer (m/w/d)', 'company': 'B', 'date': datetime.now(), 'job_url': 'u2'},
+            {'title': 'Python Developer Django', 'company': 'C', 'date': datetime.now(), 'job_url': 'u3'},
+            {'title': 'Python Developer', 'company': 'D', 'date': datetime.now() - timedelta(days=6), 'job_url': 'u4'},
+        ])
+
+        to_describe, prescreened = scraper.schedule_descriptions(jobs_df, sample_preferences)
+
+        assert list(to_describe['job_url']) == ['u3', 'u4']
+        assert list(prescreened['job_url']) == ['u2']
+        assert scraper.descriptions_left == 0
+
+        to_describe, _ = scraper.schedule_descriptions(jobs_df.iloc[[0]], sample_preferences)
+        assert to_describe.empty
+
+    def test_schedule_descriptions_can_be_disabled(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that without prioritization and pre-screen the order and the cards are kept."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'prioritize_descriptions': False, 'title_prescreen': False})
+        jobs_df = pd.DataFrame([
+            {'title': 'Developer', 'company': 'A', 'date': datetime.now(), 'job_url': 'u1'},
+            {'title': 'Python Developer (m/w/d)', 'company': 'B', 'date': datetime.now(), 'job_url': 'u2'},
+        ])
+
+        to_describe, prescreened = scraper.schedule_descriptions(jobs_df, sample_preferences)
+
+        assert list(to_describe['job_url']) == ['u1', 'u2']
+        assert prescreened.empty
+
+    def test_execute_scraper_indexes_prescreened_jobs_as_filtered(self, job_scraper, sample_preferences):
+        """Test that jobs rejected from their title are stored filtered, without fetching their description."""
+        mock_scrap_engine = job_scraper.scrap_engine
+        job_scraper.config['title_prescreen'] = True
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        mock_scrap_engine.get_jobcards.return_value = [
+            {'title': 'Python Developer', 'company': 'A', 'location': 'Paris', 'date': recent_date, 'job_url': 'u1'},
+            {'title': 'Python Developer (H/F)', 'company': 'B', 'location': 'Paris', 'date': recent_date, 'job_url': 'u2'},
+        ]
+        mock_scrap_engine.get_job_descriptions.return_value = ['Python and Django job.']
+        job_scraper.backend.search.return_value = {'hits': {'hits': []}}
+
+        job_scraper.execute_scraper(sample_preferences)
+
+        mock_scrap_engine.get_job_descriptions.assert_called_once_with(['u1'])
+        inserted = {job['job_url']: job for job in job_scraper.backend.insert_bulk_data.call_args.kwargs['data']}
+        assert inserted['u2']['filtered'] == 1
+        assert pd.isna(inserted['u2']['description'])
+        assert inserted['u1']['description'] == 'Python and Django job.'
+
+    def test_execute_scraper_streaming_shares_the_description_budget(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that the description budget spans every micro-batch of the run."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'streaming': True, 'micro_batch_size': 2, 'description_budget': 3})
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        pages = [[{'title': 'Python Developer', 'company': f'Company {i}', 'location': 'Paris',
+                   'date': recent_date, 'job_url': f'u{i}'} for i in range(j, j + 2)] for j in (0, 2, 4)]
+        mock_scrap_engine.iter_jobcards.return_value = iter(pages)
+        mock_scrap_engine.get_job_descriptions.side_effect = lambda urls: ['Python job.'] * len(urls)
+        mock_backend.search.return_value = {'hits': {'hits': []}}
+
+        scraper.execute_scraper(sample_preferences)
+
+        described = [url for call in mock_scrap_engine.get_job_descriptions.call_args_list for url in call.args[0]]
+        assert described == ['u0', 'u1', 'u2']
+
+    def test_execute_scraper_streaming_budget_goes_to_the_best_cards_of_the_run(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that with a budget, streaming schedules the descriptions once over every page of the search."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'streaming': True, 'micro_batch_size': 1, 'description_budget': 2})
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        pages = [[{'title': title, 'company': f'Company {i}', 'location': 'Paris', 'date': recent_date, 'job_url': f'u{i}'}]
+                 for i, title in enumerate(['Developer', 'Developer', 'Python Developer', 'Python Developer'])]
+        mock_scrap_engine.iter_jobcards.return_value = iter(pages)
+        mock_scrap_engine.get_job_descriptions.side_effect = lambda urls: ['Python job.'] * len(urls)
+        mock_backend.search.return_value = {'hits': {'hits': []}}
+
+        scraper.execute_scraper(sample_preferences)
+
+        described = [call.args[0] for call in mock_scrap_engine.get_job_descriptions.call_args_list]
+        assert described == [['u2'], ['u3']]
+        assert scraper.descriptions_deferred == 2
+
+    def test_execute_scraper_fetches_descriptions_without_required_words(self, job_scraper, mock_logger, sample_preferences):
+        """Test that an empty 'description_words_include' is warned about but does not skip the descriptions."""
+        job_scraper.config['title_prescreen'] = True
+        sample_preferences['description_words_include'] = []
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        job_scraper.scrap_engine.get_jobcards.return_value = [
+            {'title': 'Python Developer', 'company': 'A', 'location': 'Paris', 'date': recent_date, 'job_url': 'u1'},
+        ]
+        job_scraper.scrap_engine.get_job_descriptions.return_value = ['Python job.']
+        job_scraper.backend.search.return_value = {'hits': {'hits': []}}
+
+        job_scraper.execute_scraper(sample_preferences)
+
+        job_scraper.scrap_engine.get_job_descriptions.assert_called_once_with(['u1'])
+        mock_logger.warning.assert_any_call("No 'description_words_include' in the preferences, "
+                                            "every described job will be flagged by the 'description' filter")
+
+    def test_execute_scraper_resumes_and_finishes_checkpoint(self, job_scraper, mock_logger, sample_preferences):
+        """Test that a resumed run keeps the checkpoint, and that a completed run clears it."""
+        frontier = Mock(spec = CrawlFrontier)
+        frontier.is_unfinished.return_value = True
+        frontier.begin.return_value = 12
+        # Cards are queued as the records of the screened DataFrame, dates serialized as timestamps
+        frontier.pending_descriptions.return_value = [
+            {'title': 'Python Developer', 'company': 'A', 'location': 'Paris', 'date': str(pd.Timestamp.now().normalize()),
+             'job_url': 'u1', 'filtered': 0},
+            {'title': 'Python Developer', 'company': 'B', 'location': 'Paris', 'date': str(pd.Timestamp.now().normalize()),
+             'job_url': 'u2', 'filtered': 0},
+        ]
+        job_scraper.scrap_engine.frontier = frontier
+        job_scraper.scrap_engine.get_jobcards.return_value = []
+        job_scraper.scrap_engine.get_job_descriptions.return_value = ['Python job.']
+        # u2 was indexed by the interrupted run
+        job_scraper.backend.search.return_value = {'aggregations': {'existing': {'buckets': [{'key': 'u2'}]}}}
+
+        job_scraper.execute_scraper(sample_preferences, resume = True)
+
+        frontier.begin.assert_called_once_with(True)
+        job_scraper.scrap_engine.get_job_descriptions.assert_called_once_with(['u1'])
+        frontier.complete_descriptions.assert_any_call(['u2'])
+        frontier.complete_descriptions.assert_any_call(['u1'])
+        frontier.finish.assert_called_once()
+        mock_logger.info.assert_any_call("Resuming the previous run: 12 checkpointed responses, 2 descriptions pending")
+
+    def test_execute_scraper_keeps_checkpoint_on_failure(self, job_scraper, mock_logger, sample_preferences):
+        """Test that an interrupted run can be resumed, and that a new run warns before discarding it."""
+        frontier = Mock(spec = CrawlFrontier)
+        frontier.is_unfinished.return_value = True
+        job_scraper.scrap_engine.frontier = frontier
+        job_scraper.scrap_engine.get_jobcards.side_effect = ConnectionError("proxy down")
+
+        with pytest.raises(ConnectionError):
+            job_scraper.execute_scraper(sample_preferences)
+
+        frontier.begin.assert_called_once_with(False)
+        frontier.finish.assert_not_called()
+        mock_logger.warning.assert_any_call("Discarding the checkpoint of an unfinished run (use --resume to continue it)")
+
+    def test_execute_scraper_commits_high_water_marks(self, job_scraper, sample_preferences):
+        """Test that a completed run moves the high-water marks forward."""
+        job_scraper.scrap_engine.high_water_marks = Mock(spec = HighWaterMarks)
+        job_scraper.scrap_engine.get_jobcards.return_value = []
+
+        job_scraper.execute_scraper(sample_preferences)
+
+        job_scraper.scrap_engine.high_water_marks.commit.assert_called_once()
+
+    def test_deferred_descriptions_keep_high_water_marks(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that jobs deferred by the budget are searched again by the next run."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'description_budget': 1})
+        mock_scrap_engine.high_water_marks = Mock(spec = HighWaterMarks)
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        mock_scrap_engine.get_jobcards.return_value = [
+            {'title': 'Python Developer', 'company': f'Company {i}', 'location': 'Paris', 'date': recent_date, 'job_url': f'u{i}'}
+            for i in range(2)
+        ]
+        mock_scrap_engine.get_job_descriptions.return_value = ['Python job.']
+        mock_backend.search.return_value = {'hits': {'hits': []}}
+
+        scraper.execute_scraper(sample_preferences)
+
+        mock_scrap_engine.high_water_marks.commit.assert_not_called()
+        mock_scrap_engine.high_water_marks.discard.assert_called_once()
+
+    def test_get_posting_ids(self):
+        """Test that posting ids are read from the job URLs."""
+        jobs_df = pd.DataFrame({'job_url': ['https://www.linkedin.com/jobs/view/4000000001/', 'https://example.com/job']})
+
+        ids = JobScraper.get_posting_ids(jobs_df)
+
+        assert ids[0] == 4000000001
+        assert pd.isna(ids[1])
+
+    def test_remove_seen_jobs_only_checks_known_postings(self, mock_backend, mock_scrap_engine, mock_logger, tmp_path):
+        """Test that postings missing from the local index skip the database query."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'seen_postings': {'enabled': True, 'path': str(tmp_path / 'seen.u64')}})
+        scraper.seen_postings.add([2])
+        scraper.seen_postings.save()
+        jobs_df = pd.DataFrame([
+            {'title': 'A', 'company': 'C', 'date': '2024-01-01', 'job_url': 'https://www.linkedin.com/jobs/view/1/'},
+            {'title': 'B', 'company': 'C', 'date': '2024-01-01', 'job_url': 'https://www.linkedin.com/jobs/view/2/'},
+            {'title': 'D', 'company': 'C', 'date': '2024-01-01', 'job_url': 'https://www.linkedin.com/jobs/view/3/'},
+        ])
+
+        with patch.object(scraper, 'remove_existing_jobs', side_effect = lambda df, es_index: df.iloc[0:0]) as mock_remove:
+            result = scraper.remove_seen_jobs(jobs_df, es_index = "jobs")
+
+        assert list(mock_remove.call_args.args[0]['title']) == ['B']
+        assert list(result['title']) == ['A', 'D']
+
+        mock_remove.reset_mock()
+        with patch.object(scraper, 'remove_existing_jobs') as mock_remove:
+            result = scraper.remove_seen_jobs(jobs_df.iloc[[0, 2]], es_index = "jobs")
+        mock_remove.assert_not_called()
+        assert len(result) == 2
+
+    def test_seen_postings_built_from_database_then_updated_on_insert(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences, tmp_path):
+        """Test that the index is seeded from the database once, then records inserted jobs."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'seen_postings': {'enabled': True, 'path': str(tmp_path / 'seen.u64')}})
+        mock_backend.scan_field.return_value = iter(['https://www.linkedin.com/jobs/view/7/', None])
+        mock_backend.index_identity.return_value = {'uuid': 'jobs-1', 'count': 2}
+        recent_date = datetime.now().strftime('%Y-%m-%d')
+        mock_scrap_engine.get_jobcards.return_value = [
+            {'title': 'Python Developer', 'company': 'A', 'location': 'Paris', 'date': recent_date,
+             'job_url': 'https://www.linkedin.com/jobs/view/8/'},
+        ]
+        mock_scrap_engine.get_job_descriptions.return_value = ['Python job.']
+
+        scraper.execute_scraper(sample_preferences)
+
+        mock_backend.scan_field.assert_called_once_with(index = "jobs", field = "job_url")
+        mock_backend.search.assert_not_called()
+        assert list(scraper.seen_postings.contains([7, 8, 9])) == [True, True, False]
+        assert mock_scrap_engine.seen_postings is scraper.seen_postings
+        assert scraper.seen_postings.identity == {'uuid': 'jobs-1', 'count': 2}
+
+    def test_seen_postings_rebuilt_when_database_changed(self, mock_backend, mock_scrap_engine, mock_logger, tmp_path):
+        """Test that the index is used as long as the database matches its stamp, and rebuilt once it does not."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'seen_postings': {'enabled': True, 'path': str(tmp_path / 'seen.u64')}})
+        scraper.seen_postings.add([2])
+        scraper.seen_postings.save()
+        scraper.seen_postings.stamp({'uuid': 'jobs-1', 'count': 1})
+        mock_backend.index_identity.return_value = {'uuid': 'jobs-1', 'count': 1}
+
+        scraper.load_seen_postings()
+        mock_backend.scan_field.assert_not_called()
+
+        # The index was deleted and filled again by another scraper
+        mock_backend.index_identity.return_value = {'uuid': 'jobs-2', 'count': 1}
+        mock_backend.scan_field.return_value = iter(['https://www.linkedin.com/jobs/view/7/'])
+        scraper.load_seen_postings()
+
+        assert list(scraper.seen_postings.contains([2, 7])) == [False, True]
+        assert scraper.seen_postings.identity == {'uuid': 'jobs-2', 'count': 1}
+
+    def test_seen_postings_not_trusted_when_database_unreachable(self, mock_backend, mock_scrap_engine, mock_logger, tmp_path):
+        """Test that a failed build leaves the index unused."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'seen_postings': {'enabled': True, 'path': str(tmp_path / 'seen.u64')}})
+        mock_backend.scan_field.side_effect = ConnectionError("database down")
+
+        scraper.load_seen_postings()
+
+        assert not scraper.seen_postings.ready
+        assert mock_scrap_engine.seen_postings is not scraper.seen_postings
+
+    def test_index_jobs_inserts_in_bounded_batches(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that records are built and inserted insert_batch_size at a time."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'insert_batch_size': 2})
+        jobs_df = pd.DataFrame([{'title': f'Job {i}', 'company': 'A', 'date': datetime.now(), 'job_url': f'u{i}', 'filtered': 0}
+                                for i in range(5)])
+
+        inserted = scraper.index_jobs(jobs_df, [None] * 5, sample_preferences)
+
+        assert inserted == 5
+        assert [len(call.kwargs['data']) for call in mock_backend.insert_bulk_data.call_args_list] == [2, 2, 1]
+
+    def test_index_jobs_create_only_uses_posting_ids_and_counts_conflicts(self, mock_backend, mock_scrap_engine, mock_logger, sample_preferences):
+        """Test that documents get their posting id and that known jobs are counted, not inserted."""
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'create_only': True})
+        jobs_df = pd.DataFrame([{'title': f'Job {i}', 'company': 'A', 'date': datetime.now(), 'filtered': 0,
+                                 'job_url': f'https://www.linkedin.com/jobs/view/{4000000000 + i}/'} for i in range(3)])
+        jobs_df.loc[2, 'job_url'] = 'https://example.com/job'
+        mock_backend.insert_bulk_data.return_value = {'errors': True, 'items': [
+            {'create': {'status': 201}},
+            {'create': {'status': 409, 'error': {'type': 'version_conflict_engine_exception'}}},
+            {'create': {'status': 201}}]}
+
+        inserted = scraper.index_jobs(jobs_df, [None] * 3, sample_preferences)
+
+        assert inserted == 2
+        call = mock_backend.insert_bulk_data.call_args
+        assert call.kwargs['ids'] == ['4000000000', '4000000001', None]
+        assert call.kwargs['create_only'] is True
+
+    def test_check_existing_can_be_skipped_with_create_only(self, mock_backend, mock_scrap_engine, mock_logger, tmp_path):
+        """Test that the database lookup is optional with the create-only ingest, the seen index still applies."""
+        jobs_df = pd.DataFrame([{'title': 'Python Developer', 'company': 'A', 'date': datetime.now(), 'filtered': 0,
+                                 'job_url': f'https://www.linkedin.com/jobs/view/{i}/'} for i in range(1, 4)])
+        preferences = {'title_include': ['python']}
+
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'check_existing': False})
+        assert scraper.checks_existing()
+
+        scraper = JobScraper(backend=mock_backend, scrap_engine=mock_scrap_engine, logger=mock_logger,
+                             config={'check_existing': False, 'create_only': True,
+                                     'seen_postings': {'enabled': True, 'path': str(tmp_path / 'seen.u64')}})
+        assert len(scraper.screen_jobs(jobs_df.copy(), preferences)) == 3
+        scraper.seen_postings.add([2])
+        scraper.seen_postings.save()
+
+        result = scraper.screen_jobs(jobs_df.copy(), preferences)
+
+        assert list(result['job_url'].str[-2]) == ['1', '3']
+        mock_backend.search.assert_not_called()
+
+    def test_log_transfer_cost_reports_bytes_per_new_job(self, job_scraper, mock_logger):
+        """Test that the transfer totals and the cost per inserted job are logged."""
+        job_scraper.scrap_engine.transfer_stats = TransferStats()
+        job_scraper.scrap_engine.transfer_stats.record('job_cards', 100 * 1024, 400 * 1024)
+        job_scraper.scrap_engine.transfer_stats.record('job_descriptions', 300 * 1024, 1200 * 1024)
+
+        job_scraper.log_transfer_cost(8)
+
+        messages = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert messages[0].startswith("Transferred 0.39 MiB for 1.56 MiB of HTML (75% saved by compression)")
+        assert messages[1] == "Transfer cost: 50.0 KiB per new job"
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_execute_scraper_reports_transfer_of_runs_without_new_jobs(self, job_scraper, mock_logger, sample_preferences, streaming):
+        """Test that a run whose cards are all filtered out still reports the bytes it moved."""
+        job_scraper.config['streaming'] = streaming
+        job_scraper.scrap_engine.transfer_stats = TransferStats()
+        job_scraper.scrap_engine.transfer_stats.record('job_cards', 100 * 1024, 400 * 1024)
+        cards = [{'title': 'Senior Lead', 'company': 'A', 'location': 'Paris',
+                  'date': datetime.now().strftime('%Y-%m-%d'), 'job_url': 'u1'}]
+        job_scraper.scrap_engine.get_jobcards.return_value = cards
+        job_scraper.scrap_engine.iter_jobcards.return_value = iter([cards])
+
+        job_scraper.execute_scraper(sample_preferences)
+
+        messages = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert any(message.startswith("Transferred 0.10 MiB for 0.39 MiB of HTML") for message in messages)
+        job_scraper.scrap_engine.get_job_descriptions.assert_not_called()
+        job_scraper.scrap_engine.log_run_stats.assert_called_once()
+
+    def test_log_transfer_cost_without_stats(self, job_scraper, mock_logger):
+        """Test that nothing is logged when the engine does not count bytes."""
+        job_scraper.log_transfer_cost(3)
+
+        mock_logger.info.assert_not_called()
+
     def test_apply_filters_with_missing_preferences(self, job_scraper, sample_jobs_df):
         """Test apply_filters handles missing preference keys gracefully."""
         empty_preferences = {}
@@ -405,6 +860,16 @@ class TestJobScraper:
         filtered_jobs = result[result['filtered'] == 1]
         assert len(filtered_jobs) == len(sample_jobs_df)  # All jobs filtered due to empty title_include
     
+    @pytest.mark.parametrize("preferences", [PREFERENCES, {}, with_keywords(PREFERENCES, 1000)])
+    def test_apply_filters_matches_row_by_row_filters(self, job_scraper, preferences):
+        """Test that the vectorized filters flag exactly the rows of the row-by-row implementation."""
+        jobs_df = make_jobs(2000, seed = 3)
+
+        for filters in [[name] for name in FILTERS] + [FILTERS]:
+            expected = legacy_apply_filters(jobs_df.copy(), preferences, filters)
+            result = job_scraper.apply_filters(jobs_df.copy(), preferences, filters)
+            pd.testing.assert_series_equal(result['filtered'], expected['filtered'])
+
     def test_apply_filters_handles_empty_dataframe(self, job_scraper, sample_preferences):
         """Test apply_filters handles empty DataFrame gracefully."""
         empty_df = pd.DataFrame(columns=['title', 'company', 'date', 'job_url', 'description', 'filtered'])
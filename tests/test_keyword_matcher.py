@@ -0,0 +1,73 @@
+# tests/test_keyword_matcher.py
+
+import pandas as pd
+import pytest
+
+from src.utils.KeywordMatcher import CompanySet, KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test suite for the compiled keyword matcher."""
+
+    def test_trie_pattern_shares_prefixes(self):
+        """Test that keywords sharing a prefix are factored in the pattern."""
+        assert KeywordMatcher.trie_pattern(['data', 'dev', 'devops']) == 'd(?:ata|ev(?:ops)?)'
+
+    @pytest.mark.parametrize("text", ["Senior Python Developer", "data engineer", "C++ / Rust", "Metadata", "Go (m/w/d)", ""])
+    def test_matches_like_substring_search(self, text):
+        """Test that matching is the case-insensitive substring test it replaces."""
+        words = ['python', 'Data', 'c++', 'rust.', '(m/w/d)', 'dev', 'devops', 'go']
+        matcher = KeywordMatcher.compile(words)
+
+        assert matcher.matches(text) == any(word.lower() in text.lower() for word in words)
+
+    def test_empty_keywords(self):
+        """Test that no keyword matches nothing and an empty keyword matches everything."""
+        texts = pd.Series(["python", ""], index = [3, 7])
+
+        assert not KeywordMatcher.compile([]).matches("python")
+        assert KeywordMatcher.compile(['', 'java']).matches("python")
+        assert KeywordMatcher.compile([]).match_series(texts).tolist() == [False, False]
+        assert KeywordMatcher.compile(['']).match_series(texts).index.tolist() == [3, 7]
+
+    def test_match_series(self):
+        """Test the vectorized matching over lower-cased texts."""
+        texts = pd.Series(["big data engineer", "java developer", "nan"], index = [10, 11, 12])
+
+        mask = KeywordMatcher.compile(['Data', 'python']).match_series(texts)
+
+        pd.testing.assert_series_equal(mask, pd.Series([True, False, False], index = [10, 11, 12]))
+
+    def test_thousands_of_keywords(self):
+        """Test that long lists compile and match like the per-keyword loop."""
+        words = [f"skill{i}x" for i in range(5000)] + ['python']
+        matcher = KeywordMatcher.compile(words)
+
+        assert matcher.matches("needs SKILL4999X")
+        assert matcher.matches("python")
+        assert not matcher.matches("skill5000x skill12")
+
+    def test_compiled_once_per_list(self):
+        """Test that the same keyword list reuses its compiled matcher."""
+        assert KeywordMatcher.compile(['a', 'b']) is KeywordMatcher.compile(['a', 'b'])
+
+
+class TestCompanySet:
+    """Test suite for the normalized company exclusion set."""
+
+    def test_normalizes_case_and_spacing(self):
+        """Test that names match whatever their case and spacing."""
+        companies = CompanySet.compile(['Bad Company Inc', 'ÉCOLE Corp'])
+
+        assert companies.contains("  bad   company INC ")
+        assert companies.contains("école corp")
+        assert not companies.contains("Bad Company")
+
+    def test_match_series(self):
+        """Test the vectorized lookup, missing names included."""
+        companies = pd.Series(["ACME", "spam  corp", None], index = [5, 6, 7])
+
+        mask = CompanySet.compile(['Spam Corp']).match_series(companies)
+
+        pd.testing.assert_series_equal(mask, pd.Series([False, True, False], index = [5, 6, 7]))
+        assert not CompanySet.compile([]).match_series(companies).any()
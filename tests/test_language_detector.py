@@ -0,0 +1,61 @@
+# tests/test_language_detector.py
+
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.LanguageDetector import LanguageDetector, detect_batch
+
+
+ENGLISH = "We are looking for a data engineer who will build and maintain our pipelines with the team."
+FRENCH = "Nous recherchons un ingénieur de données pour construire et maintenir nos flux avec l'équipe."
+GERMAN = "Wir suchen einen Dateningenieur, der unsere Datenstrecken mit dem Team aufbaut und betreibt."
+
+
+class TestLanguageDetector:
+    """Test suite for the cached, parallel language detector."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Fixture providing the path of the cache."""
+        return tmp_path / "languages.sqlite"
+
+    def test_from_config_disabled_by_default(self, path):
+        """Test that no detector is created unless enabled."""
+        assert LanguageDetector.from_config(None) is None
+        assert LanguageDetector.from_config({'path': str(path)}) is None
+        detector = LanguageDetector.from_config({'enabled': True, 'path': str(path), 'workers': 3})
+        assert detector.workers == 3
+        detector.close()
+
+    def test_detects_in_order_and_deterministically(self):
+        """Test that languages are aligned with the texts and stable across calls."""
+        detector = LanguageDetector()
+
+        assert detector.detect_many([ENGLISH, FRENCH, GERMAN, "1234"]) == ['en', 'fr', 'de', 'en']
+        assert detect_batch(["ok"] * 5) == detect_batch(["ok"] * 5)
+        detector.close()
+
+    def test_cache_survives_runs(self, path):
+        """Test that a text detected by a previous run is not detected again."""
+        detector = LanguageDetector(path)
+        assert detector.detect_many([ENGLISH, FRENCH, ENGLISH]) == ['en', 'fr', 'en']
+        assert detector.summary() == "0 languages from cache, 2 detected"
+        detector.close()
+
+        detector = LanguageDetector(path)
+        with patch('src.utils.LanguageDetector.detect_batch', side_effect = lambda texts: ['de'] * len(texts)) as mock_detect:
+            assert detector.detect_many([FRENCH, GERMAN, ENGLISH]) == ['fr', 'de', 'en']
+        mock_detect.assert_called_once_with([GERMAN])
+        assert detector.summary() == "2 languages from cache, 1 detected"
+        detector.close()
+
+    def test_pool_detection_matches_in_process(self):
+        """Test that batches detected by worker processes give the in-process answers."""
+        texts = [f"{text} {i}" for i in range(12) for text in (ENGLISH, FRENCH, GERMAN)]
+        detector = LanguageDetector(workers = 2, batch_size = 4)
+
+        assert detector.detect_many(texts) == detect_batch(texts)
+        assert detector.pool is not None
+        detector.close()
+        assert detector.pool is None
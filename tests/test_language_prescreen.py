@@ -0,0 +1,66 @@
+# tests/test_language_prescreen.py
+
+import pytest
+
+from src.utils.LanguageDetector import detect_language
+from src.utils.LanguagePrescreen import LanguagePrescreen
+
+
+DESCRIPTIONS = {
+    'en': "We are looking for a data engineer who will build and maintain our data pipelines. You will work with "
+          "the team on the design of the platform and its tools, and you should have experience with Python and SQL.",
+    'fr': "Nous recherchons un ingénieur de données qui sera chargé de construire et de maintenir nos flux. Vous "
+          "travaillerez avec l'équipe sur la conception de la plateforme et de ses outils, avec une expérience en Python.",
+    'de': "Wir suchen einen Dateningenieur, der unsere Datenstrecken aufbaut und betreibt. Du arbeitest mit dem Team "
+          "an der Gestaltung der Plattform und ihrer Werkzeuge und hast Erfahrung mit Python und SQL.",
+    'es': "Buscamos un ingeniero de datos que construya y mantenga nuestros flujos de datos. Trabajarás con el equipo "
+          "en el diseño de la plataforma y sus herramientas, y tienes experiencia con Python y SQL.",
+    'nl': "Wij zoeken een data engineer die onze datastromen bouwt en onderhoudt. Je werkt met het team aan het "
+          "ontwerp van het platform en de tools, en je hebt ervaring met Python en SQL."
+}
+
+
+class TestLanguagePrescreen:
+    """Test suite for the stopword language prescreen."""
+
+    def test_from_config_disabled_by_default(self):
+        """Test that no prescreen is created unless enabled, and thresholds are read."""
+        assert LanguagePrescreen.from_config(None) is None
+        assert LanguagePrescreen.from_config({'min_ratio': 0.3}) is None
+        assert LanguagePrescreen.from_config({'enabled': True, 'min_ratio': 0.3}).min_ratio == 0.3
+
+    @pytest.mark.parametrize("language", sorted(DESCRIPTIONS))
+    def test_settles_obvious_languages_like_langdetect(self, language):
+        """Test that obvious descriptions get the language langdetect would give them."""
+        prescreen = LanguagePrescreen()
+
+        assert prescreen.classify(DESCRIPTIONS[language], ['en', 'fr']) == language == detect_language(DESCRIPTIONS[language])
+        assert prescreen.escalation_rate == 0.0
+
+    def test_reads_only_the_prefix(self):
+        """Test that the decision is taken on the first characters of the text."""
+        prescreen = LanguagePrescreen(max_chars = 200)
+
+        assert prescreen.classify(DESCRIPTIONS['fr'] + " " + DESCRIPTIONS['en'] * 5, ['en', 'fr']) == 'fr'
+
+    @pytest.mark.parametrize("text, candidates", [
+        ("Python, SQL, Airflow, dbt, Kubernetes", ['en']),                          # too short
+        ("Data engineer " * 30, ['en']),                                             # no function words
+        (DESCRIPTIONS['en'][:160] + " " + DESCRIPTIONS['fr'][:160], ['en', 'fr']),   # mixed
+        (DESCRIPTIONS['en'], ['en', 'ja']),                                          # candidate without profile
+    ])
+    def test_escalates_when_unsure(self, text, candidates):
+        """Test that unclear texts are left to the full detection."""
+        prescreen = LanguagePrescreen()
+
+        assert prescreen.classify(text, candidates) is None
+        assert prescreen.escalation_rate == 1.0
+
+    def test_summary_reports_escalation_rate(self):
+        """Test the counts and escalation rate of the summary."""
+        prescreen = LanguagePrescreen()
+        for text in [DESCRIPTIONS['en'], DESCRIPTIONS['en'], DESCRIPTIONS['de'], "too short"]:
+            prescreen.classify(text, ['en'])
+
+        assert prescreen.escalation_rate == 0.25
+        assert prescreen.summary() == "3 settled (en 2, de 1), 1 escalated (25.0%)"
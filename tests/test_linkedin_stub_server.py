@@ -0,0 +1,265 @@
+# tests/test_linkedin_stub_server.py
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from scripts.linkedin_stub_server import LinkedInStubServer
+from src.AsyncBeautifulSoupEngine import AsyncBeautifulSoupEngine
+from src.BeautifulSoupEngine import BeautifulSoupEngine
+from src.JobScraper import JobScraper
+
+
+class TestLinkedInStubServer:
+    """Test suite for the local LinkedIn stand-in server, driven by the real engines."""
+
+    @pytest.fixture
+    def engine_config(self):
+        """Fixture providing an engine configuration without retry delays."""
+        return {
+            'max_retry': 3,
+            'retry_delay': 0,
+            'retry_policy': {'max_retry_after': 0},
+            'request_timeout': 5,
+            'headers': {'User-Agent': 'test-agent'},
+            'proxies': {},
+            'rounds': 1,
+            'pages_to_scrape': 3,
+            'max_age': 'r86400'
+        }
+
+    @pytest.fixture
+    def preferences(self):
+        """Fixture providing a single search query."""
+        return {'search_queries': [{'keywords': 'python', 'location': 'Paris', 'f_WT': ''}]}
+
+    def test_engine_scrapes_synthetic_pages(self, engine_config, preferences):
+        """Test that job cards and descriptions are served in the shape cook_soup expects."""
+        with LinkedInStubServer(results_per_query = 60) as server:
+            engine_config['base_url'] = server.base_url
+            with BeautifulSoupEngine(engine_config, preferences) as engine:
+                job_cards = engine.get_jobcards(preferences)
+                descriptions = engine.get_job_descriptions([job_cards[0]['job_url']])
+
+        assert len(job_cards) == 60
+        assert len({job['job_url'] for job in job_cards}) == 60
+        assert all(job['job_url'].startswith(server.base_url + '/jobs/view/') for job in job_cards)
+        assert job_cards[0]['location'] == 'Paris'
+        assert 'Build and maintain data pipelines in Python' in descriptions[0]
+
+    def test_adaptive_pagination_survives_a_transient_failure(self, engine_config, preferences):
+        """Test that a search page failing once mid-query does not cut the query short."""
+        engine_config.update({'adaptive_pagination': True, 'pages_to_scrape': 8})
+        with LinkedInStubServer(results_per_query = 175) as server:
+            engine_config['base_url'] = server.base_url
+            with BeautifulSoupEngine(engine_config, preferences) as engine:
+                fetch = engine.fetch
+                failed = []
+                
+                def flaky_fetch(url, type = None):
+                    if 'start=25' in url and not failed:
+                        failed.append(url)
+                        return None
+                    return fetch(url, type)
+                
+                with patch.object(engine, 'fetch', side_effect = flaky_fetch):
+                    job_cards = engine.get_jobcards(preferences)
+
+        assert failed
+        assert len({job['job_url'] for job in job_cards}) == 175
+
+    def test_throttle_bursts_last_throttle_burst_requests(self):
+        """Test that a started 429 burst covers throttle_burst consecutive requests."""
+        with LinkedInStubServer(throttle_rate = 0.5, throttle_burst = 3, seed = 4) as server:
+            outcomes = [server.draw_outcome()[0] for _ in range(200)]
+
+        runs = ''.join('t' if outcome == 'throttled' else '.' for outcome in outcomes).split('.')
+        assert all(len(run) % 3 == 0 for run in runs)
+        assert server.stats['throttled'] > 0
+
+    def test_synthetic_ids_are_stable_across_requests(self):
+        """Test that the same query page always lists the same postings."""
+        with LinkedInStubServer() as server:
+            url = f"{server.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords=data&location=Lyon&start=25"
+            assert requests.get(url).text == requests.get(url).text
+            assert requests.get(url.replace('start=25', 'start=100')).text == ''
+
+    def test_throttle_bursts_are_retried_by_the_engine(self, engine_config, preferences):
+        """Test that a 429 burst shorter than max_retry is absorbed by retries."""
+        with LinkedInStubServer(retry_after = 0) as server:
+            engine_config['base_url'] = server.base_url
+            server.throttled_left = 2
+            with BeautifulSoupEngine(engine_config, preferences) as engine:
+                html = engine.fetch(f"{server.base_url}/jobs/view/4000000001/")
+            stats = requests.get(f"{server.base_url}/__stats").json()
+
+        assert 'description__text' in html
+        assert engine.retry_policy.counters['throttled'] == 2
+        assert stats == {'throttled': 2, 'ok': 1}
+
+    @patch('src.BeautifulSoupEngine.time.sleep')
+    def test_connection_resets_and_errors_are_injected(self, mock_sleep, engine_config, preferences):
+        """Test that resets and 500s reach the engine as retryable failures."""
+        with LinkedInStubServer(reset_rate = 0.5, error_rate = 0.5, seed = 3) as server:
+            engine_config['base_url'] = server.base_url
+            engine_config['max_retry'] = 10
+            with BeautifulSoupEngine(engine_config, preferences) as engine:
+                for i in range(5):
+                    engine.fetch(f"{server.base_url}/jobs/view/{4000000000 + i}/")
+
+        assert engine.retry_policy.counters['connection'] == server.stats['reset']
+        assert engine.retry_policy.counters['server_error'] == server.stats['error']
+        assert server.stats['reset'] > 0 and server.stats['error'] > 0
+
+    @pytest.mark.parametrize("engine_class", [BeautifulSoupEngine, AsyncBeautifulSoupEngine])
+    def test_transfer_is_compressed_and_accounted(self, engine_class, engine_config, preferences):
+        """Test that both engines negotiate compression and count bytes per page type."""
+        with LinkedInStubServer(padding_kb = 20) as server:
+            engine_config['base_url'] = server.base_url
+            with engine_class(engine_config, preferences) as engine:
+                descriptions = engine.get_job_descriptions([f"{server.base_url}/jobs/view/{4000000000 + i}/" for i in range(3)])
+
+        assert all('Build and maintain data pipelines in Python' in description for description in descriptions)
+        counters = engine.transfer_stats.counters['job_descriptions']
+        assert counters['requests'] == 3
+        assert counters['body_bytes'] > 3 * 20 * 1024
+        assert counters['wire_bytes'] < counters['body_bytes'] / 5
+
+    @pytest.mark.parametrize("engine_class, execution_mode", [(BeautifulSoupEngine, 'threads'), (AsyncBeautifulSoupEngine, 'async')])
+    def test_parse_pool_returns_same_data(self, engine_class, execution_mode, engine_config, preferences):
+        """Test that parsing in worker processes gives the same results as in-process parsing."""
+        with LinkedInStubServer(results_per_query = 30) as server:
+            engine_config.update({'base_url': server.base_url, 'execution_mode': execution_mode, 'max_in_flight': 4})
+            with engine_class(engine_config, preferences) as engine:
+                expected_cards = engine.get_jobcards(preferences)
+                expected = engine.get_job_descriptions([job['job_url'] for job in expected_cards[:6]])
+
+            engine_config['parse_workers'] = 2
+            with engine_class(engine_config, preferences) as engine:
+                assert engine.parse_pool is not None
+                job_cards = engine.get_jobcards(preferences)
+                descriptions = engine.get_job_descriptions([job['job_url'] for job in job_cards[:6]])
+            assert engine.parse_pool is None
+
+        assert job_cards == expected_cards
+        assert descriptions == expected
+
+    def test_recordings_are_replayed_before_synthetic_pages(self, tmp_path):
+        """Test that a recorded page is served as-is."""
+        with LinkedInStubServer(recordings = str(tmp_path)) as server:
+            path = '/jobs/view/123/'
+            server.recording_path(path).write_text('<html>recorded</html>', encoding = 'utf-8')
+
+            assert requests.get(server.base_url + path).text == '<html>recorded</html>'
+            assert 'description__text' in requests.get(server.base_url + '/jobs/view/456/').text
+            assert server.stats['replayed'] == 1
+
+    def test_missing_pages_are_recorded_from_upstream(self, tmp_path):
+        """Test that record mode saves upstream pages for later replays."""
+        with LinkedInStubServer() as upstream:
+            with LinkedInStubServer(recordings = str(tmp_path), upstream = upstream.base_url) as server:
+                first = requests.get(server.base_url + '/jobs/view/789/').text
+            with LinkedInStubServer(recordings = str(tmp_path)) as replay:
+                assert requests.get(replay.base_url + '/jobs/view/789/').text == first
+                assert replay.stats['replayed'] == 1
+
+    def test_async_engine_against_stub(self, engine_config, preferences):
+        """Test that the async engine keeps input order against the stand-in."""
+        with LinkedInStubServer(latency = 0.01, latency_jitter = 0.01, seed = 2) as server:
+            engine_config['base_url'] = server.base_url
+            with AsyncBeautifulSoupEngine(engine_config, preferences) as engine:
+                job_cards = engine.get_jobcards(preferences)
+
+        assert len(job_cards) == 75
+        ids = [BeautifulSoupEngine.get_job_posting_id(job) for job in job_cards]
+        assert ids == sorted(ids)
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_interrupted_run_is_resumed_without_requests(self, streaming, engine_config, tmp_path):
+        """Test that a run dying at insertion is resumed from the checkpoint, without refetching anything."""
+        preferences = {
+            'title_include': ['python'], 'title_exclude': [], 'company_exclude': [], 'max_age': 7,
+            'languages': ['en'], 'description_words_include': ['python'],
+            'search_queries': [{'keywords': 'python', 'location': 'Paris', 'f_WT': ''}]
+        }
+        backend = Mock()
+        backend.search.return_value = {'hits': {'hits': []}}
+        backend.insert_bulk_data.side_effect = [ConnectionError("database down"), None]
+        scraper_config = {'streaming': streaming, 'micro_batch_size': 100}
+
+        with LinkedInStubServer(results_per_query = 30) as server:
+            engine_config.update({'base_url': server.base_url, 'checkpoint': {'enabled': True, 'path': str(tmp_path / 'frontier.sqlite')}})
+            scraper = JobScraper(backend, BeautifulSoupEngine(engine_config, preferences), Mock(), scraper_config)
+            with pytest.raises(ConnectionError):
+                scraper.execute_scraper(preferences)
+            requests_sent = sum(server.stats.values())
+
+            scraper = JobScraper(backend, BeautifulSoupEngine(engine_config, preferences), Mock(), scraper_config)
+            scraper.execute_scraper(preferences, resume = True)
+
+            assert sum(server.stats.values()) == requests_sent
+        assert requests_sent == 3 + 30
+        assert len(backend.insert_bulk_data.call_args.kwargs['data']) == 30
+        assert scraper.frontier.replayed == requests_sent
+        assert not scraper.frontier.is_unfinished()
+
+    def test_incremental_marks_do_not_move_when_every_request_fails(self, engine_config, preferences, tmp_path):
+        """Test that a run that searched nothing leaves the window of the next run as it was."""
+        engine_config['incremental'] = {'enabled': True, 'path': str(tmp_path / 'marks.json')}
+        engine = BeautifulSoupEngine(engine_config, preferences)
+        query = preferences['search_queries'][0]
+        
+        with patch.object(engine, 'fetch', return_value = None):
+            assert engine.get_jobcards(preferences) == []
+        
+        assert engine.high_water_marks.commit() == 0
+        assert engine.high_water_marks.mark(query) is None
+        assert engine.high_water_marks.window(query, 'r86400') == 'r86400'
+
+    def test_incremental_marks_skip_queries_with_a_failed_page(self, engine_config, preferences, tmp_path):
+        """Test that only the queries whose pages were all fetched move their mark."""
+        engine_config.update({'pages_to_scrape': 4, 'incremental': {'enabled': True, 'path': str(tmp_path / 'marks.json')}})
+        preferences['search_queries'].append({'keywords': 'data', 'location': 'Lyon', 'f_WT': ''})
+        python, data = preferences['search_queries']
+        
+        with LinkedInStubServer(results_per_query = 100) as server:
+            engine_config['base_url'] = server.base_url
+            with BeautifulSoupEngine(engine_config, preferences) as engine:
+                fetch = engine.fetch
+                
+                def flaky_fetch(url, type = None):
+                    # Page 2 of the 'python' query fails on every attempt
+                    if 'keywords=python' in url and 'start=25' in url:
+                        return None
+                    return fetch(url, type)
+                
+                with patch.object(engine, 'fetch', side_effect = flaky_fetch):
+                    job_cards = engine.get_jobcards(preferences)
+        
+        assert len(job_cards) == 175
+        assert engine.high_water_marks.commit() == 1
+        assert engine.high_water_marks.mark(python) is None
+        assert engine.high_water_marks.mark(data) is not None
+
+    def test_incremental_run_only_requests_new_postings(self, engine_config, preferences, tmp_path):
+        """Test that the next run stops paging at the postings of the previous one."""
+        engine_config.update({'pages_to_scrape': 10, 'incremental': {'enabled': True, 'path': str(tmp_path / 'marks.json')}})
+
+        with LinkedInStubServer(results_per_query = 100) as server:
+            engine_config['base_url'] = server.base_url
+            engine = BeautifulSoupEngine(engine_config, preferences)
+            with engine:
+                first_run = engine.get_jobcards(preferences)
+            engine.high_water_marks.commit()
+            first_requests = engine.search_requests
+
+            # Ten postings published since
+            server.results_per_query = 110
+            engine = BeautifulSoupEngine(engine_config, preferences)
+            with engine:
+                second_run = engine.get_jobcards(preferences)
+
+        assert len(first_run) == 100 and first_requests == 5
+        assert engine.search_requests == 1
+        known = {job['job_url'] for job in first_run}
+        assert len([job for job in second_run if job['job_url'] not in known]) == 10
@@ -0,0 +1,107 @@
+# tests/test_response_cache.py
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pytest
+import time
+from unittest.mock import patch
+
+from src.utils.ResponseCache import ResponseCache
+
+
+SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords=data&location=France&start=0"
+JOB_URL = "https://www.linkedin.com/jobs/view/123456/"
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Fixture providing an empty cache in a temporary directory."""
+        return ResponseCache(directory = str(tmp_path / "cache"), search_ttl = 60, description_ttl = 3600, max_size_mb = 1)
+
+    def test_normalize_url_sorts_query_and_lowercases_host(self):
+        """Test that equivalent URLs share the same key."""
+        assert ResponseCache.normalize_url("HTTPS://WWW.LinkedIn.com/jobs/view/1/#top") == "https://www.linkedin.com/jobs/view/1"
+        assert ResponseCache.normalize_url("https://x.com/s?b=2&a=1&c=") == ResponseCache.normalize_url("https://x.com/s?c=&a=1&b=2")
+
+    def test_ttl_depends_on_page_kind(self, cache):
+        """Test that job pages and search pages have their own TTL."""
+        assert cache.ttl_for(JOB_URL) == 3600
+        assert cache.ttl_for(SEARCH_URL) == 60
+
+    def test_set_then_get_round_trip(self, cache):
+        """Test that a stored body is returned as-is and stored compressed."""
+        body = "<html>" + "job " * 1000 + "</html>"
+        cache.set(JOB_URL, body)
+
+        assert cache.get(JOB_URL) == body
+        assert cache.get(JOB_URL.rstrip('/')) == body
+        assert cache.path_for(JOB_URL).stat().st_size < len(body)
+        assert (cache.hits, cache.misses) == (2, 0)
+
+    def test_get_missing_entry_returns_none(self, cache):
+        """Test that a miss is counted and returns None."""
+        assert cache.get(JOB_URL) is None
+        assert cache.misses == 1
+
+    def test_expired_entries_are_dropped(self, cache):
+        """Test that entries older than their TTL are removed."""
+        cache.set(SEARCH_URL, "<html>search</html>")
+        cache.set(JOB_URL, "<html>job</html>")
+
+        with patch('src.utils.ResponseCache.time.time', return_value = time.time() + 120):
+            assert cache.get(SEARCH_URL) is None
+            assert cache.get(JOB_URL) == "<html>job</html>"
+
+        assert not cache.path_for(SEARCH_URL).exists()
+
+    def test_lru_eviction_keeps_store_under_max_size(self, cache):
+        """Test that the least recently used entries are evicted first."""
+        for i in range(3):
+            cache.set(f"https://www.linkedin.com/jobs/view/{i}/", os.urandom(500).hex())
+        cache.max_bytes = cache.size
+        # Touch the first entry so that the second one becomes the oldest
+        cache.get("https://www.linkedin.com/jobs/view/0/")
+        cache.set("https://www.linkedin.com/jobs/view/3/", os.urandom(500).hex())
+
+        assert cache.size <= cache.max_bytes
+        assert cache.get("https://www.linkedin.com/jobs/view/0/") is not None
+        assert cache.get("https://www.linkedin.com/jobs/view/1/") is None
+
+    def test_index_is_rebuilt_from_disk(self, cache):
+        """Test that a new cache instance sees entries written by a previous run."""
+        cache.set(JOB_URL, "<html>job</html>")
+
+        reopened = ResponseCache(directory = str(cache.directory), search_ttl = 60, description_ttl = 3600)
+
+        assert reopened.get(JOB_URL) == "<html>job</html>"
+        assert reopened.size == cache.size
+
+    def test_clear_removes_all_entries(self, cache):
+        """Test that clear empties the store."""
+        cache.set(JOB_URL, "<html>job</html>")
+        cache.clear()
+
+        assert cache.get(JOB_URL) is None
+        assert cache.size == 0
+        assert list(cache.directory.iterdir()) == []
+
+    def test_concurrent_access_keeps_index_consistent(self, cache):
+        """Test that parallel reads and writes, evictions included, leave a consistent store."""
+        cache.max_bytes = 20000
+        urls = [f"https://www.linkedin.com/jobs/view/{i}/" for i in range(40)]
+
+        def work(url):
+            body = url * 200
+            cache.set(url, body)
+            cached = cache.get(url)
+            assert cached is None or cached == body
+
+        with ThreadPoolExecutor(max_workers = 8) as executor:
+            list(executor.map(work, urls * 3))
+
+        files = {path.name: path.stat().st_size for path in cache.directory.iterdir()}
+        assert files == dict(cache.index)
+        assert cache.size == sum(files.values()) <= cache.max_bytes
@@ -0,0 +1,85 @@
+# tests/test_retry_policy.py
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+
+from src.utils.RetryPolicy import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test suite for RetryPolicy class."""
+
+    @pytest.fixture
+    def policy(self):
+        """Fixture providing a policy without jitter for predictable delays."""
+        return RetryPolicy(max_retry = 5, base_delay = 1, max_delay = 10, jitter = False)
+
+    def test_from_config_reads_engine_settings(self):
+        """Test that the policy picks up max_retry, retry_delay and the retry_policy section."""
+        policy = RetryPolicy.from_config({
+            'max_retry': 4,
+            'retry_delay': 2,
+            'retry_policy': {'max_delay': 30, 'budget': 50, 'retry_statuses': {'429': 'throttled'}}
+        })
+
+        assert (policy.max_retry, policy.base_delay, policy.max_delay, policy.budget) == (4, 2, 30, 50)
+        assert policy.retry_statuses == {429: 'throttled'}
+
+    def test_classify_status(self, policy):
+        """Test the default retry classes."""
+        assert policy.classify_status(429) == 'throttled'
+        assert policy.classify_status(503) == 'unavailable'
+        assert policy.classify_status(502) == 'server_error'
+        assert policy.classify_status(404) is None
+        assert policy.classify_status(None) is None
+
+    def test_exponential_backoff_is_capped(self, policy):
+        """Test that delays double on every attempt up to max_delay."""
+        assert [policy.compute_delay(attempt) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+
+    def test_full_jitter_stays_within_cap(self, policy):
+        """Test that jittered delays are drawn in [0, cap]."""
+        policy.jitter = True
+        delays = [policy.compute_delay(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 8 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_class_specific_base_delay(self, policy):
+        """Test that a retry class can have its own base delay."""
+        policy.class_delays = {'throttled': 3}
+
+        assert policy.compute_delay(1, 'throttled') == 6
+        assert policy.compute_delay(1, 'timeout') == 2
+
+    def test_retry_after_takes_precedence(self, policy):
+        """Test that the server delay is used, bounded by max_retry_after."""
+        policy.max_retry_after = 60
+
+        assert policy.compute_delay(0, 'throttled', retry_after = 42) == 42
+        assert policy.compute_delay(0, 'throttled', retry_after = 600) == 60
+
+    def test_parse_retry_after_seconds_and_http_date(self):
+        """Test both Retry-After formats."""
+        in_30s = format_datetime(datetime.now(timezone.utc) + timedelta(seconds = 30), usegmt = True)
+
+        assert RetryPolicy.parse_retry_after('120') == 120.0
+        assert 25 <= RetryPolicy.parse_retry_after(in_30s) <= 30
+        assert RetryPolicy.parse_retry_after('not a date') is None
+        assert RetryPolicy.parse_retry_after(None) is None
+
+    def test_consume_counts_causes_and_enforces_budget(self, policy):
+        """Test that retries are counted by cause and refused beyond the budget."""
+        policy.budget = 2
+
+        assert policy.consume('timeout') is True
+        assert policy.consume('throttled') is True
+        assert policy.consume('timeout') is False
+
+        assert policy.counters == {'timeout': 1, 'throttled': 1, 'budget_exhausted': 1}
+        assert policy.summary() == "budget_exhausted: 1, throttled: 1, timeout: 1"
+
+    def test_unlimited_budget(self, policy):
+        """Test that no budget means every retry is allowed."""
+        assert all(policy.consume('connection') for _ in range(1000))
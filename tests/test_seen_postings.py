@@ -0,0 +1,64 @@
+# tests/test_seen_postings.py
+
+import numpy as np
+import pytest
+
+from src.utils.SeenPostings import SeenPostings
+
+
+class TestSeenPostings:
+    """Test suite for the memory-mapped seen postings index."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Fixture providing the path of the index file."""
+        return tmp_path / "seen_postings.u64"
+
+    def test_from_config_disabled_by_default(self, path):
+        """Test that no index is created unless enabled."""
+        assert SeenPostings.from_config(None) is None
+        assert SeenPostings.from_config({'path': str(path)}) is None
+        assert isinstance(SeenPostings.from_config({'enabled': True, 'path': str(path)}), SeenPostings)
+
+    def test_empty_index_is_not_ready(self, path):
+        """Test that a missing file is reported, and contains nothing."""
+        seen = SeenPostings(path)
+
+        assert not seen.ready
+        assert len(seen) == 0
+        assert not seen.contains([4000000001]).any()
+
+    def test_added_ids_are_found_before_and_after_save(self, path):
+        """Test that lookups see the ids added during the run, then the saved ones."""
+        seen = SeenPostings(path)
+        seen.add([4000000003, 4000000001])
+        assert list(seen.contains([4000000001, 4000000002])) == [True, False]
+
+        assert seen.save() == 2
+        assert seen.ready
+        assert isinstance(seen.ids, np.memmap)
+        assert list(seen.contains([4000000001, 4000000002, 4000000003, 5000000000])) == [True, False, True, False]
+
+    def test_save_merges_sorted_unique_ids(self, path):
+        """Test that the file holds the sorted union of every run."""
+        seen = SeenPostings(path)
+        seen.add([30, 10])
+        seen.save()
+
+        reopened = SeenPostings(path)
+        reopened.add([20, 10, 40])
+        reopened.save()
+
+        assert list(np.fromfile(path, dtype = np.uint64)) == [10, 20, 30, 40]
+        assert len(SeenPostings(path)) == 4
+
+    def test_lookup_matches_a_set_on_random_ids(self, path):
+        """Test the binary search against a plain set."""
+        rng = np.random.default_rng(5)
+        stored = set(int(i) for i in rng.integers(4_000_000_000, 4_001_000_000, 5000))
+        seen = SeenPostings(path)
+        seen.add(stored)
+        seen.save()
+
+        queries = [int(i) for i in rng.integers(4_000_000_000, 4_001_000_000, 5000)]
+        assert list(seen.contains(queries)) == [query in stored for query in queries]
@@ -0,0 +1,52 @@
+# tests/test_transfer_stats.py
+
+import gzip
+import pytest
+import zlib
+
+from src.utils.TransferStats import TransferStats, brotli
+
+
+class TestTransferStats:
+    """Test suite for TransferStats class."""
+
+    def test_record_accumulates_by_type(self):
+        """Test that responses are counted per page type, None counting as 'other'."""
+        stats = TransferStats()
+        stats.record('job_descriptions', 100, 400)
+        stats.record('job_descriptions', 50, 200)
+        stats.record(None, 10, 10)
+
+        assert stats.counters['job_descriptions'] == {'requests': 2, 'wire_bytes': 150, 'body_bytes': 600}
+        assert stats.totals() == {'requests': 3, 'wire_bytes': 160, 'body_bytes': 610}
+
+    def test_summary_reports_savings(self):
+        """Test the one-line summary."""
+        stats = TransferStats()
+        stats.record('job_cards', 1024, 4096)
+
+        assert stats.summary() == "job_cards: 1 responses, 1.0 KiB transferred for 4.0 KiB of HTML (75% saved)"
+
+    @pytest.mark.parametrize("encoding, encode", [
+        (None, lambda data: data),
+        ('identity', lambda data: data),
+        ('gzip', gzip.compress),
+        ('deflate', zlib.compress),
+        ('deflate', lambda data: zlib.compress(data, wbits = -zlib.MAX_WBITS)),
+        ('gzip, deflate', lambda data: zlib.compress(gzip.compress(data)))
+    ])
+    def test_decode(self, encoding, encode):
+        """Test that supported content codings are undone, in order."""
+        data = b"<html>" + b"job " * 100 + b"</html>"
+        assert TransferStats.decode(encode(data), encoding) == data
+
+    @pytest.mark.skipif(brotli is None, reason = "brotli is not installed")
+    def test_decode_brotli(self):
+        """Test brotli decoding and that it is advertised."""
+        assert TransferStats.decode(brotli.compress(b"<html></html>"), 'br') == b"<html></html>"
+        assert 'br' in TransferStats.ACCEPT_ENCODING
+
+    def test_decode_unknown_encoding_raises_error(self):
+        """Test that an unsupported coding is reported."""
+        with pytest.raises(ValueError, match = "Unsupported content encoding: compress"):
+            TransferStats.decode(b"data", 'compress')